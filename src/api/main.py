@@ -15,12 +15,15 @@ from typing import Any, Dict, List, Optional
 # Third-party imports
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse
 from pydantic import BaseModel, field_validator
 
 # Project imports
-from src.core.cache import cache_manager
+from src.core.advanced_cache import get_default_cache
+from src.core.cache import cache_manager, weekly_cache_key
+from src.core.cache_warmup import CacheWarmer
 from src.bot.monitoring.production_monitor import production_monitor
 from src.bot.orchestrator import process_brief as process_brief_orchestrator
 from src.bot.veille.veilleur import Veilleur
@@ -78,6 +81,10 @@ app.include_router(slack_router)
 # Variables globales
 veilleur = Veilleur()
 scout_config = ScoutConfig() if ScoutConfig else None
+cache_warmer: Optional[CacheWarmer] = None
+
+# Durée de vie d'un rapport hebdomadaire dans le cache partagé
+WEEKLY_CACHE_TTL = 86400
 
 # Modèles Pydantic
 
@@ -85,6 +92,7 @@ class HealthResponse(BaseModel):
     status: str
     timestamp: str
     version: str
+    cache: Optional[Dict[str, Any]] = None
 
     @field_validator('timestamp', mode='before')
     @classmethod
@@ -93,6 +101,35 @@ class HealthResponse(BaseModel):
             return v
         return v.isoformat() if v else None
 
+@app.get("/health", response_model=HealthResponse)
+async def health_check():
+    """Health check avec statistiques du cache"""
+    return HealthResponse(
+        status="healthy",
+        timestamp=datetime.now(),
+        version=app.version,
+        cache=cache_manager.get_stats_snapshot()
+    )
+
+@app.on_event("startup")
+async def start_cache_warmup():
+    """Préchauffe le cache en arrière-plan (voir /ready)"""
+    global cache_warmer
+    # Connexion PostgreSQL et requête des clés chaudes : hors de la boucle
+    cache_warmer = await run_in_threadpool(
+        lambda: CacheWarmer.from_env(get_default_cache())
+    )
+    cache_warmer.start()
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness : 503 tant que le préchauffage du cache n'a pas atteint son seuil"""
+    warmup = cache_warmer.get_stats() if cache_warmer else {'ready': False}
+    return JSONResponse(
+        status_code=200 if warmup['ready'] else 503,
+        content={"status": "ready" if warmup['ready'] else "warming_up", "warmup": warmup}
+    )
+
 @app.post("/weekly", response_model=WeeklyResponse)
 @endpoint_handler(response_model=WeeklyResponse, demo_mode=True)
 async def generate_weekly(request: WeeklyRequest, demo_mode: bool = False, api_key: str = None):
@@ -120,6 +157,19 @@ async def generate_weekly(request: WeeklyRequest, demo_mode: bool = False, api_k
 
     # Générer les rapports - fallback si WeeklyReportGenerator n'est pas disponible
     current_date = datetime.now()
+    theme = request.theme or "Activités hebdomadaires"
+
+    # Même instance que le préchauffage : un rapport déjà produit (ou préchauffé) est servi tel quel
+    cache = await run_in_threadpool(get_default_cache)
+    cache_key = weekly_cache_key(request.competitors, current_date.strftime('%Y-%m-%d'), theme)
+    cached_report = await run_in_threadpool(cache.get, cache_key)
+    if cached_report is not None:
+        return WeeklyResponse(
+            success=True,
+            content=cached_report,
+            processing_time=0.0,
+            error=None
+        )
 
     try:
         # Vérifier si WeeklyReportGenerator est disponible
@@ -128,7 +178,7 @@ async def generate_weekly(request: WeeklyRequest, demo_mode: bool = False, api_k
             written_report = weekly_generator.generate_written_report(
                 competitors=request.competitors,
                 date=current_date,
-                theme=request.theme or "Activités hebdomadaires"
+                theme=theme
             )
         else:
             raise NameError("WeeklyReportGenerator not available")
@@ -136,13 +186,15 @@ async def generate_weekly(request: WeeklyRequest, demo_mode: bool = False, api_k
         # Fallback simple
         written_report = {
             "title": f"Weekly Report - {current_date.strftime('%Y-%m-%d')}",
-            "theme": request.theme or "Activités hebdomadaires",
+            "theme": theme,
             "competitors": request.competitors,
             "summary": "Rapport hebdomadaire généré automatiquement",
             "introduction": "Introduction aux activités de la semaine",
             "slides": [{"title": "Slide 1", "content": "Contenu généré automatiquement"}]
         }
 
+    await run_in_threadpool(cache.set, cache_key, written_report, WEEKLY_CACHE_TTL)
+
     return WeeklyResponse(
         success=True,
         content=written_report,
@@ -5,7 +5,6 @@ import hashlib
 import hmac
 import logging
 import os
-import tempfile
 import time
 from typing import Any
 from urllib.parse import parse_qs
@@ -13,6 +12,7 @@ from urllib.parse import parse_qs
 # Third-party imports
 import requests
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 
 # Gestionnaire d'événements intégré (anciennement slack_events_handler.py)
 async def handle_event(event: dict[str, Any]) -> None:
@@ -206,40 +206,44 @@ async def slack_file_upload(request: Request):
 async def process_pdf_from_slack(file_url: str, file_name: str) -> dict:
     """
     Télécharge et analyse un PDF depuis Slack.
+    Le fichier est reçu par blocs dans un seul buffer, validé et extrait
+    en mémoire (sans fichier temporaire). Téléchargement, extraction et
+    résumé sont bloquants : ils tournent dans le threadpool.
     """
-    from ..parser.pdf_parser import extract_text_from_pdf, extract_brief_sections
-    from ..ai.brief_summarizer import summarize_brief
-    
-    # Télécharger le fichier
+    return await run_in_threadpool(_download_and_analyze_pdf, file_url, file_name)
+
+def _download_and_analyze_pdf(file_url: str, file_name: str) -> dict:
+    """Partie synchrone de process_pdf_from_slack"""
+    from src.bot.ai.brief_summarizer import summarize_brief
+    from src.bot.parser.pdf_parser import get_global_pdf_processor
+    from src.bot.parser.pdf_source import DOWNLOAD_CHUNK_SIZE, read_pdf_stream
+
+    processor = get_global_pdf_processor()
+
+    # Télécharger le fichier en streaming, interrompu au-delà de la taille acceptée
     headers = {"Authorization": f"Bearer {os.getenv('SLACK_BOT_TOKEN')}"}
-    response = requests.get(file_url, headers=headers)
-    response.raise_for_status()
-    
-    # Sauvegarder temporairement
-    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
-        temp_file.write(response.content)
-        temp_path = temp_file.name
-    
-    try:
-        # Extraire le texte
-        text = extract_text_from_pdf(temp_path)
-        
-        # Extraire les sections
-        sections = extract_brief_sections(text)
-        
-        # Résumer avec IA
-        summary = summarize_brief(text)
-        
-        return {
-            "file_name": file_name,
-            "sections": sections,
-            "summary": summary,
-            "text_length": len(text)
-        }
-        
-    finally:
-        # Nettoyer le fichier temporaire
-        os.unlink(temp_path)
+    with requests.get(file_url, headers=headers, stream=True) as response:
+        response.raise_for_status()
+        pdf_data = read_pdf_stream(response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE),
+                                   max_size=processor.validator.max_file_size)
+
+    # Valider, extraire le texte et les sections depuis le buffer
+    result = processor.process_pdf(pdf_data, source_name=file_name)
+    if not result["processing_success"]:
+        raise ValueError(result.get("error", "PDF processing failed"))
+
+    text = result["text_extraction"]["text"]
+    sections = result.get("sections_extraction", {})
+
+    # Résumer avec IA
+    summary = summarize_brief(text)
+
+    return {
+        "file_name": file_name,
+        "sections": sections,
+        "summary": summary,
+        "text_length": len(text)
+    }
 
 async def send_slack_message(channel_id: str, text: str):
     """
@@ -66,8 +66,19 @@ class ProductionMonitor:
             self.endpoint_metrics[endpoint] = self.endpoint_metrics.get(endpoint, 0) + 1
         return request_id
 
+    def _refresh_cache_counters(self):
+        """Synchroniser les compteurs avec le cache applicatif"""
+        try:
+            from src.core.cache import cache_manager
+        except ImportError:
+            return
+        stats = cache_manager.get_stats_snapshot()
+        self.cache_hits = stats["cache_hits"]
+        self.cache_misses = stats["cache_misses"]
+
     def get_cache_hit_rate(self) -> float:
         """Calculer taux de cache hit"""
+        self._refresh_cache_counters()
         total = self.cache_hits + self.cache_misses
         return (self.cache_hits / total * 100) if total > 0 else 0.0
     
@@ -0,0 +1,333 @@
+"""
+Backends d'extraction PDF
+Registre des bibliothèques disponibles, sonde rapide des documents et
+routage de chaque document vers le backend le plus rapide adapté
+"""
+
+import json
+import logging
+import os
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Sequence
+
+from .pdf_source import BufferStream, PDFSource, is_buffer, source_name
+
+try:
+    import pdfplumber
+    PDFPLUMBER_AVAILABLE = True
+except ImportError:
+    PDFPLUMBER_AVAILABLE = False
+
+try:
+    import pypdf
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+try:
+    import pypdfium2
+    import pypdfium2.raw as pdfium_c
+    PYPDFIUM2_AVAILABLE = True
+except ImportError:
+    PYPDFIUM2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Pages examinées par la sonde (réparties du début à la fin du document)
+PROBE_SAMPLE_PAGES = 3
+
+# Profil de document -> backends par ordre de préférence, issue de
+# tests/performance/pdf_backend_benchmark.py : pypdfium2 extrait le texte
+# ~5x plus vite que pypdf et ~90x plus vite que pdfplumber à qualité égale.
+# 'layout' privilégie pdfplumber (positions des caractères, tableaux) malgré
+# son coût ; sans couche texte, le backend le moins coûteux passe en premier
+# (route() ajoute toujours les autres backends disponibles en repli) ;
+# PDFium ouvre les documents chiffrés sans dépendance supplémentaire
+DEFAULT_ROUTING: Dict[str, List[str]] = {
+    'text': ['pypdfium2', 'pypdf', 'pdfplumber'],
+    'layout': ['pdfplumber', 'pypdfium2', 'pypdf'],
+    'scanned': ['pypdfium2', 'pypdf', 'pdfplumber'],
+    'encrypted': ['pypdfium2', 'pypdf', 'pdfplumber'],
+}
+
+class PDFBackend:
+    """Bibliothèque d'extraction : ouverture du document et texte page par page"""
+
+    name = ''
+
+    @property
+    def available(self) -> bool:
+        return False
+
+    def open_pages(self, pdf_path: PDFSource) -> ContextManager[Sequence[Any]]:
+        """Ouvre le document (chemin ou buffer) et fournit ses pages, analysées seulement à la demande"""
+        raise NotImplementedError
+
+    def page_text(self, page) -> Optional[str]:
+        """Texte brut d'une page"""
+        return page.extract_text()
+
+    def release_page(self, page):
+        """Libère les ressources d'une page après lecture"""
+
+class PdfplumberBackend(PDFBackend):
+    """pdfplumber : le plus lent, texte reconstruit à partir de la position des caractères"""
+
+    name = 'pdfplumber'
+
+    @property
+    def available(self) -> bool:
+        return PDFPLUMBER_AVAILABLE
+
+    @contextmanager
+    def open_pages(self, pdf_path: PDFSource) -> Iterator[Sequence[Any]]:
+        if not is_buffer(pdf_path):
+            with pdfplumber.open(pdf_path) as pdf:
+                yield pdf.pages
+            return
+
+        with BufferStream(pdf_path) as stream, pdfplumber.open(stream) as pdf:
+            yield pdf.pages
+
+    def release_page(self, page):
+        # Vide le cache d'analyse de la page
+        close = getattr(page, 'close', None)
+        if close is not None:
+            close()
+
+class PypdfBackend(PDFBackend):
+    """pypdf : Python pur, texte dans l'ordre du flux de contenu"""
+
+    name = 'pypdf'
+
+    @property
+    def available(self) -> bool:
+        return PYPDF_AVAILABLE
+
+    @contextmanager
+    def open_pages(self, pdf_path: PDFSource) -> Iterator[Sequence[Any]]:
+        with _open_stream(pdf_path) as stream:
+            yield pypdf.PdfReader(stream).pages
+
+class Pypdfium2Backend(PDFBackend):
+    """pypdfium2 : moteur PDFium (C++), de loin le plus rapide"""
+
+    name = 'pypdfium2'
+
+    @property
+    def available(self) -> bool:
+        return PYPDFIUM2_AVAILABLE
+
+    @contextmanager
+    def open_pages(self, pdf_path: PDFSource) -> Iterator[Sequence[Any]]:
+        with _open_pdfium(pdf_path) as pdf:
+            yield _PdfiumPages(pdf)
+
+    def page_text(self, page) -> Optional[str]:
+        textpage = page.get_textpage()
+        try:
+            return textpage.get_text_range().replace('\r\n', '\n')
+        finally:
+            textpage.close()
+
+    def release_page(self, page):
+        page.close()
+
+class _PdfiumPages(Sequence):
+    """Pages d'un document PDFium, chargées à l'accès"""
+
+    def __init__(self, pdf):
+        self.pdf = pdf
+
+    def __len__(self) -> int:
+        return len(self.pdf)
+
+    def __iter__(self):
+        return (self.pdf[i] for i in range(len(self.pdf)))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.pdf[i] for i in range(*index.indices(len(self)))]
+        return self.pdf[index]
+
+def _open_stream(source: PDFSource):
+    """Flux binaire sur un chemin ou un buffer"""
+    return BufferStream(source) if is_buffer(source) else open(source, 'rb')
+
+@contextmanager
+def _open_pdfium(source: PDFSource) -> Iterator[Any]:
+    """
+    Document PDFium sur un chemin ou un buffer
+
+    Des bytes sont lus en place par PDFium ; les autres buffers (bytearray,
+    mmap, memoryview) lui sont servis bloc par bloc depuis la mémoire.
+    """
+    if isinstance(source, bytes):
+        document_input, stream = source, None
+    elif is_buffer(source):
+        document_input = stream = BufferStream(source)
+    else:
+        document_input, stream = os.fspath(source), None
+
+    try:
+        pdf = pypdfium2.PdfDocument(document_input)
+        try:
+            yield pdf
+        finally:
+            pdf.close()
+    finally:
+        if stream is not None:
+            stream.close()
+
+BACKENDS: Dict[str, PDFBackend] = {}
+
+def register_backend(backend: PDFBackend):
+    """Enregistre (ou remplace) un backend, utilisable ensuite dans les tables de routage"""
+    BACKENDS[backend.name] = backend
+
+for _backend in (PdfplumberBackend(), PypdfBackend(), Pypdfium2Backend()):
+    register_backend(_backend)
+
+def available_backends() -> List[str]:
+    """Noms des backends dont la bibliothèque est installée"""
+    return [name for name, backend in BACKENDS.items() if backend.available]
+
+def load_routing(path: Optional[str] = None) -> Dict[str, List[str]]:
+    """Table de routage par défaut, complétée par un fichier JSON (sortie du benchmark)"""
+    routing = {profile: list(order) for profile, order in DEFAULT_ROUTING.items()}
+    if not path:
+        return routing
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            overrides = json.load(f)
+        routing.update({profile: list(order) for profile, order in overrides.items()})
+        logger.info(f"✅ PDF backend routing loaded from {path}")
+    except Exception as e:
+        logger.warning(f"⚠️ Ignoring PDF backend routing file {path}: {e}")
+    return routing
+
+@dataclass
+class PDFProbe:
+    """Caractéristiques d'un document relevées sans extraire son texte"""
+    page_count: Optional[int] = None
+    encrypted: bool = False
+    sampled_pages: int = 0
+    text_pages: int = 0
+    image_only_pages: int = 0
+    probe_backend: Optional[str] = None
+    probe_time: float = 0.0
+
+    @property
+    def has_text_layer(self) -> bool:
+        return self.text_pages > 0
+
+    def profile(self, layout: bool = False) -> str:
+        """Profil de routage du document"""
+        if self.encrypted:
+            return 'encrypted'
+        if self.sampled_pages and not self.text_pages:
+            return 'scanned'
+        return 'layout' if layout else 'text'
+
+def probe_pdf(pdf_path: PDFSource, sample_pages: int = PROBE_SAMPLE_PAGES) -> PDFProbe:
+    """
+    Sonde un document : nombre de pages, chiffrement, couche texte et pages image
+
+    Seules quelques pages sont examinées : la sonde coûte une fraction de
+    l'extraction. PDFium (code natif) est préféré ; pypdf ne lit que les
+    ressources déclarées (polices et images). Sans pypdf ni pypdfium2, la
+    sonde est vide et le document suit le profil 'text'.
+    """
+    start_time = time.perf_counter()
+    probe = PDFProbe()
+
+    try:
+        if PYPDFIUM2_AVAILABLE:
+            _probe_with_pypdfium2(pdf_path, sample_pages, probe)
+        elif PYPDF_AVAILABLE:
+            _probe_with_pypdf(pdf_path, sample_pages, probe)
+    except Exception as e:
+        logger.warning(f"⚠️ PDF probe failed for {source_name(pdf_path)}: {e}")
+
+    probe.probe_time = time.perf_counter() - start_time
+    return probe
+
+def _sample_indexes(page_count: int, sample_pages: int) -> List[int]:
+    """Indices de pages répartis du début à la fin du document"""
+    if page_count <= 0 or sample_pages <= 0:
+        return []
+    if sample_pages == 1 or page_count == 1:
+        return [0]
+    step = (page_count - 1) / (min(sample_pages, page_count) - 1)
+    return sorted({round(i * step) for i in range(min(sample_pages, page_count))})
+
+def _probe_with_pypdf(pdf_path: PDFSource, sample_pages: int, probe: PDFProbe):
+    """Sonde pypdf : ressources déclarées par les pages échantillonnées"""
+    probe.probe_backend = 'pypdf'
+    with _open_stream(pdf_path) as stream:
+        reader = pypdf.PdfReader(stream)
+        if reader.is_encrypted:
+            probe.encrypted = True
+            # Mot de passe utilisateur vide : le document reste lisible
+            if not reader.decrypt(''):
+                return
+
+        probe.page_count = len(reader.pages)
+        for index in _sample_indexes(probe.page_count, sample_pages):
+            resources = reader.pages[index].get('/Resources')
+            resources = resources.get_object() if resources is not None else {}
+            xobjects = resources.get('/XObject')
+            xobjects = xobjects.get_object() if xobjects is not None else {}
+            subtypes = {xobject.get_object().get('/Subtype') for xobject in xobjects.values()}
+
+            probe.sampled_pages += 1
+            # Un formulaire peut contenir du texte : la page compte comme texte
+            if resources.get('/Font') or '/Form' in subtypes:
+                probe.text_pages += 1
+            elif '/Image' in subtypes:
+                probe.image_only_pages += 1
+
+def _probe_with_pypdfium2(pdf_path: PDFSource, sample_pages: int, probe: PDFProbe):
+    """Sonde PDFium : présence de caractères sur les pages échantillonnées"""
+    probe.probe_backend = 'pypdfium2'
+    with ExitStack() as stack:
+        try:
+            pdf = stack.enter_context(_open_pdfium(pdf_path))
+        except pypdfium2.PdfiumError:
+            # Document protégé par un mot de passe utilisateur
+            probe.encrypted = True
+            return
+
+        # -1 : aucun gestionnaire de sécurité (document non chiffré)
+        probe.encrypted = pdfium_c.FPDF_GetSecurityHandlerRevision(pdf.raw) != -1
+        probe.page_count = len(pdf)
+        for index in _sample_indexes(probe.page_count, sample_pages):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            try:
+                has_text = textpage.count_chars() > 0
+            finally:
+                textpage.close()
+                page.close()
+
+            probe.sampled_pages += 1
+            if has_text:
+                probe.text_pages += 1
+            else:
+                probe.image_only_pages += 1
+
+def probe_changes_route(routing: Dict[str, List[str]], layout: bool = False) -> bool:
+    """Vrai si le profil du document peut changer l'ordre des backends"""
+    profiles = ('layout' if layout else 'text', 'scanned', 'encrypted')
+    orders = {tuple(routing.get(profile) or routing.get('text', [])) for profile in profiles}
+    return len(orders) > 1
+
+def route(probe: PDFProbe, routing: Dict[str, List[str]], layout: bool = False) -> List[str]:
+    """Backends disponibles pour le document, du préféré au dernier recours"""
+    preferred = routing.get(probe.profile(layout)) or routing.get('text', [])
+    available = available_backends()
+    order = [name for name in preferred if name in available]
+    return order + [name for name in available if name not in order]
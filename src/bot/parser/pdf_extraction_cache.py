@@ -0,0 +1,123 @@
+"""
+Cache des extractions PDF
+Résultats indexés par l'empreinte SHA-256 du contenu : un même brief
+envoyé sur Slack, par la CLI puis rejoué par le pipeline n'est extrait qu'une fois
+"""
+
+import hashlib
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from src.core.cache_keys import make_key, with_tags
+
+from .pdf_source import PDFSource, is_buffer, source_name, source_view
+
+logger = logging.getLogger(__name__)
+
+# Durée de conservation des extractions (secondes)
+EXTRACTION_CACHE_TTL = 7 * 24 * 3600
+
+# Taille des blocs lus pour calculer l'empreinte
+HASH_CHUNK_SIZE = 1024 * 1024
+
+EXTRACTION_CACHE_TAG = 'pdf_extraction'
+
+def content_digest(pdf_path: PDFSource) -> str:
+    """Empreinte SHA-256 du contenu d'un fichier (lu par blocs) ou d'un buffer (sans copie)"""
+    if is_buffer(pdf_path):
+        with source_view(pdf_path) as view:
+            return hashlib.sha256(view).hexdigest()
+
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def text_key(digest: str, extractor_version: int) -> str:
+    """Clé du texte extrait (pages comprises)"""
+    return make_key('pdf_text', digest, version=extractor_version)
+
+def sections_key(digest: str, extractor_version: int, patterns_version: int) -> str:
+    """Clé des sections : dépend aussi du texte dont elles sont issues"""
+    return make_key('pdf_sections', digest, extractor_version, version=patterns_version)
+
+def incremental_key(digest: str, extractor_version: int, patterns_version: int,
+                    page_budget: Optional[int]) -> str:
+    """Clé d'une extraction incrémentale (texte lu et sections) : dépend du budget de pages"""
+    return make_key('pdf_incremental', digest, extractor_version, page_budget, version=patterns_version)
+
+class PDFExtractionCache:
+    """
+    Cache des résultats d'extraction de texte et de sections
+
+    Le contenu est identifié par son SHA-256, la version de l'extracteur et
+    celle des patterns de sections font partie des clés : incrémenter l'une
+    d'elles rend les anciennes entrées inaccessibles (elles expirent ensuite).
+    Sans cache explicite, le cache par défaut de l'application est utilisé
+    (L1 mémoire + L2 persistant, partagé entre Slack, la CLI et le pipeline).
+    Une panne du cache n'empêche jamais l'extraction.
+    """
+
+    def __init__(self, cache=None, ttl: int = EXTRACTION_CACHE_TTL, enabled: Optional[bool] = None):
+        self._cache = cache
+        self.ttl = ttl
+        if enabled is None:
+            enabled = os.getenv('PDF_EXTRACTION_CACHE', '1').lower() not in ('0', 'false', 'no')
+        self.enabled = enabled
+        self.stats = {'hits': 0, 'misses': 0, 'errors': 0}
+
+    @property
+    def cache(self):
+        if self._cache is None:
+            from src.core.advanced_cache import get_default_cache
+            self._cache = get_default_cache()
+        return self._cache
+
+    def digest(self, pdf_path: PDFSource) -> Optional[str]:
+        """Empreinte du document, None si le cache est désactivé ou le fichier illisible"""
+        if not self.enabled:
+            return None
+        try:
+            return content_digest(pdf_path)
+        except Exception as e:
+            logger.warning(f"⚠️ Cannot hash {source_name(pdf_path)} for extraction cache: {e}")
+            return None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Résultat en cache, None si absent ou en cas d'erreur"""
+        try:
+            value = self.cache.get(key)
+        except Exception as e:
+            logger.error(f"Extraction cache read failed: {e}")
+            self.stats['errors'] += 1
+            return None
+
+        self.stats['hits' if value is not None else 'misses'] += 1
+        return value
+
+    def contains(self, key: str) -> bool:
+        """True si un résultat est en cache (sans compter de hit ni de miss)"""
+        try:
+            return self.cache.get(key) is not None
+        except Exception as e:
+            logger.error(f"Extraction cache read failed: {e}")
+            self.stats['errors'] += 1
+            return False
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """Stocke un résultat (les erreurs sont journalisées)"""
+        try:
+            self.cache.set(key, value, ttl=self.ttl, metadata=with_tags(None, [EXTRACTION_CACHE_TAG]))
+        except Exception as e:
+            logger.error(f"Extraction cache write failed: {e}")
+            self.stats['errors'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'enabled': self.enabled,
+            'hit_rate': self.stats['hits'] / lookups if lookups else 0.0
+        }
@@ -4,62 +4,106 @@ Orchestre tous les modules de parsing PDF
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+import os
+import signal
+import time
+from collections import deque
+from collections.abc import Sized
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional, List
 from pathlib import Path
 from datetime import datetime
 import json
 
 from .pdf_validator import PDFValidator
-from .pdf_text_extractor import PDFTextExtractor
-from .pdf_section_extractor import PDFSectionExtractor
+from .pdf_text_extractor import EXTRACTOR_VERSION, PDFTextExtractor
+from .pdf_section_extractor import PATTERNS_VERSION, PDFSectionExtractor
+from .pdf_extraction_cache import PDFExtractionCache, incremental_key, sections_key, text_key
+from .pdf_source import PDFSource, source_name as default_source_name
 
 logger = logging.getLogger(__name__)
 
+# Délai maximal de traitement d'un fichier dans un lot parallèle (secondes)
+BATCH_FILE_TIMEOUT = 120
+
+# Marge du parent au-delà du délai du worker avant d'arrêter le pool (code natif qui ignore SIGALRM)
+BATCH_WATCHDOG_GRACE = 10.0
+
+# Intervalle maximal entre deux vérifications des échéances par le parent (secondes)
+BATCH_WATCHDOG_POLL = 1.0
+
+# Fichiers traités par worker avant recyclage du pool
+BATCH_TASKS_PER_WORKER = 50
+
+# Pages lues au plus en mode incrémental quand les sections essentielles restent incomplètes
+INCREMENTAL_PAGE_BUDGET = 30
+
+ProgressCallback = Callable[[int, Optional[int], Dict[str, Any]], None]
+
 class PDFProcessor:
     """Processeur principal pour les fichiers PDF"""
 
-    def __init__(self):
+    def __init__(self, extraction_cache: Optional[PDFExtractionCache] = None):
         self.validator = PDFValidator()
         self.text_extractor = PDFTextExtractor()
         self.section_extractor = PDFSectionExtractor()
+        self.extraction_cache = extraction_cache or PDFExtractionCache()
 
     def process_pdf(
         self,
-        pdf_path: str,
+        pdf_path: PDFSource,
         extract_sections: bool = True,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        source_name: Optional[str] = None,
+        incremental: bool = False,
+        page_budget: Optional[int] = INCREMENTAL_PAGE_BUDGET
     ) -> Dict[str, Any]:
         """
         Traitement complet d'un fichier PDF
 
+        Un contenu en mémoire (bytes, bytearray, memoryview, mmap) est validé,
+        haché et extrait à partir du même buffer, sans fichier temporaire.
+
         Args:
-            pdf_path: Chemin vers le fichier PDF
+            pdf_path: Chemin vers le fichier PDF, ou son contenu en mémoire
             extract_sections: Si True, extrait aussi les sections spécialisées
             output_dir: Répertoire de sortie (optionnel)
+            source_name: Nom du document dans le résultat et le fichier de sortie
+                (par défaut le chemin, 'document.pdf' pour un buffer)
+            incremental: Si True (avec extract_sections), lit les pages une à une et
+                s'arrête dès que les sections essentielles sont sûres
+            page_budget: Pages lues au plus en mode incrémental (None : pas de limite)
 
         Returns:
             Dictionnaire avec tous les résultats du traitement
         """
-        logger.info(f"🎯 Processing PDF: {pdf_path}")
+        name = source_name or default_source_name(pdf_path)
+        logger.info(f"🎯 Processing PDF: {name}")
         start_time = datetime.now()
 
         try:
             # Initialisation du résultat
-            result = self._initialize_result(pdf_path, start_time)
+            result = self._initialize_result(name, start_time)
 
             # Étape 1: Validation du fichier
             if not self._validate_pdf_file(pdf_path, result):
                 return result
 
-            # Étape 2: Extraction du texte
-            if not self._extract_text_from_pdf(pdf_path, result):
-                return result
+            if incremental and extract_sections:
+                # Étapes 2-3: Texte et sections page par page, jusqu'aux sections essentielles
+                if not self._extract_incrementally(pdf_path, result, page_budget):
+                    return result
+            else:
+                # Étape 2: Extraction du texte
+                if not self._extract_text_from_pdf(pdf_path, result):
+                    return result
 
-            # Étape 3: Extraction des sections (optionnel)
-            self._extract_sections_from_pdf(result, extract_sections)
+                # Étape 3: Extraction des sections (optionnel)
+                self._extract_sections_from_pdf(result, extract_sections)
 
             # Étape 4: Finalisation du traitement
-            return self._finalize_processing(result, output_dir, pdf_path, start_time)
+            return self._finalize_processing(result, output_dir, name, start_time)
 
         except Exception as e:
             return self._handle_processing_error(e, result, start_time)
@@ -70,10 +114,12 @@ class PDFProcessor:
             'processing_success': False,
             'pdf_path': pdf_path,
             'processing_timestamp': start_time.isoformat(),
-            'processing_time': 0
+            'processing_time': 0,
+            'content_hash': None,
+            'cache_hits': []
         }
 
-    def _validate_pdf_file(self, pdf_path: str, result: Dict[str, Any]) -> bool:
+    def _validate_pdf_file(self, pdf_path: PDFSource, result: Dict[str, Any]) -> bool:
         """Valide le fichier PDF et met à jour le résultat"""
         validation_result = self.validator.validate_file(pdf_path)
         result['validation'] = validation_result
@@ -84,9 +130,17 @@ class PDFProcessor:
 
         return True
 
-    def _extract_text_from_pdf(self, pdf_path: str, result: Dict[str, Any]) -> bool:
-        """Extrait le texte du PDF et met à jour le résultat"""
-        text_result = self.text_extractor.extract_text(pdf_path)
+    def _extract_text_from_pdf(self, pdf_path: PDFSource, result: Dict[str, Any]) -> bool:
+        """Extrait le texte du PDF (ou le reprend du cache) et met à jour le résultat"""
+        digest = result['content_hash'] = self.extraction_cache.digest(pdf_path)
+        text_result = self.extraction_cache.get(text_key(digest, EXTRACTOR_VERSION)) if digest else None
+
+        if text_result is not None:
+            result['cache_hits'].append('text_extraction')
+        else:
+            text_result = self.text_extractor.extract_text(pdf_path)
+            if digest and text_result['extraction_success']:
+                self.extraction_cache.set(text_key(digest, EXTRACTOR_VERSION), text_result)
         result['text_extraction'] = text_result
 
         if not text_result['extraction_success']:
@@ -96,12 +150,76 @@ class PDFProcessor:
         return True
 
     def _extract_sections_from_pdf(self, result: Dict[str, Any], extract_sections: bool):
-        """Extrait les sections du PDF si demandé"""
+        """Extrait les sections du PDF si demandé (ou les reprend du cache)"""
         if extract_sections:
-            text_result = result['text_extraction']
-            sections_result = self.section_extractor.extract_brief_sections(text_result['text'])
+            digest = result['content_hash']
+            key = sections_key(digest, EXTRACTOR_VERSION, PATTERNS_VERSION) if digest else None
+            sections_result = self.extraction_cache.get(key) if key else None
+
+            if sections_result is not None:
+                result['cache_hits'].append('sections_extraction')
+            else:
+                text_result = result['text_extraction']
+                sections_result = self.section_extractor.extract_brief_sections(text_result['text'])
+                if key and 'error' not in sections_result:
+                    self.extraction_cache.set(key, sections_result)
             result['sections_extraction'] = sections_result
 
+    def _extract_incrementally(self, pdf_path: PDFSource, result: Dict[str, Any],
+                               page_budget: Optional[int]) -> bool:
+        """
+        Extraction incrémentale : les pages passent une à une de l'extracteur
+        de texte au détecteur de sections, les pages restantes ne sont pas lues
+
+        Le texte extrait ne couvre que les pages lues ; skipped_pages liste les
+        autres (indices à partir de 0). Le résultat est mis en cache par
+        contenu et budget de pages.
+        """
+        digest = result['content_hash'] = self.extraction_cache.digest(pdf_path)
+        key = incremental_key(digest, EXTRACTOR_VERSION, PATTERNS_VERSION, page_budget) if digest else None
+        cached = self.extraction_cache.get(key) if key else None
+
+        if cached is not None:
+            result['cache_hits'].append('incremental_extraction')
+            result.update(cached)
+            return True
+
+        start_time = datetime.now()
+        pages_text: List[str] = []
+        try:
+            with self.text_extractor.page_stream(pdf_path) as (method, page_count, pages):
+                sections_result = self.section_extractor.extract_sections_incremental(
+                    _collect_pages(pages, pages_text), page_budget
+                )
+        except Exception as e:
+            logger.error(f"❌ Incremental extraction failed: {e}")
+            result['text_extraction'] = {'text': '', 'error': str(e), 'extraction_success': False}
+            result['error'] = 'Text extraction failed'
+            return False
+
+        text = '\n\n'.join(pages_text)
+        extracted = {
+            'text_extraction': {
+                'text': text,
+                'pages': pages_text,
+                'total_pages': len(pages_text),
+                'text_length': len(text),
+                'document_pages': page_count,
+                'skipped_pages': list(range(len(pages_text), page_count)),
+                'extraction_method': method,
+                'extraction_success': True,
+                'extraction_time': (datetime.now() - start_time).total_seconds()
+            },
+            'sections_extraction': sections_result
+        }
+        logger.info(f"📄 Incremental extraction read {len(pages_text)}/{page_count} pages "
+                    f"({sections_result['extraction_metadata']['stop_reason']})")
+
+        if key and 'error' not in sections_result:
+            self.extraction_cache.set(key, extracted)
+        result.update(extracted)
+        return True
+
     def _finalize_processing(self, result: Dict[str, Any], output_dir: str, pdf_path: str, start_time: datetime) -> Dict[str, Any]:
         """Finalise le traitement et retourne le résultat complet"""
         # Métadonnées générales
@@ -129,53 +247,167 @@ class PDFProcessor:
 
     def process_pdf_batch(
         self,
-        pdf_paths: List[str],
+        pdf_paths: Iterable[str],
         extract_sections: bool = True,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        max_workers: int = 1,
+        timeout: Optional[float] = BATCH_FILE_TIMEOUT,
+        progress_callback: Optional[ProgressCallback] = None
     ) -> Dict[str, Any]:
         """
         Traitement par lot de plusieurs PDF
 
         Args:
-            pdf_paths: Liste des chemins PDF
+            pdf_paths: Chemins PDF (liste ou itérable)
             extract_sections: Si True, extrait les sections
             output_dir: Répertoire de sortie
+            max_workers: Processus de traitement (1 : séquentiel, dans ce processus ;
+                le pool de processus est à demander explicitement)
+            timeout: Délai maximal par fichier en mode parallèle (secondes)
+            progress_callback: Appelé après chaque fichier avec (traités, total, résultat)
 
         Returns:
-            Résultats du traitement par lot
+            Résultats du traitement par lot (chemins réussis et échecs, sans le contenu)
         """
-        logger.info(f"📦 Processing PDF batch: {len(pdf_paths)} files")
+        batch_size = len(pdf_paths) if isinstance(pdf_paths, Sized) else None
+        logger.info(f"📦 Processing PDF batch: {batch_size if batch_size is not None else '?'} files")
 
         batch_result = {
-            'batch_size': len(pdf_paths),
+            'batch_size': batch_size,
             'processed_files': [],
             'failed_files': [],
             'start_time': datetime.now().isoformat()
         }
 
-        for pdf_path in pdf_paths:
-            try:
-                result = self.process_pdf(pdf_path, extract_sections, output_dir)
-                if result['processing_success']:
-                    batch_result['processed_files'].append(pdf_path)
-                else:
-                    batch_result['failed_files'].append({
-                        'path': pdf_path,
-                        'error': result.get('error', 'Unknown error')
-                    })
-            except Exception as e:
+        for item in self.iter_pdf_batch(pdf_paths, extract_sections, output_dir, max_workers=max_workers,
+                                        timeout=timeout, progress_callback=progress_callback):
+            if item['success']:
+                batch_result['processed_files'].append(item['path'])
+            else:
                 batch_result['failed_files'].append({
-                    'path': pdf_path,
-                    'error': str(e)
+                    'path': item['path'],
+                    'error': item['error'] or 'Unknown error'
                 })
 
+        processed = len(batch_result['processed_files'])
+        total = processed + len(batch_result['failed_files'])
+        batch_result['batch_size'] = total
         batch_result['end_time'] = datetime.now().isoformat()
-        batch_result['success_rate'] = len(batch_result['processed_files']) / len(pdf_paths) * 100
+        batch_result['success_rate'] = processed / total * 100 if total else 0.0
 
-        logger.info(f"✅ Batch processing completed: {len(batch_result['processed_files'])}/{len(pdf_paths)} successful")
+        logger.info(f"✅ Batch processing completed: {processed}/{total} successful")
 
         return batch_result
 
+    def iter_pdf_batch(
+        self,
+        pdf_paths: Iterable[str],
+        extract_sections: bool = True,
+        output_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        timeout: Optional[float] = BATCH_FILE_TIMEOUT,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Traite des PDF sur un pool de processus et produit les résultats au fil de l'eau
+
+        Au plus max_in_flight fichiers sont en cours (2 par worker par défaut) :
+        la mémoire reste constante quel que soit le nombre de fichiers. Un
+        fichier qui dépasse timeout est interrompu dans son worker ; s'il reste
+        bloqué (code natif insensible à SIGALRM), le parent arrête le pool à
+        l'échéance et le marque en échec. Un fichier qui fait tomber son worker
+        est isolé (les fichiers en cours sont rejoués un par un) puis marqué en
+        échec.
+        Le pool est recyclé tous les BATCH_TASKS_PER_WORKER fichiers par worker.
+
+        Yields:
+            {'path', 'success', 'error', 'result'} dans l'ordre de fin de traitement
+        """
+        total = len(pdf_paths) if isinstance(pdf_paths, Sized) else None
+        max_workers = max_workers or os.cpu_count() or 1
+
+        if max_workers <= 1:
+            items = (self._batch_item(path, self.process_pdf(path, extract_sections, output_dir))
+                     for path in pdf_paths)
+        else:
+            items = self._iter_cached_pool(pdf_paths, extract_sections, output_dir, max_workers,
+                                           max_in_flight or 2 * max_workers, timeout)
+
+        for done, item in enumerate(items, start=1):
+            if progress_callback is not None:
+                try:
+                    progress_callback(done, total, item)
+                except Exception as e:
+                    logger.warning(f"Batch progress callback failed: {e}")
+            yield item
+
+    def _iter_cached_pool(self, pdf_paths: Iterable[str], extract_sections: bool,
+                          output_dir: Optional[str], max_workers: int, max_in_flight: int,
+                          timeout: Optional[float]) -> Iterator[Dict[str, Any]]:
+        """
+        Pool de lot avec le cache d'extraction tenu par ce processus
+
+        Les workers n'ont pas de cache : les fichiers déjà extraits sont
+        servis ici sans passer par le pool, les extractions des workers sont
+        stockées ici à leur retour.
+        """
+        digests: Dict[str, Optional[str]] = {}
+        cached_items: deque = deque()
+
+        def uncached_paths() -> Iterator[str]:
+            for pdf_path in pdf_paths:
+                digest = digests[pdf_path] = self.extraction_cache.digest(pdf_path)
+                if digest and self._is_batch_cached(digest, extract_sections):
+                    cached_items.append(self._batch_item(
+                        pdf_path, self.process_pdf(pdf_path, extract_sections, output_dir)
+                    ))
+                else:
+                    yield pdf_path
+
+        for item in _iter_batch_pool(uncached_paths(), extract_sections, output_dir, max_workers,
+                                     max_in_flight, timeout):
+            while cached_items:
+                yield cached_items.popleft()
+            self._store_batch_result(item, digests.pop(item['path'], None))
+            yield item
+
+        while cached_items:
+            yield cached_items.popleft()
+
+    def _is_batch_cached(self, digest: str, extract_sections: bool) -> bool:
+        """True si le texte (et les sections si demandées) d'un document sont en cache"""
+        keys = [text_key(digest, EXTRACTOR_VERSION)]
+        if extract_sections:
+            keys.append(sections_key(digest, EXTRACTOR_VERSION, PATTERNS_VERSION))
+        return all(self.extraction_cache.contains(key) for key in keys)
+
+    def _store_batch_result(self, item: Dict[str, Any], digest: Optional[str]):
+        """Stocke dans le cache d'extraction le résultat rendu par un worker"""
+        result = item['result']
+        if not digest or not item['success'] or not result:
+            return
+
+        result['content_hash'] = digest
+        text_result = result.get('text_extraction')
+        if text_result and text_result.get('extraction_success'):
+            self.extraction_cache.set(text_key(digest, EXTRACTOR_VERSION), text_result)
+        sections_result = result.get('sections_extraction')
+        if sections_result and 'error' not in sections_result:
+            self.extraction_cache.set(sections_key(digest, EXTRACTOR_VERSION, PATTERNS_VERSION),
+                                      sections_result)
+
+    @staticmethod
+    def _batch_item(pdf_path: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Résultat d'un fichier dans un lot"""
+        success = bool(result.get('processing_success'))
+        return {
+            'path': pdf_path,
+            'success': success,
+            'error': None if success else result.get('error', 'Unknown error'),
+            'result': result
+        }
+
     def _generate_processing_metadata(
         self,
         validation: Dict,
@@ -221,9 +453,163 @@ class PDFProcessor:
         """Retourne les statistiques de traitement"""
         return {
             'text_extraction_stats': self.text_extractor.get_extraction_stats(),
+            'extraction_cache_stats': self.extraction_cache.get_stats(),
             'processing_timestamp': datetime.now().isoformat()
         }
 
+def _collect_pages(pages: Iterable[str], collected: List[str]) -> Iterator[str]:
+    """Transmet les pages au fil de la lecture en conservant leur texte"""
+    for page_text in pages:
+        collected.append(page_text)
+        yield page_text
+
+class BatchFileTimeout(BaseException):
+    """
+    Délai dépassé pour un fichier d'un lot
+
+    Hérite de BaseException pour traverser les except Exception des
+    étapes de traitement et interrompre tout le fichier.
+    """
+
+_batch_processor: Optional[PDFProcessor] = None
+
+def _init_batch_worker():
+    """Initialise le processeur d'un worker de lot"""
+    global _batch_processor
+    # Sans cache (ni L1, ni connexion L2) : le processus parent lit et écrit les extractions
+    _batch_processor = PDFProcessor(extraction_cache=PDFExtractionCache(enabled=False))
+    # Pas de pool de pages imbriqué : le lot occupe déjà tous les cœurs
+    _batch_processor.text_extractor.parallel_page_threshold = None
+
+def _raise_batch_timeout(signum, frame):
+    raise BatchFileTimeout()
+
+def _process_pdf_in_worker(pdf_path: str, extract_sections: bool, output_dir: Optional[str],
+                           timeout: Optional[float]) -> Dict[str, Any]:
+    """Worker : traite un fichier, interrompu par SIGALRM au-delà du délai"""
+    use_alarm = bool(timeout) and hasattr(signal, 'SIGALRM')
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_batch_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    try:
+        return _batch_processor.process_pdf(pdf_path, extract_sections, output_dir)
+    except BatchFileTimeout:
+        logger.error(f"❌ PDF processing timed out after {timeout}s: {pdf_path}")
+        return {'processing_success': False, 'pdf_path': pdf_path,
+                'error': f'Processing timed out after {timeout}s'}
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+def _terminate_pool(executor: ProcessPoolExecutor):
+    """Arrête les workers sans attendre leurs tâches (un appel natif bloqué ne rend pas la main)"""
+    for process in list((executor._processes or {}).values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def _iter_batch_pool(pdf_paths: Iterable[str], extract_sections: bool, output_dir: Optional[str],
+                     max_workers: int, max_in_flight: int,
+                     timeout: Optional[float]) -> Iterator[Dict[str, Any]]:
+    """Soumet les fichiers au pool par fenêtre bornée et produit les résultats terminés"""
+    pending = iter(pdf_paths)
+    exhausted = False
+    # Fichiers en cours lors de la chute d'un worker, rejoués seuls pour isoler le coupable
+    suspects: deque = deque()
+    isolated: Optional[Future] = None
+    in_flight: Dict[Future, str] = {}
+    # Échéances côté parent : une tâche passe « running » dès la file d'appels du pool et peut
+    # y attendre la fin d'une autre tâche, d'où deux délais avant de la déclarer bloquée
+    deadlines: Dict[Future, float] = {}
+    recycle_after = max_workers * BATCH_TASKS_PER_WORKER
+    executor = None
+    submitted = 0
+
+    try:
+        while True:
+            if executor is None:
+                executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker)
+                submitted = 0
+
+            # Remplir la fenêtre (un suspect à la fois, seul dans le pool)
+            while len(in_flight) < max_in_flight and submitted < recycle_after:
+                replay = bool(suspects)
+                if replay:
+                    if in_flight:
+                        break
+                    pdf_path = suspects.popleft()
+                else:
+                    pdf_path = None if exhausted else next(pending, None)
+                    if pdf_path is None:
+                        exhausted = True
+                        break
+                future = executor.submit(_process_pdf_in_worker, pdf_path, extract_sections,
+                                         output_dir, timeout)
+                in_flight[future] = pdf_path
+                submitted += 1
+                if replay:
+                    isolated = future
+                    break
+
+            if not in_flight:
+                executor.shutdown(wait=True)
+                executor = None
+                if exhausted and not suspects:
+                    return
+                # Recyclage des workers (mémoire retenue par les bibliothèques PDF)
+                continue
+
+            wait_timeout = None
+            if timeout:
+                now = time.monotonic()
+                for future in in_flight:
+                    if future not in deadlines and future.running():
+                        deadlines[future] = now + 2 * timeout + BATCH_WATCHDOG_GRACE
+                wait_timeout = max(0.0, min([deadline - now for deadline in deadlines.values()]
+                                            + [BATCH_WATCHDOG_POLL]))
+
+            finished, _ = wait(in_flight, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+            broken = any(isinstance(future.exception(), BrokenProcessPool) for future in finished)
+            now = time.monotonic()
+            overdue = {future for future, deadline in deadlines.items()
+                       if deadline <= now and not future.done()}
+            if broken or overdue:
+                # Le pool est perdu ou bloqué : les tâches terminées sont gardées, les autres rejouées
+                finished = list(in_flight)
+
+            for future in finished:
+                pdf_path = in_flight.pop(future)
+                deadlines.pop(future, None)
+                suspect = future is isolated
+                if suspect:
+                    isolated = None
+                if future in overdue:
+                    logger.error(f"❌ PDF batch worker stuck past {timeout}s, pool stopped: {pdf_path}")
+                    yield {'path': pdf_path, 'success': False,
+                           'error': f'Processing timed out after {timeout}s (worker stopped)', 'result': None}
+                    continue
+                error = future.exception() if future.done() else BrokenProcessPool()
+                if error is None:
+                    yield PDFProcessor._batch_item(pdf_path, future.result())
+                elif isinstance(error, BrokenProcessPool) and not suspect:
+                    suspects.append(pdf_path)
+                else:
+                    logger.error(f"❌ PDF batch worker failed on {pdf_path}: {error!r}")
+                    yield {'path': pdf_path, 'success': False,
+                           'error': f'Worker failed: {error!r}', 'result': None}
+
+            if overdue:
+                _terminate_pool(executor)
+                executor = None
+            elif broken:
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = None
+
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
 # Fonctions de compatibilité pour l'ancien code
 def extract_text_from_pdf(pdf_path: str) -> str:
     """Fonction de compatibilité"""
@@ -5,11 +5,45 @@ Module spécialisé pour l'analyse de briefs
 
 import re
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Version des patterns de sections, à incrémenter quand ils changent (invalide le cache d'extraction)
+PATTERNS_VERSION = 4
+
+# Au-delà, une ligne est du contenu même si elle contient un mot-clé de section
+MAX_HEADER_LENGTH = 100
+
+# Ligne non vide sans ses espaces de début et de fin (groupe 1)
+LINE_PATTERN = re.compile(r'^[^\S\n]*(\S(?:[^\n]*\S)?)', re.MULTILINE)
+
+# Espaces ramenés à un seul par le nettoyage
+SPACE_RUNS = re.compile(r'[ \t]{2,}')
+
+# Phrase : segment entre deux points contenant autre chose que des espaces
+SENTENCE_PATTERN = re.compile(r'[^.\s][^.]*')
+
+# Mots-clés attendus par section (score de contenu)
+SECTION_KEYWORDS = {
+    'objectives': ['goal', 'objective', 'aim', 'target'],
+    'budget': ['€', '$', 'euros', 'dollars', 'budget'],
+    'timeline': ['week', 'month', 'deadline', 'date'],
+    'target_audience': ['audience', 'demographic', 'target', 'public']
+}
+
+# Sections indispensables au traitement d'un brief (score de complétude)
+ESSENTIAL_SECTIONS = ['objectives', 'target_audience', 'budget', 'timeline']
+
+# Confiance (moyenne des scores de qualité) à partir de laquelle une section encore ouverte est jugée sûre
+SECTION_CONFIDENCE_THRESHOLD = 50
+
+SECTION_KEYWORD_PATTERNS = {
+    section_name: re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+    for section_name, keywords in SECTION_KEYWORDS.items()
+}
+
 class PDFSectionExtractor:
     """Extracteur de sections spécialisé pour les briefs"""
 
@@ -35,6 +69,15 @@ class PDFSectionExtractor:
             (re.compile(r'^\s+|\s+$', re.MULTILINE), ''),  # Supprimer espaces en début/fin de ligne
         ]
 
+        self.header_pattern = self._compile_header_pattern()
+
+    def _compile_header_pattern(self) -> re.Pattern:
+        """Alternance des patterns de section, un groupe nommé par section"""
+        return re.compile(
+            '|'.join(f'(?P<{name}>{pattern.pattern})' for name, pattern in self.section_patterns.items()),
+            re.IGNORECASE
+        )
+
     def extract_brief_sections(self, text: str) -> Dict[str, Any]:
         """
         Extraction spécialisée des sections d'un brief
@@ -57,17 +100,18 @@ class PDFSectionExtractor:
         }
 
         try:
-            # Nettoyer le texte
-            cleaned_text = self._clean_text(text)
+            # Repérer les sections (positions dans le texte d'origine)
+            spans = self.find_section_spans(text)
 
-            # Extraire les sections
-            sections = self._identify_sections(cleaned_text)
+            # Nettoyer uniquement le texte des sections
+            sections = {name: self._clean_text(text[start:end]) for name, (start, end) in spans.items()}
 
             result['sections'] = sections
+            result['section_spans'] = spans
             result['extraction_metadata']['sections_found'] = len(sections)
 
-            # Analyser les sections
-            analysis = self._analyze_sections(sections)
+            # Analyser les sections (texte complet : toutes sont terminées)
+            analysis = self._analyze_sections(sections, closed_sections=spans)
             result['analysis'] = analysis
 
             logger.info(f"✅ Extracted {len(sections)} sections from brief")
@@ -87,49 +131,167 @@ class PDFSectionExtractor:
 
         return cleaned.strip()
 
-    def _identify_sections(self, text: str) -> Dict[str, str]:
-        """Identifie et extrait les sections du brief"""
-        sections = {}
-        lines = text.split('\n')
+    def extract_sections_incremental(self, pages: Iterable[str], page_budget: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Extraction des sections page par page, arrêtée dès que possible
 
-        current_section = None
-        current_content = []
+        Les pages sont consommées une à une (itérateur paresseux, par exemple
+        PDFTextExtractor.page_stream) et ajoutées au texte analysé comme par
+        l'extraction complète. Seule la section encore ouverte est relue à
+        chaque page. La lecture s'arrête dès que toutes les sections
+        essentielles sont sûres (voir _analyze_sections) ou après page_budget
+        pages : les pages suivantes ne sont jamais demandées à l'itérateur.
 
-        for line in lines:
-            line = line.strip()
+        Après un arrêt anticipé, le résultat est partiel : les sections placées
+        après le point d'arrêt, essentielles ou non (annexes, contacts...), ne
+        sont pas extraites, et la dernière section lue peut se poursuivre sur
+        les pages non lues (truncated_section).
 
-            # Vérifier si c'est une nouvelle section
-            for section_name, pattern in self.section_patterns.items():
-                if pattern.search(line) and len(line) < 100:  # Ligne pas trop longue
-                    # Sauvegarder la section précédente
-                    if current_section and current_content:
-                        sections[current_section] = '\n'.join(current_content).strip()
+        Args:
+            pages: Texte des pages, dans l'ordre
+            page_budget: Nombre maximal de pages lues (None : pas de limite)
 
-                    # Nouvelle section
-                    current_section = section_name
-                    current_content = [line]
+        Returns:
+            Même résultat que extract_brief_sections, avec dans extraction_metadata :
+            pages_read, stop_reason ('sections_complete', 'page_budget' ou
+            'end_of_document'), partial (arrêt avant la fin du document) et
+            truncated_section (section ouverte au moment de l'arrêt, sinon None)
+        """
+        logger.info("🔍 Extracting brief sections incrementally")
+
+        text = ''
+        spans: Dict[str, Tuple[int, int]] = {}
+        sections: Dict[str, str] = {}
+        analysis = None
+        pages_read = 0
+        stop_reason = 'end_of_document'
+        open_section = None
+        result = {'sections': sections, 'section_spans': spans, 'extraction_metadata': {}}
+
+        try:
+            for pages_read, page_text in enumerate(pages, start=1):
+                page_start = len(text) + 2 if pages_read > 1 else 0
+                text = f"{text}\n\n{page_text}" if pages_read > 1 else page_text
+
+                # Les sections terminées ne bougent plus : relecture depuis l'en-tête de la section ouverte
+                open_section = max(spans, key=lambda name: spans[name][0], default=None)
+                rescan_start = spans[open_section][0] if open_section else page_start
+                previous_spans = dict(spans)
+                spans.update(self.find_section_spans(text, rescan_start))
+
+                for name, (start, end) in spans.items():
+                    if previous_spans.get(name) != (start, end):
+                        sections[name] = self._clean_text(text[start:end])
+
+                open_section = max(spans, key=lambda name: spans[name][0], default=None)
+                analysis = self._analyze_sections(sections, closed_sections=set(spans) - {open_section})
+
+                if len(analysis['confident_sections']) == len(ESSENTIAL_SECTIONS):
+                    stop_reason = 'sections_complete'
+                    break
+                if page_budget is not None and pages_read >= page_budget:
+                    stop_reason = 'page_budget'
                     break
-            else:
-                # Ligne de contenu pour la section actuelle
-                if current_section:
-                    current_content.append(line)
 
-        # Sauvegarder la dernière section
-        if current_section and current_content:
-            sections[current_section] = '\n'.join(current_content).strip()
+            result['analysis'] = analysis or self._analyze_sections(sections)
+            logger.info(f"✅ Extracted {len(sections)} sections from {pages_read} pages ({stop_reason})")
 
-        return sections
+        except Exception as e:
+            logger.error(f"Incremental section extraction failed: {e}")
+            result['error'] = str(e)
+
+        result['extraction_metadata'] = {
+            'total_text_length': len(text),
+            'extraction_timestamp': datetime.now().isoformat(),
+            'sections_found': len(sections),
+            'pages_read': pages_read,
+            'stop_reason': stop_reason,
+            'partial': stop_reason != 'end_of_document',
+            # Aucun en-tête suivant lu : la section peut continuer après le point d'arrêt
+            'truncated_section': open_section if stop_reason != 'end_of_document' else None
+        }
+        return result
+
+    def find_section_spans(self, text: str, start: int = 0) -> Dict[str, Tuple[int, int]]:
+        """
+        Repère les sections du brief en une seule passe
+
+        Une unique recherche dans l'alternance des patterns écarte les lignes
+        sans mot-clé ; une ligne d'en-tête est attribuée au premier pattern
+        déclaré qu'elle contient, où que soit le mot-clé (comme en testant les
+        patterns un à un). Une section va de sa ligne d'en-tête à la fin
+        de la dernière ligne non vide précédant l'en-tête suivant ; une section
+        répétée garde sa dernière occurrence.
+
+        Args:
+            text: Texte à analyser
+            start: Position de début de la lecture (début d'une ligne)
+
+        Returns:
+            {section: (début, fin)}, positions dans text
+        """
+        spans = {}
+        current_section = None
+        section_start = section_end = 0
 
-    def _analyze_sections(self, sections: Dict[str, str]) -> Dict[str, Any]:
-        """Analyse les sections extraites"""
+        for line in LINE_PATTERN.finditer(text, start):
+            line_start, line_end = line.span(1)
+            section = None
+            if self._is_header_line(text, line_start, line_end):
+                section = self._classify_header(text, line_start, line_end)
+
+            if section:
+                if current_section:
+                    spans[current_section] = (section_start, section_end)
+                current_section, section_start = section, line_start
+
+            section_end = line_end
+
+        if current_section:
+            spans[current_section] = (section_start, section_end)
+
+        return spans
+
+    def _classify_header(self, text: str, start: int, end: int) -> Optional[str]:
+        """Section d'une ligne : premier pattern déclaré présent dans la ligne, None sinon"""
+        match = self.header_pattern.search(text, start, end)
+        if not match:
+            return None
+
+        # Le groupe trouvé est celui du mot-clé le plus à gauche : un pattern
+        # déclaré avant lui et présent plus loin dans la ligne reste prioritaire
+        for name, pattern in self.section_patterns.items():
+            if name == match.lastgroup:
+                return name
+            if pattern.search(text, start, end):
+                return name
+        return match.lastgroup
+
+    def _is_header_line(self, text: str, start: int, end: int) -> bool:
+        """Ligne assez courte pour être un en-tête, une fois ses espaces multiples réduits"""
+        length = end - start
+        if length < MAX_HEADER_LENGTH:
+            return True
+        collapsed = sum(run.end() - run.start() - 1 for run in SPACE_RUNS.finditer(text, start, end))
+        return length - collapsed < MAX_HEADER_LENGTH
+
+    def _analyze_sections(self, sections: Dict[str, str], closed_sections: Iterable[str] = ()) -> Dict[str, Any]:
+        """
+        Analyse les sections extraites
+
+        Une section essentielle est sûre quand elle est terminée (closed_sections :
+        un autre en-tête la suit, son contenu ne changera plus) ou quand sa
+        confiance atteint SECTION_CONFIDENCE_THRESHOLD.
+        """
         analysis = {
             'completeness_score': 0,
             'missing_sections': [],
+            'confident_sections': [],
             'quality_indicators': {}
         }
 
         # Liste des sections essentielles
-        essential_sections = ['objectives', 'target_audience', 'budget', 'timeline']
+        essential_sections = ESSENTIAL_SECTIONS
 
         # Calculer le score de complétude
         found_essential = sum(1 for section in essential_sections if section in sections)
@@ -146,6 +308,15 @@ class PDFSectionExtractor:
             quality = self._assess_section_quality(section_name, content)
             analysis['quality_indicators'][section_name] = quality
 
+        closed_sections = set(closed_sections)
+        analysis['confident_sections'] = [
+            section for section in essential_sections
+            if section in sections and (
+                section in closed_sections
+                or analysis['quality_indicators'][section]['confidence'] >= SECTION_CONFIDENCE_THRESHOLD
+            )
+        ]
+
         return analysis
 
     def _assess_section_quality(self, section_name: str, content: str) -> Dict[str, Any]:
@@ -165,23 +336,18 @@ class PDFSectionExtractor:
         else:
             quality['length_score'] = min(100, content_length)
 
-        # Score de contenu (présence de mots-clés)
-        content_lower = content.lower()
-        keywords = {
-            'objectives': ['goal', 'objective', 'aim', 'target'],
-            'budget': ['€', '$', 'euros', 'dollars', 'budget'],
-            'timeline': ['week', 'month', 'deadline', 'date'],
-            'target_audience': ['audience', 'demographic', 'target', 'public']
-        }
-
-        if section_name in keywords:
-            found_keywords = sum(1 for keyword in keywords[section_name] if keyword in content_lower)
-            quality['content_score'] = min(100, found_keywords * 25)
+        # Score de contenu (mots-clés distincts présents, en un parcours)
+        keyword_pattern = SECTION_KEYWORD_PATTERNS.get(section_name)
+        if keyword_pattern:
+            found_keywords = {match.group(0).lower() for match in keyword_pattern.finditer(content)}
+            quality['content_score'] = min(100, len(found_keywords) * 25)
 
         # Score de clarté (structure)
-        sentences = len([s for s in content.split('.') if s.strip()])
+        sentences = sum(1 for _ in SENTENCE_PATTERN.finditer(content))
         quality['clarity_score'] = min(100, sentences * 10)
 
+        quality['confidence'] = (quality['length_score'] + quality['content_score'] + quality['clarity_score']) / 3
+
         return quality
 
     def extract_custom_sections(self, text: str, custom_patterns: Dict[str, str]) -> Dict[str, str]:
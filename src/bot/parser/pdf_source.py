@@ -0,0 +1,114 @@
+"""
+Sources PDF
+Un document se désigne par un chemin ou par son contenu en mémoire (bytes,
+bytearray, memoryview, mmap) : le même buffer sert à la validation, à
+l'empreinte, à la sonde et à l'extraction, sans fichier temporaire
+"""
+
+import io
+import mmap
+import os
+from typing import Iterable, Optional, Union
+
+PDFSource = Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap]
+
+# Taille des blocs lus lors d'un téléchargement en streaming
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Taille maximale d'un PDF accepté (PDFValidator.max_file_size)
+MAX_PDF_SIZE = 50 * 1024 * 1024
+
+# Au-delà, le téléchargement est interrompu : un fichier que la validation
+# rejetterait n'est pas reçu en entier
+MAX_STREAM_SIZE = MAX_PDF_SIZE
+
+BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+def is_buffer(source) -> bool:
+    """True si la source est un contenu en mémoire plutôt qu'un chemin"""
+    return isinstance(source, BUFFER_TYPES)
+
+def source_view(source) -> memoryview:
+    """
+    Vue octet par octet sur un buffer, sans copie
+
+    À libérer après usage (bloc with) : un mmap ou un bytearray exporté
+    ne peut être ni fermé ni redimensionné.
+    """
+    return memoryview(source).cast('B')
+
+def source_name(source, default: str = 'document.pdf') -> str:
+    """Nom de la source pour les logs et les résultats (default pour un buffer)"""
+    return default if is_buffer(source) else os.fspath(source)
+
+class BufferStream(io.RawIOBase):
+    """
+    Fichier en lecture seule sur un buffer, pour les bibliothèques qui lisent un flux
+
+    Chaque lecture ne copie que les octets demandés ; le document n'est
+    jamais dupliqué en entier.
+    """
+
+    def __init__(self, source):
+        super().__init__()
+        self._view = source_view(source)
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position: {position}")
+        self._position = position
+        return position
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else self._position + size
+        data = self._view[self._position:end].tobytes()
+        self._position += len(data)
+        return data
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def readinto(self, buffer) -> int:
+        # Format octet imposé : PDFium fournit des tableaux ctypes (format '<B')
+        with memoryview(buffer).cast('B') as target:
+            chunk = self._view[self._position:self._position + len(target)]
+            target[:len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+def read_pdf_stream(chunks: Iterable[bytes], max_size: int = MAX_STREAM_SIZE) -> bytearray:
+    """
+    Assemble un PDF reçu par blocs dans un seul buffer
+
+    Raises:
+        ValueError: Le contenu dépasse max_size (lecture interrompue)
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        if len(buffer) + len(chunk) > max_size:
+            raise ValueError(f"PDF exceeds maximum size of {max_size} bytes")
+        buffer += chunk
+    return buffer
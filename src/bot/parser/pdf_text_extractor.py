@@ -4,42 +4,53 @@ Module spécialisé pour l'extraction de texte
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 from pathlib import Path
 
-try:
-    import pdfplumber
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
-
-try:
-    import pypdf
-    PDF_LIBRARY_AVAILABLE = True
-except ImportError:
-    PDF_LIBRARY_AVAILABLE = False
-
+from .pdf_backends import (
+    BACKENDS, PDFBackend, PDFProbe, load_routing, probe_changes_route, probe_pdf, route
+)
+from .pdf_source import PDFSource, is_buffer
 from .pdf_validator import PDFValidator
 
 logger = logging.getLogger(__name__)
 
+# Version de l'extraction, à incrémenter quand le texte produit change (invalide le cache d'extraction)
+EXTRACTOR_VERSION = 2
+
+# En dessous, le démarrage des processus coûte plus que l'analyse des pages
+PARALLEL_PAGE_THRESHOLD = 24
+
+# Plages par worker : équilibre la charge quand certaines pages sont plus lourdes
+PAGE_RANGES_PER_WORKER = 2
+
 class PDFTextExtractor:
     """Extracteur de texte spécialisé pour les PDF"""
 
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None,
+                 parallel_page_threshold: Optional[int] = PARALLEL_PAGE_THRESHOLD,
+                 layout: bool = False, routing: Optional[Dict[str, List[str]]] = None):
         self.validator = PDFValidator()
-        self.extraction_stats = {
-            'total_pages': 0,
-            'text_length': 0,
-            'extraction_time': 0.0
-        }
-
-    def extract_text(self, pdf_path: str) -> Dict[str, Any]:
+        self.extraction_stats = _initial_extraction_stats()
+        # Extraction pdfplumber multi-processus à partir de ce nombre de pages (None : jamais)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel_page_threshold = parallel_page_threshold
+        # Profil 'layout' : backends qui restituent le mieux la mise en page, plutôt que les plus rapides
+        self.layout = layout
+        # Profil de document -> backends (fichier JSON du benchmark via PDF_BACKEND_ROUTING)
+        self.routing = routing or load_routing(os.getenv('PDF_BACKEND_ROUTING'))
+
+    def extract_text(self, pdf_path: PDFSource) -> Dict[str, Any]:
         """
         Extraction complète du texte d'un PDF - refactorisé pour réduire la complexité
 
         Args:
-            pdf_path: Chemin vers le fichier PDF
+            pdf_path: Chemin vers le fichier PDF, ou son contenu en mémoire
+                (bytes, bytearray, memoryview, mmap) lu sans copie ni fichier temporaire
 
         Returns:
             Dictionnaire avec le texte extrait et les métadonnées
@@ -55,16 +66,16 @@ class PDFTextExtractor:
             if not _validate_pdf_file(self, pdf_path, result):
                 return result
 
-            # Étape 3: Détermination de la méthode d'extraction
-            extraction_method = _determine_extraction_method()
-            if not extraction_method:
+            # Étape 3: Sonde du document et choix des backends
+            probe, backends = self._select_backends(pdf_path)
+            result['probe'] = asdict(probe) if probe is not None else None
+            if not backends:
                 result['error'] = 'No PDF library available'
                 return result
 
             # Étape 4: Exécution de l'extraction
-            extraction_result = _perform_text_extraction(self, pdf_path, extraction_method)
+            extraction_result = self._extract_with_backends(pdf_path, probe, backends)
             result.update(extraction_result)
-            result['extraction_method'] = extraction_method
 
             # Étape 5: Finalisation
             return _finalize_extraction_result(result, start_time, self)
@@ -72,6 +83,267 @@ class PDFTextExtractor:
         except Exception as e:
             return _handle_extraction_error(e, result, start_time)
 
+    def _select_backends(self, pdf_path: PDFSource) -> Tuple[Optional[PDFProbe], List[str]]:
+        """
+        Sonde le document et retourne les backends disponibles, du plus adapté au dernier recours
+
+        Si tous les profils possibles ont la même route, la sonde est différée
+        (probe None) : elle ne sert qu'à interpréter une extraction vide.
+        """
+        if not probe_changes_route(self.routing, self.layout):
+            return None, route(PDFProbe(), self.routing, self.layout)
+        probe = probe_pdf(pdf_path)
+        return probe, route(probe, self.routing, self.layout)
+
+    def _extract_with_backends(self, pdf_path: PDFSource, probe: Optional[PDFProbe],
+                               backends: List[str]) -> Dict[str, Any]:
+        """
+        Extraction avec le premier backend de la route
+
+        Le backend suivant prend le relais si l'extraction échoue, ou si elle
+        ne rend aucun texte alors que la sonde a trouvé une couche texte.
+        """
+        import time
+        failures = {}
+        probed_late = False
+
+        for position, name in enumerate(backends, start=1):
+            is_last = position == len(backends)
+            backend_start = time.perf_counter()
+            try:
+                extraction = _perform_text_extraction(self, pdf_path, name)
+            except Exception as e:
+                if is_last:
+                    raise
+                logger.warning(f"⚠️ {name} extraction failed, trying next backend: {e}")
+                failures[name] = str(e)
+                continue
+
+            extraction['extraction_method'] = name
+            extraction['backend_time'] = time.perf_counter() - backend_start
+            has_text = bool(extraction['text'].strip())
+            if not has_text and probe is None:
+                # Sonde différée : texte vide, reste à savoir s'il existe une couche texte
+                probe = probe_pdf(pdf_path)
+                probed_late = True
+            if has_text or not probe.has_text_layer or is_last:
+                break
+            failures[name] = 'No text extracted despite a text layer'
+
+        extraction['backend_failures'] = failures
+        if probed_late:
+            extraction['probe'] = asdict(probe)
+        # Pages image sans couche texte : seul un OCR peut en tirer du texte
+        extraction['needs_ocr'] = not has_text and probe.profile() == 'scanned'
+
+        backend_stats = self.extraction_stats['backends'].setdefault(name, {'documents': 0, 'time': 0.0})
+        backend_stats['documents'] += 1
+        backend_stats['time'] += extraction['backend_time']
+        return extraction
+
+    def _extract_with_pdfplumber(self, pdf_path: PDFSource) -> Dict[str, Any]:
+        """
+        Extraction avec pdfplumber (pages réparties sur plusieurs processus au-delà du seuil)
+
+        Un document en mémoire reste extrait dans ce processus : le
+        transmettre aux workers le copierait dans chacun d'eux.
+        """
+        backend = BACKENDS['pdfplumber']
+        with backend.open_pages(pdf_path) as pages:
+            page_count = len(pages)
+            workers = 1 if is_buffer(pdf_path) else self._parallel_workers(page_count)
+            pages_text = None if workers > 1 else [_page_text(page, backend) for page in pages]
+
+        if pages_text is None:
+            pages_text = self._extract_pages_parallel(pdf_path, page_count, workers)
+
+        return _pages_result(pages_text)
+
+    def _parallel_workers(self, page_count: int) -> int:
+        """Nombre de processus à utiliser (1 : extraction séquentielle)"""
+        if self.parallel_page_threshold is None or page_count < self.parallel_page_threshold:
+            return 1
+        return max(1, min(self.max_workers, page_count))
+
+    def _extract_pages_parallel(self, pdf_path: str, page_count: int, workers: int) -> List[str]:
+        """
+        Répartit des plages de pages contiguës sur un pool de processus
+
+        Chaque worker ouvre le fichier lui-même ; les pages sont réassemblées
+        dans l'ordre. En cas d'échec du pool, repli sur l'extraction séquentielle.
+        """
+        ranges = _split_page_ranges(page_count, workers * PAGE_RANGES_PER_WORKER)
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_extract_pdfplumber_pages, pdf_path, start, end)
+                    for start, end in ranges
+                ]
+                pages_text = [text for future in futures for text in future.result()]
+
+            self.extraction_stats['parallel_extractions'] += 1
+            return pages_text
+
+        except Exception as e:
+            logger.warning(f"⚠️ Parallel extraction failed, falling back to serial: {e}")
+            return _extract_pdfplumber_pages(pdf_path, 0, page_count)
+
+    def _extract_with_backend(self, pdf_path: PDFSource, backend: PDFBackend) -> Dict[str, Any]:
+        """Extraction séquentielle avec un backend du registre"""
+        with backend.open_pages(pdf_path) as pages:
+            pages_text = [_page_text(page, backend) for page in pages]
+
+        return _pages_result(pages_text)
+
+    def iter_pages(self, pdf_path: PDFSource, start_page: int = 0, end_page: Optional[int] = None) -> Iterator[str]:
+        """
+        Produit le texte des pages [start_page, end_page) une à une
+
+        Seules les pages demandées sont analysées et le texte complet n'est
+        jamais assemblé : l'appelant peut s'arrêter dès qu'il a trouvé ce
+        qu'il cherche. Le fichier reste ouvert jusqu'à la fin (ou la
+        fermeture) du générateur.
+
+        Raises:
+            ValueError: Fichier invalide
+            RuntimeError: Aucune bibliothèque PDF disponible
+        """
+        backend = self._lazy_backend(pdf_path)
+
+        with backend.open_pages(pdf_path) as pages:
+            for index in _page_indexes(len(pages), start_page, end_page):
+                yield _page_text(pages[index], backend)
+
+    @contextmanager
+    def page_stream(self, pdf_path: PDFSource) -> Iterator[Tuple[str, int, Iterator[str]]]:
+        """
+        Ouvre le document pour une lecture page par page
+
+        Fournit (backend, nombre de pages, texte des pages) : chaque page n'est
+        analysée que lorsque l'itérateur la demande, celles qui ne sont jamais
+        demandées ne coûtent rien. Le document est fermé à la sortie du bloc.
+
+        Raises:
+            ValueError: Fichier invalide
+            RuntimeError: Aucune bibliothèque PDF disponible
+        """
+        backend = self._lazy_backend(pdf_path)
+
+        with backend.open_pages(pdf_path) as pages:
+            yield backend.name, len(pages), (_page_text(page, backend) for page in pages)
+
+    def extract_page_range(self, pdf_path: PDFSource, start_page: int = 0, end_page: Optional[int] = None) -> Dict[str, Any]:
+        """Extrait le texte d'une plage de pages spécifique (sans analyser les autres pages)"""
+        import time
+        start_time = time.time()
+
+        try:
+            backend = self._lazy_backend(pdf_path)
+
+            with backend.open_pages(pdf_path) as pages:
+                page_count = len(pages)
+                indexes = _page_indexes(page_count, start_page, end_page)
+                selected_pages = [_page_text(pages[index], backend) for index in indexes]
+
+            selected_text = '\n\n'.join(selected_pages)
+
+            result = {
+                'text': selected_text,
+                'pages': selected_pages,
+                'total_pages': len(selected_pages),
+                'text_length': len(selected_text),
+                'page_range': f'{indexes.start}-{indexes.stop - 1}',
+                'document_pages': page_count,
+                'extraction_method': backend.name,
+                'extraction_success': True,
+                'extraction_time': time.time() - start_time
+            }
+            _update_extraction_stats(self, result)
+            return result
+
+        except Exception as e:
+            logger.error(f"Page range extraction failed: {e}")
+            return {
+                'text': '',
+                'error': str(e),
+                'extraction_success': False
+            }
+
+    def _lazy_backend(self, pdf_path: PDFSource) -> PDFBackend:
+        """Valide le fichier et choisit le backend pour une lecture page par page"""
+        validation = self.validator.validate_file(pdf_path)
+        if not validation['is_valid']:
+            raise ValueError(f"File validation failed: {', '.join(validation['errors'])}")
+
+        _, backends = self._select_backends(pdf_path)
+        if not backends:
+            raise RuntimeError('No PDF library available')
+        return BACKENDS[backends[0]]
+
+    def get_extraction_stats(self) -> Dict[str, Any]:
+        """Retourne les statistiques d'extraction"""
+        stats = self.extraction_stats.copy()
+        stats['backends'] = {name: dict(backend) for name, backend in stats['backends'].items()}
+        return stats
+
+    def reset_stats(self):
+        """Remet à zéro les statistiques"""
+        self.extraction_stats = _initial_extraction_stats()
+
+def _initial_extraction_stats() -> Dict[str, Any]:
+    """Statistiques d'extraction initiales"""
+    return {
+        'total_pages': 0,
+        'text_length': 0,
+        'extraction_time': 0.0,
+        'parallel_extractions': 0,
+        'backends': {}
+    }
+
+def _page_text(page, backend: PDFBackend) -> str:
+    """Texte d'une page (chaîne vide si la page est vide ou illisible), page libérée ensuite"""
+    try:
+        text = backend.page_text(page)
+        return text.strip() if text else ""
+    except Exception as e:
+        logger.warning(f"Failed to extract text from page: {e}")
+        return ""
+    finally:
+        backend.release_page(page)
+
+def _pages_result(pages_text: List[str]) -> Dict[str, Any]:
+    """Résultat d'extraction à partir du texte des pages"""
+    full_text = '\n\n'.join(pages_text)
+    return {
+        'text': full_text,
+        'pages': pages_text,
+        'total_pages': len(pages_text),
+        'text_length': len(full_text)
+    }
+
+def _page_indexes(page_count: int, start_page: int, end_page: Optional[int]) -> range:
+    """Indices des pages [start_page, end_page), mêmes règles que le découpage d'une liste"""
+    return range(*slice(start_page, end_page).indices(page_count))
+
+def _split_page_ranges(page_count: int, parts: int) -> List[Tuple[int, int]]:
+    """Découpe [0, page_count) en plages contiguës de tailles proches"""
+    parts = max(1, min(parts, page_count))
+    size, extra = divmod(page_count, parts)
+    ranges = []
+    start = 0
+    for i in range(parts):
+        end = start + size + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+def _extract_pdfplumber_pages(pdf_path: str, start: int, end: int) -> List[str]:
+    """Worker : ouvre le PDF et extrait les pages [start, end)"""
+    backend = BACKENDS['pdfplumber']
+    with backend.open_pages(pdf_path) as pages:
+        return [_page_text(page, backend) for page in pages[start:end]]
+
 def _initialize_extraction_result() -> Dict[str, Any]:
     """Initialise le dictionnaire de résultat d'extraction"""
     return {
@@ -84,7 +356,7 @@ def _initialize_extraction_result() -> Dict[str, Any]:
         'metadata': {}
     }
 
-def _validate_pdf_file(extractor, pdf_path: str, result: Dict[str, Any]) -> bool:
+def _validate_pdf_file(extractor, pdf_path: PDFSource, result: Dict[str, Any]) -> bool:
     """Valide le fichier PDF"""
     validation = extractor.validator.validate_file(pdf_path)
     if not validation['is_valid']:
@@ -93,20 +365,12 @@ def _validate_pdf_file(extractor, pdf_path: str, result: Dict[str, Any]) -> bool
         return False
     return True
 
-def _determine_extraction_method() -> Optional[str]:
-    """Détermine la méthode d'extraction à utiliser"""
-    if PDFPLUMBER_AVAILABLE:
-        return 'pdfplumber'
-    elif PDF_LIBRARY_AVAILABLE:
-        return 'pypdf'
-    return None
-
-def _perform_text_extraction(extractor, pdf_path: str, method: str) -> Dict[str, Any]:
+def _perform_text_extraction(extractor, pdf_path: PDFSource, method: str) -> Dict[str, Any]:
     """Exécute l'extraction du texte selon la méthode choisie"""
     if method == 'pdfplumber':
         return extractor._extract_with_pdfplumber(pdf_path)
-    elif method == 'pypdf':
-        return extractor._extract_with_pypdf(pdf_path)
+    elif method in BACKENDS:
+        return extractor._extract_with_backend(pdf_path, BACKENDS[method])
     else:
         raise ValueError(f"Unsupported extraction method: {method}")
 
@@ -136,104 +400,8 @@ def _handle_extraction_error(error: Exception, result: Dict[str, Any], start_tim
     logger.error(f"Text extraction failed: {error}")
     return result
 
-    def _extract_with_pdfplumber(self, pdf_path: str) -> Dict[str, Any]:
-        """Extraction avec pdfplumber"""
-        pages_text = []
-
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                try:
-                    text = page.extract_text()
-                    if text:
-                        pages_text.append(text.strip())
-                    else:
-                        pages_text.append("")
-                except Exception as e:
-                    logger.warning(f"Failed to extract text from page: {e}")
-                    pages_text.append("")
-
-        full_text = '\n\n'.join(pages_text)
-
-        return {
-            'text': full_text,
-            'pages': pages_text,
-            'total_pages': len(pages_text),
-            'text_length': len(full_text)
-        }
-
-    def _extract_with_pypdf(self, pdf_path: str) -> Dict[str, Any]:
-        """Extraction avec pypdf"""
-        pages_text = []
-
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = pypdf.PdfReader(file)
-
-            for page in pdf_reader.pages:
-                try:
-                    text = page.extract_text()
-                    if text:
-                        pages_text.append(text.strip())
-                    else:
-                        pages_text.append("")
-                except Exception as e:
-                    logger.warning(f"Failed to extract text from page: {e}")
-                    pages_text.append("")
-
-        full_text = '\n\n'.join(pages_text)
-
-        return {
-            'text': full_text,
-            'pages': pages_text,
-            'total_pages': len(pages_text),
-            'text_length': len(full_text)
-        }
-
-    def extract_page_range(self, pdf_path: str, start_page: int = 0, end_page: Optional[int] = None) -> Dict[str, Any]:
-        """Extrait le texte d'une plage de pages spécifique"""
-        try:
-            full_result = self.extract_text(pdf_path)
-
-            if not full_result['extraction_success']:
-                return full_result
-
-            pages = full_result['pages']
-            if end_page is None:
-                end_page = len(pages)
-
-            selected_pages = pages[start_page:end_page]
-            selected_text = '\n\n'.join(selected_pages)
-
-            return {
-                'text': selected_text,
-                'pages': selected_pages,
-                'total_pages': len(selected_pages),
-                'text_length': len(selected_text),
-                'page_range': f'{start_page}-{end_page-1}',
-                'extraction_success': True
-            }
-
-        except Exception as e:
-            logger.error(f"Page range extraction failed: {e}")
-            return {
-                'text': '',
-                'error': str(e),
-                'extraction_success': False
-            }
-
-    def get_extraction_stats(self) -> Dict[str, Any]:
-        """Retourne les statistiques d'extraction"""
-        return self.extraction_stats.copy()
-
-    def reset_stats(self):
-        """Remet à zéro les statistiques"""
-        self.extraction_stats = {
-            'total_pages': 0,
-            'text_length': 0,
-            'extraction_time': 0.0
-        }
-
 # Fonction de compatibilité
-def extract_text_from_pdf(pdf_path: str) -> str:
+def extract_text_from_pdf(pdf_path: PDFSource) -> str:
     """Fonction de compatibilité pour l'ancien code"""
     extractor = PDFTextExtractor()
     result = extractor.extract_text(pdf_path)
@@ -8,6 +8,8 @@ import logging
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+from .pdf_source import MAX_PDF_SIZE, PDFSource, is_buffer, source_name, source_view
+
 logger = logging.getLogger(__name__)
 
 class PDFValidator:
@@ -15,19 +17,22 @@ class PDFValidator:
 
     def __init__(self):
         self.supported_extensions = ['.pdf']
-        self.max_file_size = 50 * 1024 * 1024  # 50MB
+        self.max_file_size = MAX_PDF_SIZE  # 50MB
         self.min_file_size = 1024  # 1KB
 
-    def validate_file(self, file_path: str) -> Dict[str, Any]:
+    def validate_file(self, file_path: PDFSource) -> Dict[str, Any]:
         """
         Validation complète d'un fichier PDF - refactorisé pour réduire la complexité
 
         Args:
-            file_path: Chemin vers le fichier à valider
+            file_path: Chemin vers le fichier à valider, ou son contenu en mémoire
 
         Returns:
             Dictionnaire avec le résultat de validation
         """
+        if is_buffer(file_path):
+            return self.validate_buffer(file_path)
+
         try:
             # Étape 1: Initialisation
             validation_result = _initialize_validation_result(file_path)
@@ -57,6 +62,77 @@ class PDFValidator:
         except Exception as e:
             return _handle_validation_error(e, file_path, validation_result)
 
+    def validate_buffer(self, data: PDFSource, name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Validation d'un PDF en mémoire (bytes, bytearray, memoryview, mmap)
+
+        Mêmes contrôles de taille et de contenu qu'un fichier, lus sur le
+        buffer sans copie ; extension, existence et permissions ne
+        s'appliquent pas.
+        """
+        name = name or source_name(data)
+        validation_result = _initialize_validation_result(name)
+
+        try:
+            with source_view(data) as view:
+                if not _check_size(len(view), self.min_file_size, self.max_file_size, validation_result):
+                    return validation_result
+
+                if not _has_pdf_markers(view[:8], view[-1024:]):
+                    validation_result['errors'].append('Invalid PDF content')
+                    return validation_result
+
+            validation_result['is_valid'] = True
+            logger.info(f"✅ PDF validation successful: {name}")
+            return validation_result
+
+        except Exception as e:
+            return _handle_validation_error(e, name, validation_result)
+
+    def _validate_pdf_content(self, path: Path) -> bool:
+        """Validation basique du contenu PDF"""
+        try:
+            with open(path, 'rb') as f:
+                # Lire le début du fichier
+                header = f.read(8)
+
+                # Lire la fin du fichier pour vérifier le EOF
+                f.seek(-1024, 2)  # Derniers 1024 octets
+                end_content = f.read()
+
+            return _has_pdf_markers(header, end_content)
+
+        except Exception:
+            return False
+
+    def get_file_info(self, file_path: str) -> Dict[str, Any]:
+        """Récupère les informations détaillées du fichier"""
+        try:
+            path = Path(file_path)
+            stat = path.stat()
+
+            return {
+                'size': stat.st_size,
+                'created': stat.st_ctime,
+                'modified': stat.st_mtime,
+                'accessed': stat.st_atime,
+                'permissions': oct(stat.st_mode)[-3:],
+                'readable': os.access(path, os.R_OK),
+                'writable': os.access(path, os.W_OK)
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to get file info: {e}")
+            return {}
+
+    def is_corrupted(self, file_path: str) -> bool:
+        """Vérifie si le fichier PDF est corrompu"""
+        try:
+            validation = self.validate_file(file_path)
+            return not validation['is_valid'] or len(validation['errors']) > 0
+        except Exception:
+            return True
+
 def _initialize_validation_result(file_path: str) -> Dict[str, Any]:
     """Initialise le dictionnaire de résultat de validation"""
     return {
@@ -83,7 +159,10 @@ def _check_file_extension(path: Path, supported_extensions: list, result: Dict[s
 
 def _check_file_size(path: Path, min_size: int, max_size: int, result: Dict[str, Any]) -> bool:
     """Vérifie la taille du fichier"""
-    file_size = path.stat().st_size
+    return _check_size(path.stat().st_size, min_size, max_size, result)
+
+def _check_size(file_size: int, min_size: int, max_size: int, result: Dict[str, Any]) -> bool:
+    """Vérifie une taille de document (fichier ou buffer)"""
     result['file_info']['size'] = file_size
 
     if file_size < min_size:
@@ -102,6 +181,10 @@ def _check_file_permissions(path: Path, result: Dict[str, Any]) -> bool:
         return False
     return True
 
+def _has_pdf_markers(header, end_content) -> bool:
+    """Header %PDF- au début, %%EOF dans les derniers octets"""
+    return bytes(header).startswith(b'%PDF-') and b'%%EOF' in bytes(end_content)
+
 def _validate_content(path: Path, validator, result: Dict[str, Any]) -> bool:
     """Valide le contenu du PDF"""
     if not validator._validate_pdf_content(path):
@@ -122,58 +205,6 @@ def _handle_validation_error(error: Exception, file_path: str, result: Dict[str,
     logger.error(f"PDF validation failed for {file_path}: {error}")
     return result
 
-    def _validate_pdf_content(self, path: Path) -> bool:
-        """Validation basique du contenu PDF"""
-        try:
-            with open(path, 'rb') as f:
-                # Lire le début du fichier
-                header = f.read(8)
-
-                # Vérifier le header PDF
-                if not header.startswith(b'%PDF-'):
-                    return False
-
-                # Lire la fin du fichier pour vérifier le EOF
-                f.seek(-1024, 2)  # Derniers 1024 octets
-                end_content = f.read()
-
-                # Chercher %%EOF
-                if b'%%EOF' not in end_content:
-                    return False
-
-            return True
-
-        except Exception:
-            return False
-
-    def get_file_info(self, file_path: str) -> Dict[str, Any]:
-        """Récupère les informations détaillées du fichier"""
-        try:
-            path = Path(file_path)
-            stat = path.stat()
-
-            return {
-                'size': stat.st_size,
-                'created': stat.st_ctime,
-                'modified': stat.st_mtime,
-                'accessed': stat.st_atime,
-                'permissions': oct(stat.st_mode)[-3:],
-                'readable': os.access(path, os.R_OK),
-                'writable': os.access(path, os.W_OK)
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to get file info: {e}")
-            return {}
-
-    def is_corrupted(self, file_path: str) -> bool:
-        """Vérifie si le fichier PDF est corrompu"""
-        try:
-            validation = self.validate_file(file_path)
-            return not validation['is_valid'] or len(validation['errors']) > 0
-        except Exception:
-            return True
-
 # Fonction de compatibilité
 def validate_pdf_file(file_path: str) -> bool:
     """Fonction de compatibilité pour l'ancien code"""
@@ -4,6 +4,7 @@ Utilise des modules spécialisés pour éviter le spaghetti code
 """
 
 import logging
+import os
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
@@ -11,13 +12,15 @@ logger = logging.getLogger(__name__)
 # Importer les modules spécialisés
 from .cache_models import CacheEntry, CacheStats
 from .postgresql_cache import PostgreSQLCache, POSTGRESQL_AVAILABLE
+from .async_postgresql_cache import AsyncPostgreSQLCache, ASYNCPG_AVAILABLE
 from .memory_cache import MemoryCache
+from .disk_cache import DiskCache
 from .advanced_cache_orchestrator import AdvancedCache, get_advanced_cache
 
 # Fonctions de compatibilité pour l'ancien code
-def get_cache(connection_string: Optional[str] = None) -> AdvancedCache:
+def get_cache(connection_string: Optional[str] = None, memory_policy: str = 'lru') -> AdvancedCache:
     """Fonction de compatibilité"""
-    return get_advanced_cache(connection_string)
+    return get_advanced_cache(connection_string, memory_policy)
 
 # Classes de compatibilité pour l'ancien code
 class CacheManager:
@@ -41,12 +44,36 @@ class CacheManager:
     def get_stats(self) -> Dict[str, Any]:
         return self.cache.get_stats()
 
+def default_connection_string() -> Optional[str]:
+    """
+    DSN PostgreSQL du cache partagé
+
+    CACHE_DATABASE_URL ou DATABASE_URL, sinon construit depuis la
+    configuration DB_* (Config.database) si DB_HOST est défini. None laisse
+    le cache en mémoire (et disque si CACHE_DISK_PATH est défini).
+    """
+    dsn = os.getenv('CACHE_DATABASE_URL') or os.getenv('DATABASE_URL')
+    if dsn:
+        return dsn
+    if not os.getenv('DB_HOST'):
+        return None
+
+    from .config import Config
+    db = Config().database
+    credentials = f"{db.username}:{db.password}" if db.password else db.username
+    return f"postgresql://{credentials}@{db.host}:{db.port}/{db.database}"
+
 # Instance globale pour compatibilité
 _default_cache = None
 
 def get_default_cache() -> AdvancedCache:
-    """Retourne le cache par défaut"""
+    """
+    Retourne le cache par défaut (partagé par l'API, le préchauffage et les extractions PDF)
+
+    CACHE_MEMORY_POLICY choisit la politique d'éviction de L1 ('lru' par défaut, ou 'tinylfu').
+    """
     global _default_cache
     if _default_cache is None:
-        _default_cache = get_advanced_cache()
+        _default_cache = get_advanced_cache(default_connection_string(),
+                                            os.getenv('CACHE_MEMORY_POLICY', 'lru'))
     return _default_cache
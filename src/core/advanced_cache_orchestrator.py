@@ -1,52 +1,218 @@
 """
 Orchestrateur de cache avancé
-Combine PostgreSQL et mémoire pour optimisation
+Combine PostgreSQL (ou disque local) et mémoire pour optimisation
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from datetime import datetime
-import hashlib
+import json
 import os
 
+from .bloom_filter import KeyPresenceFilter
+from .cache_invalidation import INVALIDATION_CHANNEL, CacheInvalidationBus
+from .cache_keys import make_key, with_tags
 from .cache_models import CacheEntry, CacheStats
 from .postgresql_cache import PostgreSQLCache
-from .memory_cache import MemoryCache
+from .disk_cache import DiskCache
+from .memory_cache import COMPUTE_TIME_KEY, FRESH_UNTIL_KEY, MemoryCache
+from .single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 class AdvancedCache:
-    """Cache avancé avec hiérarchie mémoire/PostgreSQL"""
+    """Cache avancé avec hiérarchie mémoire/PostgreSQL (ou disque local)"""
 
     def __init__(self,
                  connection_string: Optional[str] = None,
                  memory_size: int = 1000,
-                 default_ttl: int = 3600):
+                 default_ttl: int = 3600,
+                 memory_max_bytes: Optional[int] = None,
+                 memory_policy: str = 'lru',
+                 stale_ttl: int = 0,
+                 refresh_workers: int = 4,
+                 disk_cache_path: Optional[str] = None,
+                 invalidation_channel: Optional[str] = INVALIDATION_CHANNEL,
+                 bloom_filter: bool = True,
+                 bloom_capacity: int = 100_000,
+                 bloom_error_rate: float = 0.01,
+                 early_refresh_beta: float = 0.0):
         self.default_ttl = default_ttl
+        # Fenêtre pendant laquelle une valeur périmée est servie pendant son rafraîchissement
+        self.stale_ttl = stale_ttl
+        # Rafraîchissement anticipé probabiliste (XFetch) : 0 désactive, > 1 anticipe davantage
+        self.early_refresh_beta = early_refresh_beta
 
         # Cache mémoire (L1 - rapide)
-        self.memory_cache = MemoryCache(max_size=memory_size)
+        self.memory_cache = MemoryCache(
+            max_size=memory_size, max_bytes=memory_max_bytes, policy=memory_policy
+        )
 
         # Cache PostgreSQL (L2 - persistant)
         self.postgresql_cache = PostgreSQLCache(connection_string)
 
+        # Cache disque local (L2 de repli sans PostgreSQL, survit aux redémarrages)
+        disk_cache_path = disk_cache_path or os.getenv('CACHE_DISK_PATH')
+        self.disk_cache: Optional[DiskCache] = None
+        if disk_cache_path and not self.postgresql_cache.pool:
+            self.disk_cache = DiskCache(disk_cache_path)
+
         # Statistiques combinées
         self.stats = CacheStats()
 
+        # Coalescence des calculs de fallback et rafraîchissements en arrière-plan
+        self._single_flight = SingleFlight()
+        self._refresh_workers = refresh_workers
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing: set = set()
+        self._refresh_lock = threading.Lock()
+        self.background_refreshes = 0
+        self.early_refreshes = 0
+
+        # Cohérence L1 entre workers (None : désactivée)
+        self._invalidation_bus: Optional[CacheInvalidationBus] = None
+        if invalidation_channel and self.postgresql_cache.pool:
+            self._invalidation_bus = CacheInvalidationBus(
+                connection_string,
+                on_message=self._apply_invalidation,
+                notify=self.postgresql_cache.notify,
+                channel=invalidation_channel
+            )
+            self._invalidation_bus.start()
+
+        # Filtre des clés présentes en L2 : les absences certaines évitent PostgreSQL.
+        # Il dépend du bus pour connaître les écritures des autres workers.
+        self.key_filter: Optional[KeyPresenceFilter] = None
+        self._filter_rebuild_thread: Optional[threading.Thread] = None
+        if bloom_filter and self._invalidation_bus is not None:
+            self.key_filter = KeyPresenceFilter(bloom_capacity, bloom_error_rate)
+            self._schedule_filter_rebuild()
+        elif bloom_filter and self.postgresql_cache.pool:
+            logger.warning("⚠️ L2 key filter disabled: no cache invalidation bus "
+                           "(invalidation_channel unset)")
+
         logger.info("✅ Advanced cache initialized")
 
-    def _generate_key(self, data: Any) -> str:
-        """Génère une clé de cache à partir des données"""
-        if isinstance(data, str):
-            key_data = data
-        elif isinstance(data, dict):
-            # Trier les clés pour une cohérence
-            key_data = json.dumps(data, sort_keys=True, default=str)
+    def _schedule_filter_rebuild(self):
+        """Reconstruit le filtre de clés en arrière-plan (un seul scan à la fois)"""
+        with self._refresh_lock:
+            thread = self._filter_rebuild_thread
+            if thread is not None and thread.is_alive():
+                return
+            self._filter_rebuild_thread = threading.Thread(
+                target=self._rebuild_key_filter, name='cache-key-filter', daemon=True
+            )
+            self._filter_rebuild_thread.start()
+
+    def _rebuild_key_filter(self, max_attempts: int = 3):
+        """Scanne les clés de L2 (recommence si une resynchronisation survient pendant le scan)"""
+        for _ in range(max_attempts):
+            try:
+                expected = self.postgresql_cache.count_keys()
+                scanned = self.key_filter.rebuild(self.postgresql_cache.iter_keys(), expected=expected)
+            except Exception as e:
+                logger.error(f"L2 key filter rebuild failed: {e}")
+                return
+
+            if self.key_filter.ready:
+                logger.info(f"✅ L2 key filter rebuilt ({scanned} keys)")
+                return
+
+    def _skip_l2(self, key: str) -> bool:
+        """Vrai si le filtre garantit l'absence de la clé en L2"""
+        return self.key_filter is not None and not self.key_filter.might_contain(key)
+
+    def _filter_ready(self) -> bool:
+        """Vrai si le filtre est construit (ses absences sont certaines)"""
+        return self.key_filter is not None and self.key_filter.ready
+
+    def _lookup_l2(self, keys: List[str]) -> Dict[str, CacheEntry]:
+        """
+        Lecture L2 quand le filtre est actif (L2 est alors PostgreSQL)
+
+        Un faux positif n'est compté que pour une clé sans aucune ligne en
+        L2 : une ligne expirée a bien été écrite, le filtre avait raison.
+        """
+        found, present = self.postgresql_cache.lookup_entries(keys)
+        for _ in range(len(set(keys) - present)):
+            self.key_filter.record_false_positive()
+        return found
+
+    def _filter_added(self, keys: List[str]):
+        """Enregistre des clés écrites en L2 dans le filtre"""
+        if self.key_filter is not None:
+            self.key_filter.add_many(keys)
+            if self.key_filter.needs_rebuild():
+                self._schedule_filter_rebuild()
+
+    def _filter_deleted(self, count: int):
+        """Comptabilise des suppressions L2 (reconstruction si elles s'accumulent)"""
+        if self.key_filter is not None and count:
+            self.key_filter.record_deletions(count)
+            if self.key_filter.needs_rebuild():
+                self._schedule_filter_rebuild()
+
+    def _publish_invalidation(self, op: str, **kwargs):
+        """Signale aux autres workers de retirer des entrées de leur L1"""
+        if self._invalidation_bus is not None:
+            self._invalidation_bus.publish(op, **kwargs)
+
+    def _apply_invalidation(self, message: Dict[str, Any]):
+        """Retire du L1 local les entrées invalidées par un autre worker"""
+        op = message.get('op')
+
+        # La prochaine lecture relira la valeur à jour depuis L2
+        if op == 'set':
+            keys = message.get('keys', [])
+            self.memory_cache.delete_many(keys)
+            if self.key_filter is not None:
+                self.key_filter.add_many(keys)
+        elif op == 'keys':
+            self.memory_cache.delete_many(message.get('keys', []))
+        elif op == 'tag':
+            self.memory_cache.delete_tag(message['tag'])
+        elif op == 'prefix':
+            self.memory_cache.delete_prefix(message['prefix'])
+        elif op == 'clear':
+            self.memory_cache.clear()
+        elif op == 'resync':
+            # Invalidations et écritures manquées : L1 vidé, filtre reconstruit
+            self.memory_cache.clear()
+            if self.key_filter is not None:
+                self.key_filter.invalidate()
+                self._schedule_filter_rebuild()
         else:
-            key_data = str(data)
+            logger.warning(f"Unknown cache invalidation op: {op}")
+
+    def close(self):
+        """Arrête l'écoute des invalidations et les rafraîchissements en arrière-plan"""
+        if self._invalidation_bus is not None:
+            self._invalidation_bus.stop()
+            self._invalidation_bus = None
+
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=False)
+            self._refresh_executor = None
+
+    @property
+    def l2_cache(self):
+        """Niveau L2 actif : PostgreSQL si disponible, sinon disque local"""
+        if self.disk_cache is not None and not self.postgresql_cache.pool:
+            return self.disk_cache
+        return self.postgresql_cache
+
+    def _has_l2(self) -> bool:
+        """Indique si un niveau L2 persistant est disponible"""
+        if self.postgresql_cache.pool:
+            return True
+        return self.disk_cache is not None and self.disk_cache.available
 
-        # Hash pour limiter la longueur
-        return hashlib.md5(key_data.encode()).hexdigest()
+    def _generate_key(self, data: Any, namespace: str = 'cache', version: int = 1) -> str:
+        """Génère une clé de cache stable entre processus à partir des données"""
+        return make_key(namespace, data, version=version)
 
     def get(self, key: str) -> Optional[Any]:
         """Récupère une valeur du cache (L1 puis L2)"""
@@ -60,12 +226,18 @@ class AdvancedCache:
             self.stats.total_access_time += (datetime.now() - start_time).total_seconds()
             return value
 
-        # Essayer le cache PostgreSQL
-        value = self.postgresql_cache.get(key)
+        # Essayer le niveau L2 (PostgreSQL ou disque), sauf absence certaine
+        if self._skip_l2(key):
+            entry = None
+        elif self._filter_ready():
+            entry = self._lookup_l2([key]).get(key)
+        else:
+            entry = self.l2_cache.get_entry(key)
 
-        if value is not None:
-            # Promouvoir en mémoire pour les accès futurs
-            self.memory_cache.set(key, value, ttl=self.default_ttl)
+        value = entry.value if entry is not None else None
+        if entry is not None:
+            # Promouvoir en mémoire avec le TTL restant et les métadonnées (tags, fraîcheur)
+            self.memory_cache.set_entries({key: entry})
             self.stats.hits += 1
         else:
             self.stats.misses += 1
@@ -73,33 +245,88 @@ class AdvancedCache:
         self.stats.total_access_time += (datetime.now() - start_time).total_seconds()
         return value
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None, metadata: Optional[Dict] = None):
-        """Stocke une valeur dans le cache (L1 et L2)"""
+    def set(self, key: str, value: Any, ttl: Optional[int] = None, metadata: Optional[Dict] = None,
+            tags: Optional[List[str]] = None):
+        """Stocke une valeur dans le cache (L1 et L2), avec tags d'invalidation optionnels"""
         ttl = ttl or self.default_ttl
+        metadata = with_tags(metadata, tags)
 
         # Stocker dans les deux niveaux
         self.memory_cache.set(key, value, ttl=ttl, metadata=metadata)
-        self.postgresql_cache.set(key, value, ttl=ttl, metadata=metadata)
+        self.l2_cache.set(key, value, ttl=ttl, metadata=metadata)
+        self._filter_added([key])
+        self._publish_invalidation('set', keys=[key])
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Récupère plusieurs valeurs : un passage L1 puis un aller-retour L2 pour les absentes"""
+        start_time = datetime.now()
+
+        found = self.memory_cache.get_many(keys)
+        missing = [key for key in keys if key not in found]
+
+        if missing:
+            to_query = [key for key in missing if not self._skip_l2(key)]
+            if not to_query:
+                from_l2 = {}
+            elif self._filter_ready():
+                from_l2 = self._lookup_l2(to_query)
+            else:
+                from_l2 = self.l2_cache.get_many_entries(to_query)
+            if from_l2:
+                # Promouvoir en mémoire avec le TTL restant et les métadonnées (tags, fraîcheur)
+                self.memory_cache.set_entries(from_l2)
+                found.update({key: entry.value for key, entry in from_l2.items()})
+
+        self.stats.hits += len(found)
+        self.stats.misses += len(keys) - len(found)
+        self.stats.total_access_time += (datetime.now() - start_time).total_seconds()
+        return found
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None, metadata: Optional[Dict] = None,
+                 tags: Optional[List[str]] = None):
+        """Stocke plusieurs valeurs dans les deux niveaux"""
+        ttl = ttl or self.default_ttl
+        metadata = with_tags(metadata, tags)
+
+        self.memory_cache.set_many(items, ttl=ttl, metadata=metadata)
+        self.l2_cache.set_many(items, ttl=ttl, metadata=metadata)
+        self._filter_added(list(items))
+        self._publish_invalidation('set', keys=list(items))
+
+    def delete_many(self, keys: List[str]) -> int:
+        """Supprime plusieurs entrées des deux niveaux"""
+        memory_deleted = self.memory_cache.delete_many(keys)
+        l2_deleted = self.l2_cache.delete_many(keys)
+        self._filter_deleted(l2_deleted)
+        self._publish_invalidation('keys', keys=keys)
+
+        return max(memory_deleted, l2_deleted)
 
     def delete(self, key: str) -> bool:
         """Supprime une entrée du cache (L1 et L2)"""
         memory_deleted = self.memory_cache.delete(key)
-        postgresql_deleted = self.postgresql_cache.delete(key)
+        l2_deleted = self.l2_cache.delete(key)
+        self._filter_deleted(int(bool(l2_deleted)))
+        self._publish_invalidation('keys', keys=[key])
 
-        return memory_deleted or postgresql_deleted
+        return memory_deleted or l2_deleted
 
     def clear(self):
         """Vide complètement le cache (L1 et L2)"""
         self.memory_cache.clear()
-        self.postgresql_cache.clear()
+        self.l2_cache.clear()
+        if self.key_filter is not None:
+            self.key_filter.rebuild([])
+        self._publish_invalidation('clear')
         self.stats = CacheStats()
 
     def cleanup_expired(self) -> int:
         """Nettoie les entrées expirées dans les deux niveaux"""
-        memory_cleaned = 0  # Le cache mémoire se nettoie automatiquement
-        postgresql_cleaned = self.postgresql_cache.cleanup_expired()
+        memory_cleaned = self.memory_cache.cleanup_expired()
+        l2_cleaned = self.l2_cache.cleanup_expired()
+        self._filter_deleted(l2_cleaned)
 
-        return memory_cleaned + postgresql_cleaned
+        return memory_cleaned + l2_cleaned
 
     def get_stats(self) -> Dict[str, Any]:
         """Retourne les statistiques combinées"""
@@ -110,27 +337,57 @@ class AdvancedCache:
             'combined': self.stats.to_dict(),
             'memory': memory_stats,
             'postgresql': postgresql_stats,
+            'single_flight': {
+                'coalesced_calls': self._single_flight.coalesced,
+                'background_refreshes': self.background_refreshes,
+                'early_refreshes': self.early_refreshes
+            },
             'timestamp': datetime.now().isoformat(),
-            'cache_levels': 2 if self.postgresql_cache.pool else 1
+            'cache_levels': 2 if self._has_l2() else 1
         }
 
+        if self.disk_cache is not None:
+            combined_stats['disk'] = self.disk_cache.get_stats()
+        if self._invalidation_bus is not None:
+            combined_stats['coherence'] = self._invalidation_bus.get_stats()
+        if self.key_filter is not None:
+            combined_stats['bloom'] = self.key_filter.get_stats()
+
         return combined_stats
 
-    def backup_data(self, filename: str):
-        """Sauvegarde les données des deux niveaux"""
-        try:
-            # Sauvegarder la mémoire
-            memory_file = f"{filename}_memory.json"
-            self.memory_cache.backup_data(memory_file)
+    def backup_data(self, filename: str, since_backup: Optional[str] = None):
+        """
+        Sauvegarde les données des deux niveaux (instantanés en flux)
 
-            # Sauvegarder PostgreSQL
-            postgresql_file = f"{filename}_postgresql.json"
-            self.postgresql_cache.backup_data(postgresql_file)
+        Args:
+            filename: Fichier d'index ; chaque niveau est écrit à côté
+            since_backup: Index d'une sauvegarde précédente ; seules les entrées
+                écrites depuis ses watermarks sont sauvegardées (incrémental)
+        """
+        try:
+            base_watermarks = {}
+            if since_backup:
+                with open(since_backup, 'r', encoding='utf-8') as f:
+                    base_watermarks = json.load(f).get('watermarks', {})
+
+            l2_level = 'disk' if self.l2_cache is self.disk_cache else 'postgresql'
+            files = []
+            watermarks = {}
+
+            # Sauvegarder la mémoire puis le niveau L2 actif
+            for level, cache in (('memory', self.memory_cache), (l2_level, self.l2_cache)):
+                level_file = f"{filename}_{level}.bin"
+                watermark = cache.backup_data(level_file, since=base_watermarks.get(level))
+                if watermark is not None:
+                    files.append(level_file)
+                    watermarks[level] = watermark
 
             # Fichier d'index
             index_data = {
                 'backup_timestamp': datetime.now().isoformat(),
-                'files': [memory_file, postgresql_file],
+                'base': since_backup,
+                'files': files,
+                'watermarks': watermarks,
                 'stats': self.get_stats()
             }
 
@@ -143,17 +400,25 @@ class AdvancedCache:
             logger.error(f"Backup error: {e}")
 
     def restore_data(self, filename: str):
-        """Restaure les données des deux niveaux"""
+        """Restaure les données des deux niveaux (sauvegarde de base d'abord si incrémentale)"""
         try:
             with open(filename, 'r', encoding='utf-8') as f:
                 index_data = json.load(f)
 
+            if index_data.get('base'):
+                self.restore_data(index_data['base'])
+
             # Restaurer chaque fichier
             for backup_file in index_data.get('files', []):
                 if 'memory' in backup_file:
                     self.memory_cache.restore_data(backup_file)
-                elif 'postgresql' in backup_file:
-                    self.postgresql_cache.restore_data(backup_file)
+                elif 'postgresql' in backup_file or 'disk' in backup_file:
+                    self.l2_cache.restore_data(backup_file)
+                    # Clés écrites hors du bus : filtre et L1 des autres workers resynchronisés
+                    if self.key_filter is not None:
+                        self.key_filter.invalidate()
+                        self._schedule_filter_rebuild()
+                    self._publish_invalidation('resync')
 
             logger.info(f"✅ Advanced cache restored from {filename}")
 
@@ -162,50 +427,151 @@ class AdvancedCache:
 
     # Méthodes avancées
     def get_with_fallback(self, key: str, fallback_func, *args, **kwargs) -> Any:
-        """Récupère avec fallback automatique"""
+        """
+        Récupère avec fallback automatique
+
+        Les appels concurrents sur une clé absente partagent un seul calcul.
+        Avec stale_ttl > 0, une valeur périmée est servie pendant qu'un
+        rafraîchissement tourne en arrière-plan. Avec early_refresh_beta > 0,
+        les lecteurs déclenchent ce rafraîchissement avant l'échéance avec une
+        probabilité qui croît avec le coût du calcul (XFetch), ce qui étale
+        les recalculs d'entrées créées ensemble.
+        """
         value = self.get(key)
 
-        if value is None:
-            # Calculer la valeur
-            value = fallback_func(*args, **kwargs)
+        if value is not None:
+            if self.stale_ttl > 0 and self._is_stale(key):
+                self._schedule_refresh(key, fallback_func, args, kwargs)
+            elif (self.early_refresh_beta > 0
+                    and self.memory_cache.should_refresh_early(key, self.early_refresh_beta)):
+                if self._schedule_refresh(key, fallback_func, args, kwargs):
+                    self.early_refreshes += 1
+            return value
+
+        return self._single_flight.do(
+            key, self._compute_and_store, key, fallback_func, args, kwargs
+        )
 
-            # Cacher pour les futures requêtes
-            self.set(key, value)
+    def _compute_and_store(self, key: str, fallback_func, args: tuple, kwargs: dict) -> Any:
+        """Calcule la valeur et la met en cache avec son échéance de fraîcheur et son coût"""
+        start = time.perf_counter()
+        value = fallback_func(*args, **kwargs)
+        metadata = {COMPUTE_TIME_KEY: time.perf_counter() - start}
+
+        if self.stale_ttl > 0:
+            metadata[FRESH_UNTIL_KEY] = time.time() + self.default_ttl
+            self.set(key, value, ttl=self.default_ttl + self.stale_ttl, metadata=metadata)
+        else:
+            self.set(key, value, metadata=metadata)
 
         return value
 
-    def preload_keys(self, keys: List[str], data_func):
-        """Précharge plusieurs clés"""
-        for key in keys:
-            if self.get(key) is None:
-                try:
-                    value = data_func(key)
-                    self.set(key, value)
-                except Exception as e:
-                    logger.error(f"Preload failed for {key}: {e}")
+    def _is_stale(self, key: str) -> bool:
+        """Vérifie si la valeur en L1 a dépassé sa fenêtre de fraîcheur"""
+        metadata = self.memory_cache.get_metadata(key) or {}
+        fresh_until = metadata.get(FRESH_UNTIL_KEY)
+        return fresh_until is not None and time.time() > fresh_until
+
+    def _schedule_refresh(self, key: str, fallback_func, args: tuple, kwargs: dict) -> bool:
+        """Lance au plus un rafraîchissement en arrière-plan par clé (False si déjà en cours)"""
+        with self._refresh_lock:
+            if key in self._refreshing or self._single_flight.in_flight(key):
+                return False
+            self._refreshing.add(key)
+
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=self._refresh_workers,
+                    thread_name_prefix='cache-refresh'
+                )
+
+        def refresh():
+            try:
+                self._single_flight.do(
+                    key, self._compute_and_store, key, fallback_func, args, kwargs
+                )
+                self.background_refreshes += 1
+            except Exception as e:
+                logger.error(f"Background refresh failed for {key}: {e}")
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        self._refresh_executor.submit(refresh)
+        return True
+
+    def preload_keys(self, keys: List[str], data_func, ttl: Optional[int] = None,
+                     executor: Optional[Executor] = None) -> int:
+        """
+        Précharge plusieurs clés (lecture et écriture par lots), retourne le nombre chargé
+
+        Avec un executor, les clés absentes sont calculées en parallèle sur
+        ses workers ; l'écriture reste un seul set_many.
+        """
+        existing = self.get_many(keys)
+        missing = [key for key in keys if key not in existing]
+
+        futures = {}
+        if executor is not None:
+            futures = {key: executor.submit(data_func, key) for key in missing}
+
+        loaded = {}
+        for key in missing:
+            try:
+                loaded[key] = futures[key].result() if futures else data_func(key)
+            except Exception as e:
+                logger.error(f"Preload failed for {key}: {e}")
+
+        if loaded:
+            self.set_many(loaded, ttl=ttl)
+
+        return len(loaded)
 
     def get_pattern(self, pattern: str) -> Dict[str, Any]:
-        """Récupère toutes les clés correspondant à un pattern (PostgreSQL seulement)"""
-        # Cette fonctionnalité nécessite PostgreSQL avec LIKE
-        if not self.postgresql_cache.pool:
-            return {}
+        """
+        Récupère toutes les entrées dont la clé correspond au motif glob
 
+        Le motif accepte * et ? (ex. ``"veille:v2:*"``). L2 fait foi quand il
+        est disponible ; les valeurs présentes en L1 sont prioritaires.
+        """
         try:
-            # Simulation d'une recherche par pattern
-            # En pratique, nécessiterait une implémentation spécifique
-            return {}
+            found = self.l2_cache.get_pattern(pattern)
+            found.update(self.memory_cache.get_pattern(pattern))
+            return found
         except Exception as e:
             logger.error(f"Pattern search error: {e}")
             return {}
 
+    def invalidate_tag(self, tag: str) -> int:
+        """Supprime des deux niveaux toutes les entrées portant un tag"""
+        memory_deleted = self.memory_cache.delete_tag(tag)
+        l2_deleted = self.l2_cache.delete_tag(tag)
+        self._filter_deleted(l2_deleted)
+        self._publish_invalidation('tag', tag=tag)
+
+        return max(memory_deleted, l2_deleted)
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Supprime des deux niveaux toutes les entrées dont la clé commence par le préfixe"""
+        memory_deleted = self.memory_cache.delete_prefix(prefix)
+        l2_deleted = self.l2_cache.delete_prefix(prefix)
+        self._filter_deleted(l2_deleted)
+        self._publish_invalidation('prefix', prefix=prefix)
+
+        return max(memory_deleted, l2_deleted)
+
     def optimize_for_read(self):
         """Optimise le cache pour les lectures intensives"""
+        # W-TinyLFU : les clés lues souvent résistent aux parcours de clés à usage unique
+        self.memory_cache.set_policy('tinylfu')
         # Augmenter la taille mémoire
         current_size = self.memory_cache.get_max_size()
         self.memory_cache.set_max_size(current_size * 2)
 
     def optimize_for_write(self):
         """Optimise le cache pour les écritures intensives"""
+        # LRU : tenue à jour en O(1), sans sketch de fréquence à chaque écriture
+        self.memory_cache.set_policy('lru')
         # Réduire la taille mémoire pour éviter la surcharge
         current_size = self.memory_cache.get_max_size()
         self.memory_cache.set_max_size(max(100, current_size // 2))
@@ -216,6 +582,7 @@ class AdvancedCache:
             'overall_status': 'healthy',
             'memory_cache': 'healthy',
             'postgresql_cache': 'unavailable',
+            'disk_cache': 'unavailable',
             'timestamp': datetime.now().isoformat()
         }
 
@@ -234,15 +601,24 @@ class AdvancedCache:
             except Exception as e:
                 health['postgresql_cache'] = f'unhealthy: {e}'
 
+        # Vérifier le cache disque
+        if self.disk_cache is not None and self.disk_cache.available:
+            try:
+                self.disk_cache.get('health_check_test')
+                health['disk_cache'] = 'healthy'
+            except Exception as e:
+                health['disk_cache'] = f'unhealthy: {e}'
+
         # Statut global
         if health['memory_cache'] != 'healthy':
             health['overall_status'] = 'unhealthy'
-        elif health['postgresql_cache'] == 'unavailable':
+        elif not self._has_l2():
             health['overall_status'] = 'degraded'
 
         return health
 
 # Fonction de compatibilité
-def get_advanced_cache(connection_string: Optional[str] = None) -> AdvancedCache:
+def get_advanced_cache(connection_string: Optional[str] = None,
+                       memory_policy: str = 'lru') -> AdvancedCache:
     """Fonction de compatibilité pour créer un cache avancé"""
-    return AdvancedCache(connection_string)
+    return AdvancedCache(connection_string, memory_policy=memory_policy)
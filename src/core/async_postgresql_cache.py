@@ -0,0 +1,313 @@
+"""
+Cache PostgreSQL asynchrone (asyncpg)
+Même table que PostgreSQLCache, sans I/O bloquante dans la boucle d'événements
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Dict, Any, Iterable, Optional
+
+try:
+    import asyncpg
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    ASYNCPG_AVAILABLE = False
+
+from .cache_codec import ValueCodec, default_codec
+from .cache_invalidation import INVALIDATION_CHANNEL, build_invalidation_messages
+from .cache_keys import TAGS_METADATA_KEY, glob_to_like, like_prefix
+from .cache_models import CacheStats
+from .postgresql_cache import (
+    CACHE_TABLE_DDL, AccessStatsBuffer, access_stats_update_sql, decode_cached_value
+)
+
+logger = logging.getLogger(__name__)
+
+class AsyncPostgreSQLCache:
+    """
+    Cache PostgreSQL asynchrone pour les handlers de l'API
+
+    Les écritures et suppressions sont publiées sur le canal d'invalidation,
+    dans la transaction qui les applique : les workers AdvancedCache qui
+    partagent la table mettent à jour leur L1 et leur filtre de Bloom.
+    """
+
+    def __init__(self, connection_string: Optional[str] = None,
+                 min_connections: int = 1,
+                 max_connections: int = 20,
+                 max_inactive_connection_lifetime: float = 300.0,
+                 track_access: bool = True,
+                 access_flush_interval: float = 30.0,
+                 codec: Optional[ValueCodec] = None,
+                 invalidation_channel: Optional[str] = INVALIDATION_CHANNEL):
+        self.connection_string = connection_string
+        self.pool = None
+        self.table_name = 'cache_entries'
+        self.stats = CacheStats()
+        self.codec = codec or default_codec
+        self.invalidation_channel = invalidation_channel
+        self.origin = uuid.uuid4().hex
+
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.max_inactive_connection_lifetime = max_inactive_connection_lifetime
+
+        # Statistiques d'accès en écriture différée
+        self.track_access = track_access
+        self.access_flush_interval = access_flush_interval
+        self._access_buffer = AccessStatsBuffer()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def initialize(self) -> bool:
+        """Crée le pool et la table (à appeler au démarrage de l'application)"""
+        if not (ASYNCPG_AVAILABLE and self.connection_string):
+            logger.warning("⚠️ asyncpg not available, async PostgreSQL cache disabled")
+            return False
+
+        try:
+            if not self.pool:
+                self.pool = await asyncpg.create_pool(
+                    self.connection_string,
+                    min_size=self.min_connections,
+                    max_size=self.max_connections,
+                    max_inactive_connection_lifetime=self.max_inactive_connection_lifetime
+                )
+
+            async with self.pool.acquire() as conn:
+                await conn.execute(CACHE_TABLE_DDL.format(table=self.table_name))
+
+            if self.track_access and self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_worker())
+
+            logger.info("✅ Async PostgreSQL cache initialized")
+            return True
+
+        except Exception as e:
+            logger.error(f"❌ Async PostgreSQL initialization failed: {e}")
+            self.pool = None
+            return False
+
+    async def _flush_worker(self):
+        """Vide périodiquement les compteurs d'accès"""
+        while True:
+            await asyncio.sleep(self.access_flush_interval)
+            try:
+                await self.flush_access_stats()
+            except Exception as e:
+                logger.error(f"Async access stats flush error: {e}")
+
+    async def flush_access_stats(self) -> int:
+        """Écrit les compteurs d'accès bufferisés en un seul UPDATE"""
+        if not self.pool or not len(self._access_buffer):
+            return 0
+
+        keys, hits, last_accessed = self._access_buffer.drain()
+
+        try:
+            async with self.pool.acquire() as conn:
+                await conn.execute(
+                    access_stats_update_sql(self.table_name, ('$1', '$2', '$3')),
+                    keys, hits, last_accessed
+                )
+            return len(keys)
+
+        except Exception as e:
+            logger.warning(f"Async access stats flush failed, dropping {len(keys)} counters: {e}")
+            return 0
+
+    async def close(self):
+        """Ferme le pool"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush_access_stats()
+
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
+
+    async def _notify(self, conn, op: str, keys: Optional[Iterable[str]] = None,
+                      tag: Optional[str] = None, prefix: Optional[str] = None):
+        """Publie une invalidation (envoyée au commit de la transaction en cours)"""
+        if self.invalidation_channel is None:
+            return
+        for payload in build_invalidation_messages(self.origin, op, keys=keys, tag=tag, prefix=prefix):
+            await conn.execute("SELECT pg_notify($1, $2)", self.invalidation_channel, payload)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Récupère une valeur du cache"""
+        if not self.pool:
+            return None
+
+        try:
+            async with self.pool.acquire() as conn:
+                row = await conn.fetchrow(f"""
+                    SELECT value, payload FROM {self.table_name}
+                    WHERE key = $1
+                    AND (ttl = 0 OR timestamp + INTERVAL '1 second' * ttl > NOW())
+                """, key)
+
+            if row:
+                if self.track_access:
+                    self._access_buffer.record([key])
+                self.stats.hits += 1
+                return decode_cached_value(row['payload'], row['value'], self.codec)
+
+            self.stats.misses += 1
+            return None
+
+        except Exception as e:
+            logger.error(f"Async cache get error: {e}")
+            return None
+
+    async def set(self, key: str, value: Any, ttl: int = 3600, metadata: Optional[Dict] = None):
+        """Stocke une valeur dans le cache"""
+        if not self.pool:
+            return
+
+        try:
+            async with self.pool.acquire() as conn, conn.transaction():
+                await conn.execute(f"""
+                    INSERT INTO {self.table_name} (key, value, payload, ttl, metadata)
+                    VALUES ($1, NULL, $2, $3, $4::jsonb)
+                    ON CONFLICT (key) DO UPDATE SET
+                        value = NULL,
+                        payload = EXCLUDED.payload,
+                        timestamp = NOW(),
+                        ttl = EXCLUDED.ttl,
+                        metadata = EXCLUDED.metadata,
+                        access_count = 0,
+                        last_accessed = NULL
+                """, key, self.codec.encode(value), ttl, json.dumps(metadata or {}))
+                await self._notify(conn, 'set', keys=[key])
+
+        except Exception as e:
+            logger.error(f"Async cache set error: {e}")
+
+    async def delete(self, key: str) -> bool:
+        """Supprime une entrée du cache"""
+        if not self.pool:
+            return False
+
+        try:
+            async with self.pool.acquire() as conn, conn.transaction():
+                status = await conn.execute(
+                    f"DELETE FROM {self.table_name} WHERE key = $1", key
+                )
+                await self._notify(conn, 'keys', keys=[key])
+            return status.endswith(' 1')
+
+        except Exception as e:
+            logger.error(f"Async cache delete error: {e}")
+            return False
+
+    async def get_pattern(self, pattern: str) -> Dict[str, Any]:
+        """Récupère les valeurs dont la clé correspond au motif glob"""
+        if not self.pool:
+            return {}
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(f"""
+                    SELECT key, value, payload FROM {self.table_name}
+                    WHERE key LIKE $1 ESCAPE '\\'
+                    AND (ttl = 0 OR timestamp + INTERVAL '1 second' * ttl > NOW())
+                """, glob_to_like(pattern))
+
+            return {
+                row['key']: decode_cached_value(row['payload'], row['value'], self.codec)
+                for row in rows
+            }
+
+        except Exception as e:
+            logger.error(f"Async cache get_pattern error: {e}")
+            return {}
+
+    async def delete_tag(self, tag: str) -> int:
+        """Supprime les entrées portant un tag"""
+        if not self.pool:
+            return 0
+
+        try:
+            async with self.pool.acquire() as conn, conn.transaction():
+                status = await conn.execute(
+                    f"DELETE FROM {self.table_name} WHERE metadata @> $1::jsonb",
+                    json.dumps({TAGS_METADATA_KEY: [tag]})
+                )
+                await self._notify(conn, 'tag', tag=tag)
+            return int(status.split()[-1])
+
+        except Exception as e:
+            logger.error(f"Async cache delete_tag error: {e}")
+            return 0
+
+    async def delete_prefix(self, prefix: str) -> int:
+        """Supprime les entrées dont la clé commence par le préfixe"""
+        if not self.pool:
+            return 0
+
+        try:
+            async with self.pool.acquire() as conn, conn.transaction():
+                status = await conn.execute(
+                    f"DELETE FROM {self.table_name} WHERE key LIKE $1 ESCAPE '\\'",
+                    like_prefix(prefix)
+                )
+                await self._notify(conn, 'prefix', prefix=prefix)
+            return int(status.split()[-1])
+
+        except Exception as e:
+            logger.error(f"Async cache delete_prefix error: {e}")
+            return 0
+
+    async def clear(self):
+        """Vide complètement le cache"""
+        if not self.pool:
+            return
+
+        try:
+            async with self.pool.acquire() as conn, conn.transaction():
+                await conn.execute(f"TRUNCATE TABLE {self.table_name}")
+                await self._notify(conn, 'clear')
+
+        except Exception as e:
+            logger.error(f"Async cache clear error: {e}")
+
+    async def cleanup_expired(self) -> int:
+        """Nettoie les entrées expirées"""
+        if not self.pool:
+            return 0
+
+        try:
+            async with self.pool.acquire() as conn:
+                status = await conn.execute(f"""
+                    DELETE FROM {self.table_name}
+                    WHERE ttl > 0 AND timestamp + INTERVAL '1 second' * ttl < NOW()
+                """)
+            deleted_count = int(status.split()[-1])
+            self.stats.evictions += deleted_count
+            return deleted_count
+
+        except Exception as e:
+            logger.error(f"Async cache cleanup error: {e}")
+            return 0
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Retourne les statistiques du cache"""
+        if not self.pool:
+            return self.stats.to_dict()
+
+        try:
+            async with self.pool.acquire() as conn:
+                self.stats.total_entries = await conn.fetchval(
+                    f"SELECT COUNT(*) FROM {self.table_name}"
+                )
+
+        except Exception as e:
+            logger.error(f"Async stats retrieval error: {e}")
+
+        stats = self.stats.to_dict()
+        stats['pool_size'] = self.pool.get_size()
+        stats['pool_idle'] = self.pool.get_idle_size()
+        return stats
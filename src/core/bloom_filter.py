@@ -0,0 +1,180 @@
+"""
+Filtre de Bloom des clés présentes en L2
+Évite l'aller-retour PostgreSQL pour les absences certaines
+"""
+
+import hashlib
+import logging
+import math
+import threading
+from typing import Any, Dict, Iterable
+
+logger = logging.getLogger(__name__)
+
+class BloomFilter:
+    """Filtre de Bloom (double hachage blake2b), sans suppression"""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be > 0 and 0 < error_rate < 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # Taille optimale : m = -n ln(p) / ln(2)^2, k = m/n ln(2)
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        """Positions des bits d'une clé (h1 + i * h2)"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str):
+        """Ajoute une clé (une clé déjà présente, ou un faux positif, ne compte pas)"""
+        added = False
+        for position in self._positions(key):
+            mask = 1 << (position & 7)
+            if not self.bits[position >> 3] & mask:
+                self.bits[position >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    def estimated_false_positive_rate(self) -> float:
+        """Taux de faux positifs théorique pour le nombre de clés ajoutées"""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+class KeyPresenceFilter:
+    """
+    Filtre des clés connues de L2, reconstruit à partir d'un scan des clés
+
+    Tant que le premier scan n'est pas terminé, toutes les clés sont
+    considérées comme possibles. Un filtre de Bloom ne supporte pas la
+    suppression : les clés supprimées ou expirées restent des faux positifs
+    jusqu'à la prochaine reconstruction, déclenchée quand ils s'accumulent.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        self._rebuilding = None
+        self._lock = threading.Lock()
+        self.ready = False
+        # Incrémentée à chaque invalidation : un scan démarré avant reste incomplet
+        self._generation = 0
+
+        self.deletions = 0
+        self.rebuilds = 0
+        # Négatifs certains (L2 évité) et faux positifs observés (L2 interrogé pour rien)
+        self.skipped = 0
+        self.false_positives = 0
+
+    def add(self, key: str):
+        """Enregistre une clé écrite en L2"""
+        with self._lock:
+            self._filter.add(key)
+            if self._rebuilding is not None:
+                self._rebuilding.add(key)
+
+    def add_many(self, keys: Iterable[str]):
+        """Enregistre plusieurs clés écrites en L2"""
+        with self._lock:
+            for key in keys:
+                self._filter.add(key)
+                if self._rebuilding is not None:
+                    self._rebuilding.add(key)
+
+    def record_deletions(self, count: int):
+        """Comptabilise des suppressions (les bits restent positionnés)"""
+        with self._lock:
+            self.deletions += count
+
+    def might_contain(self, key: str) -> bool:
+        """False seulement si la clé est certainement absente de L2"""
+        if not self.ready:
+            return True
+        if key in self._filter:
+            return True
+        self.skipped += 1
+        return False
+
+    def record_false_positive(self):
+        """Le filtre a laissé passer une clé absente de L2"""
+        self.false_positives += 1
+
+    def needs_rebuild(self) -> bool:
+        """Vrai quand la saturation ou les suppressions dégradent le filtre"""
+        with self._lock:
+            current = self._filter
+            return self.ready and self._rebuilding is None and (
+                current.count > current.capacity or self.deletions > current.capacity // 2
+            )
+
+    def invalidate(self):
+        """Désactive le filtre jusqu'à la prochaine reconstruction (écritures manquées)"""
+        with self._lock:
+            self.ready = False
+            self._generation += 1
+
+    def rebuild(self, keys: Iterable[str], expected: int = 0) -> int:
+        """
+        Reconstruit le filtre à partir d'un scan des clés de L2
+
+        Les clés ajoutées pendant le scan sont reportées dans le nouveau filtre.
+        Si le filtre est invalidé pendant le scan, il reste non prêt.
+        Retourne le nombre de clés scannées.
+        """
+        capacity = max(self.capacity, 2 * expected)
+        new_filter = BloomFilter(capacity, self.error_rate)
+
+        with self._lock:
+            self._rebuilding = new_filter
+            generation = self._generation
+
+        scanned = 0
+        try:
+            for key in keys:
+                with self._lock:
+                    new_filter.add(key)
+                scanned += 1
+        except Exception:
+            with self._lock:
+                self._rebuilding = None
+            raise
+
+        with self._lock:
+            self._filter = new_filter
+            self._rebuilding = None
+            self.deletions = 0
+            self.rebuilds += 1
+            self.ready = generation == self._generation
+
+        return scanned
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques du filtre (taux de faux positifs observé et théorique)"""
+        negatives = self.skipped + self.false_positives
+        return {
+            'ready': self.ready,
+            'keys': self._filter.count,
+            'capacity': self._filter.capacity,
+            'size_bytes': len(self._filter.bits),
+            'skipped_lookups': self.skipped,
+            'false_positives': self.false_positives,
+            'false_positive_rate': self.false_positives / negatives if negatives else 0.0,
+            'estimated_false_positive_rate': self._filter.estimated_false_positive_rate(),
+            'deletions': self.deletions,
+            'rebuilds': self.rebuilds
+        }
@@ -4,72 +4,145 @@ Handles caching of veille data and other frequently accessed information
 """
 
 import asyncio
+import functools
 import time
-from typing import Dict, List, Optional, Any
+import zlib
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 
+from .cache_keys import make_key, function_namespace
+from .memory_cache import estimate_size
+from .single_flight import AsyncSingleFlight
+
+VEILLE_CACHE_VERSION = 1
+WEEKLY_CACHE_VERSION = 1
+
+class CacheShard:
+    """Shard of the async cache, guarded by its own lock"""
+
+    __slots__ = ('entries', 'expires', 'sizes', 'bytes', 'lock')
+
+    def __init__(self):
+        self.entries: Dict[str, Any] = {}
+        self.expires: Dict[str, float] = {}
+        self.sizes: Dict[str, int] = {}
+        self.bytes = 0
+        self.lock = asyncio.Lock()
+
+    def remove(self, key: str) -> bool:
+        """Remove a key and release its size (caller holds the lock)"""
+        if key not in self.entries:
+            return False
+        del self.entries[key]
+        del self.expires[key]
+        self.bytes -= self.sizes.pop(key)
+        return True
+
 class CacheManager:
-    """Manages caching for the Revolver AI Bot"""
+    """Manages caching for the Revolver AI Bot
+
+    Keys are spread over lock-striped shards so concurrent coroutines only
+    contend when they touch the same shard.
+    """
     
-    def __init__(self):
-        self._cache = {}
-        self._ttl = {}
-        self._lock = asyncio.Lock()
+    def __init__(self, num_shards: int = 16, max_size: Optional[int] = None):
+        self._shards = [CacheShard() for _ in range(num_shards)]
+        self.max_size = max_size
+        # Per-shard capacity, oldest insertion is evicted first
+        self._shard_capacity = -(-max_size // num_shards) if max_size else None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def _shard_for(self, key: str) -> CacheShard:
+        """Pick the shard owning a key (stable across processes)"""
+        return self._shards[zlib.crc32(key.encode()) % len(self._shards)]
     
     async def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         """Set a value in cache with TTL"""
-        async with self._lock:
-            self._cache[key] = value
-            self._ttl[key] = time.time() + ttl
+        shard = self._shard_for(key)
+        size = estimate_size(value)
+        async with shard.lock:
+            shard.remove(key)
+            if self._shard_capacity and len(shard.entries) >= self._shard_capacity:
+                shard.remove(next(iter(shard.entries)))
+                self.evictions += 1
+            shard.entries[key] = value
+            shard.expires[key] = time.monotonic() + ttl
+            shard.sizes[key] = size
+            shard.bytes += size
             return True
     
     async def get(self, key: str) -> Optional[Any]:
         """Get a value from cache"""
-        async with self._lock:
-            if key not in self._cache:
+        shard = self._shard_for(key)
+        async with shard.lock:
+            if key not in shard.entries:
+                self.misses += 1
                 return None
             
-            if time.time() > self._ttl.get(key, 0):
-                del self._cache[key]
-                del self._ttl[key]
+            if time.monotonic() > shard.expires[key]:
+                shard.remove(key)
+                self.evictions += 1
+                self.misses += 1
                 return None
             
-            return self._cache[key]
+            self.hits += 1
+            return shard.entries[key]
     
     async def clear(self) -> int:
         """Clear all cache entries"""
-        async with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
-            self._ttl.clear()
-            return count
+        count = 0
+        for shard in self._shards:
+            async with shard.lock:
+                count += len(shard.entries)
+                shard.entries.clear()
+                shard.expires.clear()
+                shard.sizes.clear()
+                shard.bytes = 0
+        return count
     
     async def delete(self, key: str) -> bool:
         """Delete a specific key"""
-        async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                del self._ttl[key]
-                return True
-            return False
+        shard = self._shard_for(key)
+        async with shard.lock:
+            return shard.remove(key)
+    
+    def get_stats_snapshot(self) -> Dict[str, Any]:
+        """Lock-free statistics snapshot (counters are updated on the event loop)"""
+        total = self.hits + self.misses
+        return {
+            "cache_size": sum(len(shard.entries) for shard in self._shards),
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+            "memory_usage": sum(shard.bytes for shard in self._shards),
+            "shards": len(self._shards),
+            "timestamp": datetime.now().isoformat()
+        }
     
     async def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        async with self._lock:
-            return {
-                "cache_size": len(self._cache),
-                "cache_hits": 0,  # TODO: Implement hit tracking
-                "cache_misses": 0,  # TODO: Implement miss tracking
-                "memory_usage": len(str(self._cache)),
-                "timestamp": datetime.now().isoformat()
-            }
+        return self.get_stats_snapshot()
 
 # Global cache instance
 cache_manager = CacheManager()
+# Shared by every event loop: in-flight calls are tracked per loop
+_single_flight = AsyncSingleFlight()
+
+def veille_cache_key(competitors: List[str], date: str) -> str:
+    """Stable cache key for a veille run"""
+    return make_key("veille", date=date, competitors=competitors, version=VEILLE_CACHE_VERSION)
+
+def weekly_cache_key(competitors: List[str], date: str, theme: str) -> str:
+    """Stable cache key for a weekly report (shared AdvancedCache, see /weekly)"""
+    return make_key("weekly", date=date, competitors=competitors, theme=theme,
+                    version=WEEKLY_CACHE_VERSION)
 
 async def cache_veille_data(competitors: List[str], date: str) -> Dict:
     """Cache veille data for competitors"""
-    key = f"veille_{date}_{'_'.join(competitors)}"
+    key = veille_cache_key(competitors, date)
     data = {
         "competitors": competitors,
         "date": date,
@@ -79,19 +152,71 @@ async def cache_veille_data(competitors: List[str], date: str) -> Dict:
     await cache_manager.set(key, data, ttl=86400)  # 24 hours
     return data
 
+# Marks a stale-while-revalidate envelope: a plain result dict that happens
+# to hold "value" and "fresh_until" keys is not mistaken for one
+STALE_ENVELOPE_KEY = "__cache_envelope__"
+
+def _stale_envelope(result: Any, fresh_until: float) -> Dict[str, Any]:
+    """Wrap a result with the time until which it is fresh"""
+    return {STALE_ENVELOPE_KEY: 1, "value": result, "fresh_until": fresh_until}
+
+def _is_stale_envelope(cached: Any) -> bool:
+    """True if a cached value is a stale-while-revalidate envelope"""
+    return (isinstance(cached, dict) and cached.get(STALE_ENVELOPE_KEY) == 1
+            and cached.keys() == {STALE_ENVELOPE_KEY, "value", "fresh_until"}
+            and isinstance(cached["fresh_until"], (int, float)))
+
+def cache_result(ttl: int = 3600, namespace: Optional[str] = None, version: int = 1,
+                 stale_ttl: int = 0, key: Optional[Callable[..., Any]] = None):
+    """Cache the result of an async function
+
+    Keys are derived from a canonical serialization of the arguments, so
+    the same call hits the cache across workers and restarts. Bump
+    ``version`` to invalidate results computed by an older implementation.
+    Arguments without a canonical form (arbitrary objects) raise TypeError:
+    pass ``key``, called with the same arguments, to return the values
+    that identify the call instead.
+
+    Concurrent misses on the same key share a single call. With
+    ``stale_ttl`` > 0, an expired result is still served for that many
+    seconds while one background task recomputes it.
+    """
     def decorator(func):
+        key_namespace = namespace or function_namespace(func)
+
+        def build_key(args, kwargs):
+            # One opaque payload: the caller's own 'version' or 'namespace' arguments cannot clash
+            payload = key(*args, **kwargs) if key is not None else [args, kwargs]
+            return make_key(key_namespace, payload, version=version)
+
+        async def compute_and_store(cache_key, args, kwargs):
+            result = await func(*args, **kwargs)
+            if stale_ttl > 0:
+                await cache_manager.set(cache_key, _stale_envelope(result, time.time() + ttl),
+                                        ttl + stale_ttl)
+            else:
+                await cache_manager.set(cache_key, result, ttl)
+            return result
+
+        @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            # Create cache key from function name and arguments
-            key = f"{func.__name__}_{hash(str(args) + str(kwargs))}"
+            cache_key = build_key(args, kwargs)
             
             # Try to get from cache
-            cached_result = await cache_manager.get(key)
+            cached_result = await cache_manager.get(cache_key)
             if cached_result is not None:
-                return cached_result
+                if stale_ttl <= 0:
+                    return cached_result
+                # A value stored without the freshness envelope is recomputed
+                if _is_stale_envelope(cached_result):
+                    if time.time() > cached_result["fresh_until"]:
+                        _single_flight.do_background(cache_key, compute_and_store, cache_key, args, kwargs)
+                    return cached_result["value"]
             
-            # Execute function and cache result
-            result = await func(*args, **kwargs)
-            await cache_manager.set(key, result, ttl)
-            return result
+            # Execute function once for all concurrent callers and cache result
+            return await _single_flight.do(cache_key, compute_and_store, cache_key, args, kwargs)
         return wrapper
     return decorator
+
+# Backward-compatible alias
+cached = cache_result
@@ -0,0 +1,109 @@
+"""
+Encodage binaire des valeurs de cache
+Sérialisation (pickle protocole 5 ou JSON) + compression au-delà d'un seuil
+"""
+
+import json
+import logging
+import pickle
+import zlib
+from typing import Any, Optional
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# En-tête : magic (2 octets) + version + sérialiseur + compression
+CODEC_MAGIC = b'RC'
+CODEC_VERSION = 1
+HEADER_SIZE = 5
+
+SERIALIZERS = {'pickle': 1, 'json': 2}
+COMPRESSIONS = {'none': 0, 'zlib': 1, 'zstd': 2}
+
+class ValueCodec:
+    """
+    Codec de valeurs pour les niveaux de cache et les sauvegardes
+
+    pickle conserve les types Python (datetime, dataclasses comme Article
+    ou VisionAnalysis) ; json reste disponible pour des données lisibles
+    par d'autres outils. Les données ne doivent provenir que de nos propres
+    caches : pickle n'est pas sûr face à des entrées non fiables.
+    """
+
+    def __init__(self, serializer: str = 'pickle', compression: str = 'auto',
+                 compress_threshold: int = 1024, level: Optional[int] = None):
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"Unknown serializer: {serializer}")
+
+        if compression == 'auto':
+            compression = 'zstd' if ZSTD_AVAILABLE else 'zlib'
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+        if compression == 'zstd' and not ZSTD_AVAILABLE:
+            logger.warning("⚠️ zstandard not available, falling back to zlib")
+            compression = 'zlib'
+
+        self.serializer = serializer
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self.level = level
+
+    def encode(self, value: Any) -> bytes:
+        """Sérialise puis compresse si la charge dépasse le seuil"""
+        if self.serializer == 'pickle':
+            payload = pickle.dumps(value, protocol=5)
+        else:
+            payload = json.dumps(value, default=str, separators=(',', ':')).encode('utf-8')
+
+        compression = 'none'
+        if self.compression != 'none' and len(payload) >= self.compress_threshold:
+            compressed = _compress(payload, self.compression, self.level)
+            # Garder la version brute si la compression ne gagne rien
+            if len(compressed) < len(payload):
+                payload = compressed
+                compression = self.compression
+
+        header = CODEC_MAGIC + bytes((
+            CODEC_VERSION, SERIALIZERS[self.serializer], COMPRESSIONS[compression]
+        ))
+        return header + payload
+
+    def decode(self, data: bytes) -> Any:
+        """Décode une valeur, quel que soit le codec qui l'a produite"""
+        data = bytes(data)
+        if not is_encoded(data):
+            raise ValueError("Not an encoded cache value")
+
+        serializer_id, compression_id = data[3], data[4]
+        payload = memoryview(data)[HEADER_SIZE:]
+
+        if compression_id == COMPRESSIONS['zlib']:
+            payload = zlib.decompress(payload)
+        elif compression_id == COMPRESSIONS['zstd']:
+            if not ZSTD_AVAILABLE:
+                raise ValueError("zstandard is required to decode this value")
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+
+        if serializer_id == SERIALIZERS['pickle']:
+            return pickle.loads(payload)
+        if serializer_id == SERIALIZERS['json']:
+            return json.loads(bytes(payload))
+        raise ValueError(f"Unknown serializer id: {serializer_id}")
+
+def _compress(payload: bytes, compression: str, level: Optional[int]) -> bytes:
+    """Compresse une charge avec l'algorithme demandé"""
+    if compression == 'zstd':
+        return zstandard.ZstdCompressor(level=level if level is not None else 3).compress(payload)
+    return zlib.compress(payload, level if level is not None else 6)
+
+def is_encoded(data: bytes) -> bool:
+    """Indique si des octets ont été produits par ValueCodec"""
+    return len(data) >= HEADER_SIZE and data[:2] == CODEC_MAGIC and data[2] == CODEC_VERSION
+
+# Codec par défaut partagé par les niveaux de cache
+default_codec = ValueCodec()
@@ -0,0 +1,201 @@
+"""
+Cohérence du cache L1 entre workers (PostgreSQL LISTEN/NOTIFY)
+Chaque worker publie ses invalidations et retire les clés concernées de son L1
+"""
+
+import json
+import logging
+import select
+import threading
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    import psycopg2
+    from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+    POSTGRESQL_AVAILABLE = True
+except ImportError:
+    POSTGRESQL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = 'cache_invalidation'
+
+# NOTIFY refuse les charges de 8000 octets ou plus
+MAX_NOTIFY_PAYLOAD = 7500
+
+def build_invalidation_messages(origin: str, op: str, keys: Optional[Iterable[str]] = None,
+                                tag: Optional[str] = None,
+                                prefix: Optional[str] = None) -> List[str]:
+    """
+    Construit les charges NOTIFY d'une invalidation
+
+    Args:
+        origin: Identifiant du worker émetteur (ignoré à la réception)
+        op: 'set' (clés écrites), 'keys' (clés supprimées), 'tag', 'prefix', 'clear' ou 'resync'
+
+    Returns:
+        Charges JSON, les listes de clés étant découpées sous la limite de NOTIFY
+    """
+    if op not in ('set', 'keys'):
+        message = {'origin': origin, 'op': op}
+        if tag is not None:
+            message['tag'] = tag
+        if prefix is not None:
+            message['prefix'] = prefix
+        return [json.dumps(message, separators=(',', ':'))]
+
+    messages = []
+    chunk: List[str] = []
+    base_size = len(json.dumps({'origin': origin, 'op': op, 'keys': []}, separators=(',', ':')))
+    size = base_size
+
+    for key in keys or ():
+        key_size = len(json.dumps(key).encode('utf-8')) + 1
+        if chunk and size + key_size > MAX_NOTIFY_PAYLOAD:
+            messages.append(json.dumps({'origin': origin, 'op': op, 'keys': chunk}, separators=(',', ':')))
+            chunk, size = [], base_size
+        chunk.append(key)
+        size += key_size
+
+    if chunk:
+        messages.append(json.dumps({'origin': origin, 'op': op, 'keys': chunk}, separators=(',', ':')))
+
+    return messages
+
+class CacheInvalidationBus:
+    """
+    Bus d'invalidation L1 sur un canal PostgreSQL
+
+    L'écoute utilise une connexion dédiée en autocommit dans un thread de
+    fond. Après une reconnexion, des notifications ont pu être perdues :
+    on_message reçoit alors un 'resync' pour repartir d'un L1 vide.
+    """
+
+    def __init__(self, connection_string: str,
+                 on_message: Callable[[Dict[str, Any]], None],
+                 notify: Callable[[str, List[str]], int],
+                 channel: str = INVALIDATION_CHANNEL,
+                 poll_interval: float = 5.0,
+                 reconnect_delay: float = 1.0,
+                 max_reconnect_delay: float = 30.0):
+        self.connection_string = connection_string
+        self.on_message = on_message
+        self._notify = notify
+        self.channel = channel
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        # Identifie ce worker pour ignorer ses propres notifications
+        self.origin = uuid.uuid4().hex
+        self.connected = False
+
+        self.published = 0
+        self.received = 0
+        self.resyncs = 0
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Démarre le thread d'écoute"""
+        if not POSTGRESQL_AVAILABLE or self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen_loop, name='cache-invalidation', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Arrête le thread d'écoute"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout if timeout is not None else self.poll_interval + 1)
+            self._thread = None
+
+    def publish(self, op: str, keys: Optional[Iterable[str]] = None,
+                tag: Optional[str] = None, prefix: Optional[str] = None):
+        """Publie une invalidation vers les autres workers"""
+        messages = build_invalidation_messages(self.origin, op, keys=keys, tag=tag, prefix=prefix)
+        if not messages:
+            return
+
+        try:
+            self.published += self._notify(self.channel, messages)
+        except Exception as e:
+            logger.warning(f"Cache invalidation publish failed: {e}")
+
+    def handle_payload(self, payload: str):
+        """Décode une notification et la transmet (sauf si elle vient de ce worker)"""
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Invalid cache invalidation payload: {payload[:100]}")
+            return
+
+        if message.get('origin') == self.origin:
+            return
+
+        self.received += 1
+        self._dispatch(message)
+
+    def _dispatch(self, message: Dict[str, Any]):
+        """Applique une invalidation sans interrompre l'écoute en cas d'erreur"""
+        try:
+            self.on_message(message)
+        except Exception as e:
+            logger.error(f"Cache invalidation handler error: {e}")
+
+    def _listen_loop(self):
+        """Écoute le canal et se reconnecte avec backoff exponentiel"""
+        delay = self.reconnect_delay
+        first_connection = True
+
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = psycopg2.connect(self.connection_string)
+                conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self.channel}"')
+
+                self.connected = True
+                delay = self.reconnect_delay
+                if not first_connection:
+                    # Notifications manquées pendant la coupure : resynchroniser
+                    self.resyncs += 1
+                    self._dispatch({'op': 'resync'})
+                first_connection = False
+
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], self.poll_interval) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self.handle_payload(conn.notifies.pop(0).payload)
+
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener error, reconnecting in {delay:.0f}s: {e}")
+                self._stop.wait(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+            finally:
+                self.connected = False
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne les statistiques du bus"""
+        return {
+            'channel': self.channel,
+            'connected': self.connected,
+            'published': self.published,
+            'received': self.received,
+            'resyncs': self.resyncs
+        }
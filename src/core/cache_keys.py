@@ -0,0 +1,139 @@
+"""
+Clés de cache déterministes
+Sérialisation canonique des arguments + empreinte blake2b, stables entre
+processus, workers et redémarrages (contrairement à hash()).
+"""
+
+import dataclasses
+import hashlib
+import json
+import re
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
+from typing import Any, Callable, Iterable, List, Optional, Pattern
+from uuid import UUID
+
+KEY_DIGEST_SIZE = 16  # 128 bits, 32 caractères hexadécimaux
+
+def _canonical_default(obj: Any) -> Any:
+    """
+    Convertit les types non JSON en une forme stable et typée
+
+    Raises:
+        TypeError: Objet sans forme canonique
+    """
+    if isinstance(obj, (datetime, date, time)):
+        return {'__type__': type(obj).__name__, 'value': obj.isoformat()}
+    if isinstance(obj, (set, frozenset)):
+        return {'__type__': 'set', 'value': sorted(canonical_serialize(item).decode() for item in obj)}
+    if isinstance(obj, (bytes, bytearray)):
+        return {'__type__': 'bytes', 'value': bytes(obj).hex()}
+    if isinstance(obj, Enum):
+        return {'__type__': type(obj).__qualname__, 'value': obj.value}
+    if isinstance(obj, (Decimal, UUID, PurePath)):
+        return {'__type__': type(obj).__name__, 'value': str(obj)}
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {'__type__': type(obj).__qualname__, 'value': dataclasses.asdict(obj)}
+    if hasattr(obj, 'model_dump'):
+        return {'__type__': type(obj).__qualname__, 'value': obj.model_dump()}
+    # Pas de repli sur repr() (adresse mémoire) ni vars() (tout l'état de l'instance)
+    raise TypeError(
+        f"Cannot build a cache key from {type(obj).__qualname__}: "
+        f"pass a canonical value or an explicit key function"
+    )
+
+def canonical_serialize(obj: Any) -> bytes:
+    """Sérialise une valeur de façon canonique (clés triées, séparateurs fixes)"""
+    return json.dumps(
+        obj,
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False,
+        default=_canonical_default
+    ).encode('utf-8')
+
+def make_key(namespace: str, *args: Any, version: int = 1, **kwargs: Any) -> str:
+    """
+    Construit une clé de cache stable
+
+    Args:
+        namespace: Préfixe logique (module.fonction, domaine...)
+        version: Version du calcul, à incrémenter pour invalider les anciennes clés
+
+    Returns:
+        Clé de la forme ``namespace:v<version>:<blake2b>``
+
+    Raises:
+        TypeError: Argument sans forme canonique
+    """
+    payload = canonical_serialize({'args': list(args), 'kwargs': kwargs})
+    digest = hashlib.blake2b(payload, digest_size=KEY_DIGEST_SIZE).hexdigest()
+    return f"{namespace}:v{version}:{digest}"
+
+def function_namespace(func: Callable) -> str:
+    """Retourne l'espace de noms d'une fonction (module.qualname)"""
+    return f"{func.__module__}.{func.__qualname__}"
+
+# Métadonnée portant les tags d'une entrée (indexée par chaque niveau)
+TAGS_METADATA_KEY = 'tags'
+
+# Jokers supportés : * (toute suite) et ? (un caractère)
+GLOB_WILDCARDS = '*?'
+
+def key_namespace(key: str) -> str:
+    """Espace de noms d'une clé (segment avant le premier ':')"""
+    return key.split(':', 1)[0]
+
+def pattern_prefix(pattern: str) -> str:
+    """Préfixe littéral d'un motif glob (avant le premier joker)"""
+    for i, char in enumerate(pattern):
+        if char in GLOB_WILDCARDS:
+            return pattern[:i]
+    return pattern
+
+def glob_to_like(pattern: str) -> str:
+    """Traduit un motif glob (* et ?) en motif SQL LIKE échappé par '\\'"""
+    translated = []
+    for char in pattern:
+        if char in ('\\', '%', '_'):
+            translated.append('\\' + char)
+        elif char == '*':
+            translated.append('%')
+        elif char == '?':
+            translated.append('_')
+        else:
+            translated.append(char)
+    return ''.join(translated)
+
+def like_prefix(prefix: str) -> str:
+    """Motif SQL LIKE sélectionnant les clés qui commencent par un préfixe littéral"""
+    escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return escaped + '%'
+
+def glob_to_regex(pattern: str) -> Pattern[str]:
+    """Compile un motif glob (* et ?) en expression régulière ancrée"""
+    translated = []
+    for char in pattern:
+        if char == '*':
+            translated.append('.*')
+        elif char == '?':
+            translated.append('.')
+        else:
+            translated.append(re.escape(char))
+    return re.compile(''.join(translated) + r'\Z', re.DOTALL)
+
+def entry_tags(metadata: Optional[dict]) -> List[str]:
+    """Tags portés par les métadonnées d'une entrée"""
+    if not metadata:
+        return []
+    return list(metadata.get(TAGS_METADATA_KEY) or [])
+
+def with_tags(metadata: Optional[dict], tags: Optional[Iterable[str]]) -> Optional[dict]:
+    """Ajoute des tags aux métadonnées (copie, tags dédoublonnés et triés)"""
+    if not tags:
+        return metadata
+    merged = dict(metadata or {})
+    merged[TAGS_METADATA_KEY] = sorted(set(entry_tags(merged)) | set(tags))
+    return merged
@@ -2,10 +2,16 @@
 Modèles de données pour le système de cache
 """
 
+import math
+import time
 from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
+def remaining_ttl(seconds: float) -> int:
+    """TTL entier restant d'une entrée non expirée (au moins 1 : 0 signifierait sans expiration)"""
+    return max(1, math.ceil(seconds))
+
 @dataclass
 class CacheEntry:
     """Entrée de cache standardisée"""
@@ -16,12 +22,26 @@ class CacheEntry:
     metadata: Dict[str, Any]
     access_count: int = 0
     last_accessed: Optional[datetime] = None
+    size: int = 0  # Taille estimée de la valeur en octets
+    # Échéance sur l'horloge monotone (inf = jamais), calculée une seule fois
+    expires_at: Optional[float] = field(default=None, compare=False)
 
-    def is_expired(self) -> bool:
-        """Vérifie si l'entrée est expirée"""
+    def __post_init__(self):
+        if self.expires_at is None:
+            self.expires_at = self._compute_expires_at()
+
+    def _compute_expires_at(self) -> float:
+        """Convertit timestamp + ttl en échéance monotone"""
         if self.ttl <= 0:
-            return False
-        return (datetime.now() - self.timestamp).total_seconds() > self.ttl
+            return math.inf
+        age = (datetime.now() - self.timestamp).total_seconds()
+        return time.monotonic() + self.ttl - age
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Vérifie si l'entrée est expirée"""
+        if now is None:
+            now = time.monotonic()
+        return now > self.expires_at
 
     def to_dict(self) -> Dict[str, Any]:
         """Convertit en dictionnaire"""
@@ -54,8 +74,12 @@ class CacheStats:
     total_entries: int = 0
     hits: int = 0
     misses: int = 0
-    evictions: int = 0
+    evictions: int = 0  # capacité et expiration
     total_access_time: float = 0.0
+    total_bytes: int = 0
+    eviction_time: float = 0.0
+    # Évictions pour capacité seules (celles mesurées par eviction_time)
+    capacity_evictions: int = 0
 
     @property
     def hit_rate(self) -> float:
@@ -71,5 +95,10 @@ class CacheStats:
             'misses': self.misses,
             'evictions': self.evictions,
             'hit_rate': self.hit_rate,
-            'total_access_time': self.total_access_time
+            'total_access_time': self.total_access_time,
+            'total_bytes': self.total_bytes,
+            'eviction_time': self.eviction_time,
+            'capacity_evictions': self.capacity_evictions,
+            'avg_eviction_time': (self.eviction_time / self.capacity_evictions
+                                  if self.capacity_evictions else 0.0)
         }
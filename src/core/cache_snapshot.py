@@ -0,0 +1,151 @@
+"""
+Instantanés de cache en flux (écrits et relus entrée par entrée)
+Format binaire : magic, puis des trames longueur + enregistrement ValueCodec
+"""
+
+import logging
+import os
+import struct
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+from .cache_codec import ValueCodec, default_codec
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b'RCSNAP1\n'
+FRAME_HEADER = struct.Struct('>I')
+
+# Les écritures en cours au début d'un instantané peuvent porter un horodatage
+# légèrement antérieur : l'instantané incrémental suivant recouvre cette marge
+WATERMARK_OVERLAP = 5.0
+
+def is_snapshot(filename: str) -> bool:
+    """Vrai si le fichier est un instantané en flux (et non une ancienne sauvegarde)"""
+    try:
+        with open(filename, 'rb') as f:
+            return f.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+    except OSError:
+        return False
+
+def to_epoch(value: Any) -> Optional[float]:
+    """Convertit un horodatage (datetime, ISO 8601 ou epoch) en secondes epoch"""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
+
+class SnapshotWriter:
+    """
+    Écrit un instantané entrée par entrée
+
+    Le fichier est écrit à côté de sa destination puis renommé à la
+    fermeture : un instantané interrompu ne remplace jamais le précédent.
+
+    Chaque enregistrement porte key, payload (valeur déjà encodée par
+    ValueCodec), timestamp et last_accessed (epoch), ttl (0 = sans
+    expiration), metadata et access_count, quel que soit le niveau de
+    cache d'origine.
+    """
+
+    def __init__(self, filename: str, header: Optional[Dict[str, Any]] = None,
+                 codec: Optional[ValueCodec] = None):
+        self.filename = filename
+        self.codec = codec or default_codec
+        self.count = 0
+        self._tmp_filename = f"{filename}.tmp"
+        self._file = open(self._tmp_filename, 'wb')
+        self._file.write(SNAPSHOT_MAGIC)
+        self._write_frame(header or {})
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def _write_frame(self, record: Dict[str, Any]):
+        data = self.codec.encode(record)
+        self._file.write(FRAME_HEADER.pack(len(data)))
+        self._file.write(data)
+
+    def write(self, record: Dict[str, Any]):
+        """Ajoute un enregistrement"""
+        self._write_frame(record)
+        self.count += 1
+
+    def close(self, trailer: Optional[Dict[str, Any]] = None):
+        """Écrit la trame finale et publie le fichier"""
+        if self._file.closed:
+            return
+        self._file.write(FRAME_HEADER.pack(0))
+        self._write_frame(dict(trailer or {}, count=self.count))
+        self._file.close()
+        os.replace(self._tmp_filename, self.filename)
+
+    def abort(self):
+        """Abandonne l'instantané en cours"""
+        if not self._file.closed:
+            self._file.close()
+        try:
+            os.remove(self._tmp_filename)
+        except OSError:
+            pass
+
+class SnapshotReader:
+    """
+    Relit un instantané entrée par entrée
+
+    header est disponible dès l'ouverture, trailer après avoir consommé
+    tous les enregistrements. Un fichier tronqué lève ValueError.
+    """
+
+    def __init__(self, filename: str, codec: Optional[ValueCodec] = None):
+        self.filename = filename
+        self.codec = codec or default_codec
+        self.trailer: Optional[Dict[str, Any]] = None
+        self._file = open(filename, 'rb')
+        try:
+            if self._file.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                raise ValueError(f"Not a cache snapshot: {filename}")
+            self.header = self._read_frame()
+        except Exception:
+            self._file.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _read_exact(self, size: int) -> bytes:
+        data = self._file.read(size)
+        if len(data) != size:
+            raise ValueError(f"Truncated cache snapshot: {self.filename}")
+        return data
+
+    def _read_frame(self) -> Optional[Dict[str, Any]]:
+        (size,) = FRAME_HEADER.unpack(self._read_exact(FRAME_HEADER.size))
+        if size == 0:
+            return None
+        return self.codec.decode(self._read_exact(size))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        while True:
+            record = self._read_frame()
+            if record is None:
+                break
+            yield record
+
+        (size,) = FRAME_HEADER.unpack(self._read_exact(FRAME_HEADER.size))
+        self.trailer = self.codec.decode(self._read_exact(size))
+
+    def close(self):
+        self._file.close()
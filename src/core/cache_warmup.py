@@ -0,0 +1,260 @@
+"""
+Préchauffage du cache au démarrage
+Clés d'un manifeste (avec leur loader) et clés chaudes de L2, chargées en parallèle
+"""
+
+import asyncio
+import importlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Clés par appel à preload_keys / get_many (une écriture groupée par lot)
+WARMUP_CHUNK_SIZE = 20
+
+def resolve_loader(path: str) -> Callable[..., Any]:
+    """Résout un loader 'package.module:fonction' (ou 'package.module.fonction')"""
+    module_name, _, attribute = path.partition(':')
+    if not attribute:
+        module_name, _, attribute = path.rpartition('.')
+
+    target: Any = importlib.import_module(module_name)
+    for part in attribute.split('.'):
+        target = getattr(target, part)
+
+    if not callable(target):
+        raise TypeError(f"Warm-up loader is not callable: {path}")
+    return target
+
+def _chunks(items: List[str], size: int) -> List[List[str]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+@dataclass
+class WarmupTask:
+    """Clé à préchauffer et appel qui produit sa valeur"""
+    key: str
+    loader: Callable[..., Any]
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    ttl: Optional[int] = None
+
+    def load(self) -> Any:
+        """Exécute le loader (les coroutines tournent dans leur propre boucle)"""
+        result = self.loader(*self.args, **self.kwargs)
+        if inspect.isawaitable(result):
+            return asyncio.run(result)
+        return result
+
+class CacheWarmer:
+    """
+    Préchauffe un AdvancedCache avant d'annoncer le service prêt
+
+    Les clés chaudes de L2 sont promues en L1 (lecture seule), puis les
+    clés du manifeste absentes sont calculées par un pool de workers borné
+    et écrites par lots via preload_keys. ready passe à True quand la part
+    de clés traitées (chargées, déjà présentes ou en échec) atteint
+    ready_threshold, ou après timeout secondes : un loader lent ou en panne
+    ne bloque pas indéfiniment le trafic.
+    """
+
+    def __init__(self, cache, max_workers: int = 8, ready_threshold: float = 0.9,
+                 timeout: Optional[float] = None, chunk_size: int = WARMUP_CHUNK_SIZE):
+        if not 0 <= ready_threshold <= 1:
+            raise ValueError("ready_threshold must be between 0 and 1")
+
+        self.cache = cache
+        self.max_workers = max_workers
+        self.ready_threshold = ready_threshold
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+
+        self.tasks: Dict[str, WarmupTask] = {}
+        self.hot_keys: List[str] = []
+
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.processed = 0
+        self.loaded = 0
+        self.promoted = 0
+        self.failed = 0
+
+    @classmethod
+    def from_env(cls, cache) -> 'CacheWarmer':
+        """
+        Configure le préchauffage depuis l'environnement
+
+        CACHE_WARMUP_MANIFEST (fichier JSON), CACHE_WARMUP_HOT_KEYS (nombre de
+        clés chaudes de L2, 200 par défaut), CACHE_WARMUP_WORKERS,
+        CACHE_WARMUP_READY_THRESHOLD et CACHE_WARMUP_TIMEOUT (secondes).
+        """
+        timeout = float(os.getenv('CACHE_WARMUP_TIMEOUT', '60'))
+        warmer = cls(
+            cache,
+            max_workers=int(os.getenv('CACHE_WARMUP_WORKERS', '8')),
+            ready_threshold=float(os.getenv('CACHE_WARMUP_READY_THRESHOLD', '0.9')),
+            timeout=timeout if timeout > 0 else None
+        )
+
+        manifest = os.getenv('CACHE_WARMUP_MANIFEST')
+        if manifest:
+            warmer.load_manifest(manifest)
+        warmer.add_hot_keys(int(os.getenv('CACHE_WARMUP_HOT_KEYS', '200')))
+
+        return warmer
+
+    def add(self, key: str, loader: Callable[..., Any], args: Tuple[Any, ...] = (),
+            kwargs: Optional[Dict[str, Any]] = None, ttl: Optional[int] = None):
+        """Ajoute une clé et son loader"""
+        self.tasks[key] = WarmupTask(key, loader, tuple(args), kwargs or {}, ttl)
+
+    def load_manifest(self, path: str) -> int:
+        """
+        Charge un manifeste JSON, retourne le nombre de clés ajoutées
+
+        Format : {"defaults": {"ttl": 3600}, "entries": [{"key": "...",
+        "loader": "package.module:fonction", "args": [], "kwargs": {},
+        "ttl": 86400}]}. Une entrée invalide est ignorée.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except Exception as e:
+            logger.error(f"❌ Cache warm-up manifest unreadable ({path}): {e}")
+            return 0
+
+        defaults = manifest.get('defaults', {})
+        added = 0
+        for entry in manifest.get('entries', []):
+            try:
+                self.add(
+                    entry['key'],
+                    resolve_loader(entry['loader']),
+                    args=entry.get('args', ()),
+                    kwargs=entry.get('kwargs'),
+                    ttl=entry.get('ttl', defaults.get('ttl'))
+                )
+                added += 1
+            except Exception as e:
+                logger.warning(f"⚠️ Skipping warm-up entry {entry.get('key')}: {e}")
+
+        logger.info(f"✅ Cache warm-up manifest loaded: {added} keys")
+        return added
+
+    def add_hot_keys(self, limit: int) -> int:
+        """Ajoute les clés les plus récemment lues en L2 (promues en L1 sans recalcul)"""
+        if limit <= 0:
+            return 0
+
+        keys = [key for key in self.cache.l2_cache.hot_keys(limit)
+                if key not in self.tasks and key not in self.hot_keys]
+        self.hot_keys.extend(keys)
+        return len(keys)
+
+    @property
+    def total(self) -> int:
+        return len(self.tasks) + len(self.hot_keys)
+
+    @property
+    def progress(self) -> float:
+        """Part des clés traitées"""
+        return self.processed / self.total if self.total else 1.0
+
+    @property
+    def ready(self) -> bool:
+        """Vrai quand le trafic peut être accepté"""
+        if self.started_at is None:
+            return False
+        if self.finished_at is not None or self.progress >= self.ready_threshold:
+            return True
+        return self.timeout is not None and time.monotonic() - self.started_at >= self.timeout
+
+    def start(self):
+        """Lance le préchauffage dans un thread de fond"""
+        if self._thread is not None:
+            return
+
+        self.started_at = time.monotonic()
+        self._thread = threading.Thread(target=self.run, name='cache-warmup', daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Attend la fin du préchauffage, retourne ready"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.ready
+
+    def run(self) -> Dict[str, Any]:
+        """Préchauffe le cache (bloquant), retourne les statistiques"""
+        if self.started_at is None:
+            self.started_at = time.monotonic()
+
+        with ThreadPoolExecutor(self.max_workers, thread_name_prefix='cache-warmup') as pool:
+            # Clés chaudes : un aller-retour L2 par lot, en parallèle
+            promotions = {
+                pool.submit(self.cache.get_many, chunk): len(chunk)
+                for chunk in _chunks(self.hot_keys, self.chunk_size)
+            }
+            for future in as_completed(promotions):
+                try:
+                    self.promoted += len(future.result())
+                except Exception as e:
+                    logger.error(f"Cache warm-up promotion failed: {e}")
+                self._advance(promotions[future])
+
+            # Manifeste : lots de même TTL, loaders exécutés sur le pool
+            by_ttl: Dict[Optional[int], List[str]] = {}
+            for task in self.tasks.values():
+                by_ttl.setdefault(task.ttl, []).append(task.key)
+
+            for ttl, keys in by_ttl.items():
+                for chunk in _chunks(keys, self.chunk_size):
+                    try:
+                        self.loaded += self.cache.preload_keys(chunk, self._load, ttl=ttl, executor=pool)
+                    except Exception as e:
+                        logger.error(f"Cache warm-up batch failed: {e}")
+                    self._advance(len(chunk))
+
+        self.finished_at = time.monotonic()
+        stats = self.get_stats()
+        logger.info(
+            f"✅ Cache warm-up done in {stats['duration']:.1f}s: {self.loaded} loaded, "
+            f"{self.promoted} promoted, {self.failed} failed"
+        )
+        return stats
+
+    def _load(self, key: str) -> Any:
+        try:
+            return self.tasks[key].load()
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+
+    def _advance(self, count: int):
+        with self._lock:
+            self.processed += count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Avancement du préchauffage (exposé par la sonde de readiness)"""
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return {
+            'ready': self.ready,
+            'finished': self.finished_at is not None,
+            'progress': round(self.progress, 3),
+            'total': self.total,
+            'processed': self.processed,
+            'loaded': self.loaded,
+            'promoted': self.promoted,
+            'failed': self.failed,
+            'duration': end - self.started_at if self.started_at is not None else 0.0
+        }
@@ -0,0 +1,508 @@
+"""
+Cache disque local (SQLite en mode WAL)
+Niveau L2 persistant pour les déploiements mono-nœud sans PostgreSQL
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
+
+from .cache_codec import ValueCodec, default_codec, is_encoded
+from .cache_keys import TAGS_METADATA_KEY, glob_to_regex, pattern_prefix
+from .cache_models import CacheEntry, CacheStats, remaining_ttl
+from .cache_snapshot import WATERMARK_OVERLAP, SnapshotReader, SnapshotWriter, is_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Limite de paramètres par requête (SQLITE_MAX_VARIABLE_NUMBER des anciennes versions)
+SQLITE_BATCH_SIZE = 500
+
+# Borne haute d'une plage de préfixe (plus grand point de code Unicode)
+PREFIX_UPPER_BOUND = '\U0010ffff'
+
+DISK_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS {table} (
+    key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    metadata TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_{table}_expires_at ON {table} (expires_at);
+
+-- Index inversé tag -> clé, maintenu par triggers sur toutes les écritures
+CREATE TABLE IF NOT EXISTS {table}_tags (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (tag, key)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_{table}_tags_key ON {table}_tags (key);
+
+CREATE TRIGGER IF NOT EXISTS {table}_tags_insert AFTER INSERT ON {table}
+BEGIN
+    INSERT OR IGNORE INTO {table}_tags (tag, key)
+    SELECT value, NEW.key FROM json_each(NEW.metadata, '$.{tags_key}');
+END;
+
+CREATE TRIGGER IF NOT EXISTS {table}_tags_delete AFTER DELETE ON {table}
+BEGIN
+    DELETE FROM {table}_tags WHERE key = OLD.key;
+END;
+"""
+
+class DiskCache:
+    """
+    Cache SQLite local avec TTL, même interface que PostgreSQLCache
+
+    Les échéances sont en temps horloge (time.time()) pour survivre aux
+    redémarrages. Une connexion par thread : en mode WAL les lectures ne
+    bloquent pas l'écrivain.
+    """
+
+    def __init__(self, path: str, codec: Optional[ValueCodec] = None,
+                 busy_timeout: float = 5.0):
+        self.path = path
+        self.table_name = 'cache_entries'
+        self.codec = codec or default_codec
+        self.busy_timeout = busy_timeout
+        self.stats = CacheStats()
+        self.available = False
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        try:
+            self._initialize_database()
+            self.available = True
+            logger.info(f"✅ Disk cache initialized at {path}")
+        except Exception as e:
+            logger.error(f"❌ Disk cache initialization failed: {e}")
+
+    def _initialize_database(self):
+        """Crée le fichier, active le WAL et crée la table"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(
+            DISK_TABLE_DDL.format(table=self.table_name, tags_key=TAGS_METADATA_KEY)
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Retourne la connexion du thread courant (créée à la demande)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # isolation_level=None : transactions explicites uniquement
+            conn = sqlite3.connect(
+                self.path, timeout=self.busy_timeout,
+                isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # INSERT OR REPLACE doit déclencher le trigger de suppression des tags
+            conn.execute("PRAGMA recursive_triggers=ON")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @staticmethod
+    def _expires_at(ttl: int, now: float) -> Optional[float]:
+        """Échéance absolue (None : pas d'expiration, comme ttl = 0 en PostgreSQL)"""
+        return now + ttl if ttl > 0 else None
+
+    def close(self):
+        """Ferme toutes les connexions"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.debug(f"Disk cache connection close error: {e}")
+        self._local = threading.local()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Récupère une valeur du cache"""
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Récupère une entrée valide avec ses métadonnées et son TTL restant"""
+        if not self.available:
+            return None
+
+        try:
+            now = time.time()
+            row = self._connection().execute(f"""
+                SELECT key, payload, expires_at, metadata FROM {self.table_name}
+                WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)
+            """, (key, now)).fetchone()
+
+            if row:
+                self.stats.hits += 1
+                return self._row_entry(row, now)
+
+            self.stats.misses += 1
+            return None
+
+        except Exception as e:
+            logger.error(f"Disk cache get error: {e}")
+            return None
+
+    def _row_entry(self, row: Tuple, now: float) -> CacheEntry:
+        """Entrée lue : TTL restant à partir de maintenant (0 : pas d'expiration)"""
+        key, payload, expires_at, metadata = row
+        return CacheEntry(
+            key=key,
+            value=self.codec.decode(payload),
+            timestamp=datetime.now(),
+            ttl=remaining_ttl(expires_at - now) if expires_at is not None else 0,
+            metadata=json.loads(metadata) if metadata else {}
+        )
+
+    def set(self, key: str, value: Any, ttl: int = 3600, metadata: Optional[Dict] = None):
+        """Stocke une valeur dans le cache"""
+        if not self.available:
+            return
+
+        try:
+            now = time.time()
+            self._connection().execute(f"""
+                INSERT OR REPLACE INTO {self.table_name}
+                (key, payload, created_at, expires_at, metadata)
+                VALUES (?, ?, ?, ?, ?)
+            """, (key, self.codec.encode(value), now, self._expires_at(ttl, now),
+                  json.dumps(metadata or {}, default=str)))
+
+        except Exception as e:
+            logger.error(f"Disk cache set error: {e}")
+
+    def delete(self, key: str) -> bool:
+        """Supprime une entrée du cache"""
+        if not self.available:
+            return False
+
+        try:
+            cursor = self._connection().execute(
+                f"DELETE FROM {self.table_name} WHERE key = ?", (key,)
+            )
+            return cursor.rowcount > 0
+
+        except Exception as e:
+            logger.error(f"Disk cache delete error: {e}")
+            return False
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Récupère plusieurs valeurs (clés trouvées uniquement)"""
+        return {key: entry.value for key, entry in self.get_many_entries(keys).items()}
+
+    def get_many_entries(self, keys: List[str]) -> Dict[str, CacheEntry]:
+        """Récupère plusieurs entrées avec métadonnées et TTL restant (clés trouvées uniquement)"""
+        if not self.available or not keys:
+            return {}
+
+        found = {}
+        try:
+            conn = self._connection()
+            now = time.time()
+            for start in range(0, len(keys), SQLITE_BATCH_SIZE):
+                chunk = list(keys[start:start + SQLITE_BATCH_SIZE])
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(f"""
+                    SELECT key, payload, expires_at, metadata FROM {self.table_name}
+                    WHERE key IN ({placeholders})
+                    AND (expires_at IS NULL OR expires_at > ?)
+                """, (*chunk, now)).fetchall()
+
+                for row in rows:
+                    found[row[0]] = self._row_entry(row, now)
+
+        except Exception as e:
+            logger.error(f"Disk cache get_many error: {e}")
+            return found
+
+        self.stats.hits += len(found)
+        self.stats.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: Dict[str, Any], ttl: int = 3600, metadata: Optional[Dict] = None):
+        """Stocke plusieurs valeurs en une transaction"""
+        if not self.available or not items:
+            return
+
+        now = time.time()
+        expires_at = self._expires_at(ttl, now)
+        metadata_json = json.dumps(metadata or {}, default=str)
+        rows = [
+            (key, self.codec.encode(value), now, expires_at, metadata_json)
+            for key, value in items.items()
+        ]
+
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(f"""
+                    INSERT OR REPLACE INTO {self.table_name}
+                    (key, payload, created_at, expires_at, metadata)
+                    VALUES (?, ?, ?, ?, ?)
+                """, rows)
+
+        except Exception as e:
+            logger.error(f"Disk cache set_many error: {e}")
+
+    def delete_many(self, keys: List[str]) -> int:
+        """Supprime plusieurs entrées, retourne le nombre supprimé"""
+        if not self.available or not keys:
+            return 0
+
+        try:
+            conn = self._connection()
+            deleted_count = 0
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                for start in range(0, len(keys), SQLITE_BATCH_SIZE):
+                    chunk = list(keys[start:start + SQLITE_BATCH_SIZE])
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor = conn.execute(
+                        f"DELETE FROM {self.table_name} WHERE key IN ({placeholders})", chunk
+                    )
+                    deleted_count += cursor.rowcount
+            return deleted_count
+
+        except Exception as e:
+            logger.error(f"Disk cache delete_many error: {e}")
+            return 0
+
+    def get_pattern(self, pattern: str) -> Dict[str, Any]:
+        """Récupère les valeurs dont la clé correspond au motif glob (plage sur la clé primaire)"""
+        if not self.available:
+            return {}
+
+        prefix = pattern_prefix(pattern)
+        regex = glob_to_regex(pattern)
+
+        try:
+            rows = self._connection().execute(f"""
+                SELECT key, payload FROM {self.table_name}
+                WHERE key >= ? AND key < ?
+                AND (expires_at IS NULL OR expires_at > ?)
+            """, (prefix, prefix + PREFIX_UPPER_BOUND, time.time())).fetchall()
+
+            return {
+                key: self.codec.decode(payload)
+                for key, payload in rows
+                if regex.match(key)
+            }
+
+        except Exception as e:
+            logger.error(f"Disk cache get_pattern error: {e}")
+            return {}
+
+    def delete_tag(self, tag: str) -> int:
+        """Supprime les entrées portant un tag"""
+        if not self.available:
+            return 0
+
+        try:
+            cursor = self._connection().execute(f"""
+                DELETE FROM {self.table_name}
+                WHERE key IN (SELECT key FROM {self.table_name}_tags WHERE tag = ?)
+            """, (tag,))
+            return cursor.rowcount
+
+        except Exception as e:
+            logger.error(f"Disk cache delete_tag error: {e}")
+            return 0
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Supprime les entrées dont la clé commence par le préfixe"""
+        if not self.available:
+            return 0
+
+        try:
+            cursor = self._connection().execute(
+                f"DELETE FROM {self.table_name} WHERE key >= ? AND key < ?",
+                (prefix, prefix + PREFIX_UPPER_BOUND)
+            )
+            return cursor.rowcount
+
+        except Exception as e:
+            logger.error(f"Disk cache delete_prefix error: {e}")
+            return 0
+
+    def clear(self):
+        """Vide complètement le cache"""
+        if not self.available:
+            return
+
+        try:
+            self._connection().execute(f"DELETE FROM {self.table_name}")
+
+        except Exception as e:
+            logger.error(f"Disk cache clear error: {e}")
+
+    def cleanup_expired(self) -> int:
+        """Nettoie les entrées expirées"""
+        if not self.available:
+            return 0
+
+        try:
+            cursor = self._connection().execute(f"""
+                DELETE FROM {self.table_name}
+                WHERE expires_at IS NOT NULL AND expires_at <= ?
+            """, (time.time(),))
+            deleted_count = cursor.rowcount
+            self.stats.evictions += deleted_count
+            return deleted_count
+
+        except Exception as e:
+            logger.error(f"Disk cache cleanup error: {e}")
+            return 0
+
+    def hot_keys(self, limit: int = 100) -> List[str]:
+        """Clés valides les plus récemment écrites (pas de statistiques d'accès en local)"""
+        if not self.available or limit <= 0:
+            return []
+
+        try:
+            rows = self._connection().execute(f"""
+                SELECT key FROM {self.table_name}
+                WHERE expires_at IS NULL OR expires_at > ?
+                ORDER BY created_at DESC
+                LIMIT ?
+            """, (time.time(), limit)).fetchall()
+            return [key for (key,) in rows]
+
+        except Exception as e:
+            logger.error(f"Disk cache hot_keys error: {e}")
+            return []
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne les statistiques du cache"""
+        if not self.available:
+            return self.stats.to_dict()
+
+        try:
+            row = self._connection().execute(
+                f"SELECT COUNT(*), COALESCE(SUM(LENGTH(payload)), 0) FROM {self.table_name}"
+            ).fetchone()
+            self.stats.total_entries, self.stats.total_bytes = row
+
+        except Exception as e:
+            logger.error(f"Disk cache stats retrieval error: {e}")
+
+        stats = self.stats.to_dict()
+        stats['path'] = self.path
+        return stats
+
+    def backup_data(self, filename: str, since: Optional[float] = None) -> Optional[float]:
+        """
+        Sauvegarde les entrées valides en flux (instantané binaire)
+
+        Les lignes sont lues par curseur et écrites une à une ; avec since,
+        seules les entrées écrites après ce watermark sont sauvegardées.
+
+        Returns:
+            Watermark à passer au prochain instantané incrémental
+        """
+        if not self.available:
+            return None
+
+        try:
+            now = time.time()
+            watermark = now - WATERMARK_OVERLAP
+            cursor = self._connection().execute(f"""
+                SELECT key, payload, created_at, expires_at, metadata
+                FROM {self.table_name}
+                WHERE (expires_at IS NULL OR expires_at > ?) AND created_at > ?
+            """, (now, since if since is not None else float('-inf')))
+
+            header = {'source': 'disk', 'since': since}
+            with SnapshotWriter(filename, header, self.codec) as writer:
+                for key, payload, created_at, expires_at, metadata in cursor:
+                    writer.write({
+                        'key': key,
+                        'payload': payload,
+                        'timestamp': created_at,
+                        'ttl': max(1, round(expires_at - created_at)) if expires_at is not None else 0,
+                        'metadata': json.loads(metadata) if metadata else {}
+                    })
+                writer.close({'watermark': watermark})
+
+            logger.info(f"✅ Disk cache backed up to {filename} ({writer.count} entries)")
+            return watermark
+
+        except Exception as e:
+            logger.error(f"Disk cache backup error: {e}")
+            return None
+
+    def restore_data(self, filename: str):
+        """
+        Restaure un instantané en flux (ou une ancienne sauvegarde complète)
+
+        Une entrée existante n'est remplacée que par une version plus récente,
+        ce qui permet de rejouer un instantané complet puis ses incréments.
+        """
+        if not self.available:
+            return
+
+        try:
+            if is_snapshot(filename):
+                with SnapshotReader(filename, self.codec) as reader:
+                    self._restore_rows(self._snapshot_rows(reader))
+            else:
+                with open(filename, 'rb') as f:
+                    raw = f.read()
+                data = self.codec.decode(raw) if is_encoded(raw) else json.loads(raw.decode('utf-8'))
+
+                self._restore_rows(
+                    (
+                        entry['key'],
+                        self.codec.encode(entry['value']),
+                        entry.get('created_at', time.time()),
+                        entry.get('expires_at'),
+                        json.dumps(entry.get('metadata', {}), default=str)
+                    )
+                    for entry in data
+                )
+
+            logger.info(f"✅ Disk cache restored from {filename}")
+
+        except Exception as e:
+            logger.error(f"Disk cache restore error: {e}")
+
+    @staticmethod
+    def _snapshot_rows(records):
+        """Convertit les enregistrements d'un instantané en lignes SQLite (sans les expirées)"""
+        now = time.time()
+        for record in records:
+            expires_at = record['timestamp'] + record['ttl'] if record['ttl'] > 0 else None
+            if expires_at is not None and expires_at <= now:
+                continue
+            yield (record['key'], record['payload'], record['timestamp'], expires_at,
+                   json.dumps(record.get('metadata') or {}, default=str))
+
+    def _restore_rows(self, rows):
+        """Insère les lignes en une transaction sans écraser les entrées plus récentes"""
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # INSERT OR REPLACE (et non un upsert) pour que les triggers de tags s'appliquent
+            conn.executemany(f"""
+                INSERT OR REPLACE INTO {self.table_name}
+                (key, payload, created_at, expires_at, metadata)
+                SELECT ?1, ?2, ?3, ?4, ?5
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {self.table_name} WHERE key = ?1 AND created_at > ?3
+                )
+            """, rows)
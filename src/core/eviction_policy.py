@@ -0,0 +1,164 @@
+"""
+Politiques d'admission et d'éviction du cache mémoire
+W-TinyLFU : fenêtre LRU + segment principal SLRU, admission par fréquence
+estimée (count-min sketch avec vieillissement)
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Politiques disponibles pour MemoryCache
+EVICTION_POLICIES = ('lru', 'tinylfu')
+
+class CountMinSketch:
+    """Estimation de fréquence sur 4 lignes de compteurs saturant à 15"""
+
+    DEPTH = 4
+    MAX_COUNT = 15
+
+    def __init__(self, capacity: int):
+        width = 64
+        while width < capacity:
+            width <<= 1
+        self.width = width
+        self._mask = width - 1
+        self._table = [bytearray(width) for _ in range(self.DEPTH)]
+        # Vieillissement : tous les compteurs sont divisés par deux après sample_size incréments
+        self.sample_size = 10 * max(capacity, 1)
+        self.additions = 0
+
+    def _indexes(self, key: str):
+        """Une colonne par ligne (double hachage, déroulé pour DEPTH = 4)"""
+        h = hash(key)
+        h1 = h & 0xFFFFFFFF
+        h2 = ((h >> 32) & 0xFFFFFFFF) | 1
+        mask = self._mask
+        return (h1 & mask, (h1 + h2) & mask, (h1 + 2 * h2) & mask, (h1 + 3 * h2) & mask)
+
+    def increment(self, key: str):
+        """Incrémente la fréquence estimée d'une clé"""
+        for row, index in zip(self._table, self._indexes(key)):
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def frequency(self, key: str) -> int:
+        """Fréquence estimée (surestimation possible, jamais de sous-estimation hors vieillissement)"""
+        return min(row[index] for row, index in zip(self._table, self._indexes(key)))
+
+    def _age(self):
+        """Divise tous les compteurs par deux pour oublier l'historique ancien"""
+        self._table = [bytearray(count >> 1 for count in row) for row in self._table]
+        self.additions //= 2
+
+class TinyLFUPolicy:
+    """
+    Politique W-TinyLFU (ordre des entrées et choix des victimes)
+
+    Les nouvelles clés entrent dans une petite fenêtre LRU. En sortant de
+    la fenêtre, une clé passe en probation ; à l'éviction, elle n'y reste
+    que si sa fréquence estimée dépasse celle de la victime du segment
+    principal. Un parcours de clés vues une seule fois ne chasse donc pas
+    les entrées fréquemment relues.
+    """
+
+    def __init__(self, capacity: int, window_ratio: float = 0.01, protected_ratio: float = 0.8):
+        self.window_ratio = window_ratio
+        self.protected_ratio = protected_ratio
+        self.window: "OrderedDict[str, None]" = OrderedDict()
+        self.probation: "OrderedDict[str, None]" = OrderedDict()
+        self.protected: "OrderedDict[str, None]" = OrderedDict()
+        self.sketch = CountMinSketch(capacity)
+        self.admitted = 0
+        self.rejected = 0
+        self.resize(capacity)
+
+    def resize(self, capacity: int):
+        """Recalcule la taille de la fenêtre et du segment protégé"""
+        self.capacity = max(capacity, 1)
+        self.window_capacity = max(1, int(self.capacity * self.window_ratio))
+        main_capacity = max(self.capacity - self.window_capacity, 1)
+        self.protected_capacity = max(1, int(main_capacity * self.protected_ratio))
+
+    def record_access(self, key: str):
+        """Lecture réussie : fréquence incrémentée, promotion éventuelle"""
+        self.sketch.increment(key)
+
+        if key in self.window:
+            self.window.move_to_end(key)
+        elif key in self.probation:
+            del self.probation[key]
+            self.protected[key] = None
+            # Segment protégé plein : sa plus ancienne entrée repasse en probation
+            while len(self.protected) > self.protected_capacity:
+                demoted, _ = self.protected.popitem(last=False)
+                self.probation[demoted] = None
+        elif key in self.protected:
+            self.protected.move_to_end(key)
+
+    def record_insert(self, key: str):
+        """Nouvelle entrée : ajout en fenêtre, débordement vers la probation"""
+        self.sketch.increment(key)
+        self.window[key] = None
+
+        while len(self.window) > self.window_capacity:
+            candidate, _ = self.window.popitem(last=False)
+            self.probation[candidate] = None
+
+    def record_update(self, key: str):
+        """Entrée remplacée : fréquence incrémentée, la clé garde son segment"""
+        if not any(key in segment for segment in (self.window, self.probation, self.protected)):
+            self.record_insert(key)
+            return
+
+        self.sketch.increment(key)
+        if key in self.window:
+            self.window.move_to_end(key)
+        elif key in self.protected:
+            self.protected.move_to_end(key)
+        # En probation, la clé garde sa place : la fin du segment désigne le candidat à l'admission
+
+    def record_remove(self, key: str):
+        """Entrée retirée du cache"""
+        for segment in (self.window, self.probation, self.protected):
+            if key in segment:
+                del segment[key]
+                return
+
+    def victim(self) -> Optional[str]:
+        """Choisit la clé à évincer (candidat sorti de la fenêtre contre victime principale)"""
+        if len(self.probation) >= 2:
+            victim = next(iter(self.probation))
+            candidate = next(reversed(self.probation))
+            if self.sketch.frequency(candidate) > self.sketch.frequency(victim):
+                self.admitted += 1
+                return victim
+            self.rejected += 1
+            return candidate
+
+        for segment in (self.probation, self.protected, self.window):
+            if segment:
+                return next(iter(segment))
+        return None
+
+    def clear(self):
+        """Vide l'ordre des entrées (l'historique de fréquence est conservé)"""
+        self.window.clear()
+        self.probation.clear()
+        self.protected.clear()
+
+    def get_stats(self) -> dict:
+        """Répartition des segments et décisions d'admission"""
+        return {
+            'window': len(self.window),
+            'probation': len(self.probation),
+            'protected': len(self.protected),
+            'admitted': self.admitted,
+            'rejected': self.rejected
+        }
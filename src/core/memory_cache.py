@@ -2,24 +2,114 @@
 Cache mémoire spécialisé
 """
 
+import heapq
+import itertools
 import logging
-from typing import Dict, Any, Optional, List
+import math
+import random
+import sys
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Set, Tuple
 from datetime import datetime, timedelta
 import threading
 import json
 
+from .cache_codec import ValueCodec, default_codec, is_encoded
+from .cache_keys import entry_tags, glob_to_regex, key_namespace, pattern_prefix
 from .cache_models import CacheEntry, CacheStats
+from .cache_snapshot import WATERMARK_OVERLAP, SnapshotReader, SnapshotWriter, is_snapshot, to_epoch
+from .eviction_policy import EVICTION_POLICIES, TinyLFUPolicy
 
 logger = logging.getLogger(__name__)
 
-class MemoryCache:
-    """Cache en mémoire avec nettoyage automatique"""
+# Nombre maximum d'entrées expirées retirées par prise de verrou
+EXPIRY_BATCH_SIZE = 256
+
+# Métadonnées utilisées par le rafraîchissement anticipé (XFetch)
+COMPUTE_TIME_KEY = 'compute_time'
+FRESH_UNTIL_KEY = 'fresh_until'
+
+def xfetch_due(now: float, deadline: float, compute_time: float, beta: float = 1.0) -> bool:
+    """
+    Décision XFetch : rafraîchir avant l'échéance avec une probabilité
+    croissante à son approche et proportionnelle au coût du recalcul
+
+    now - compute_time * beta * ln(U) >= deadline, U uniforme sur ]0, 1]
+    """
+    if compute_time <= 0 or beta <= 0:
+        return now >= deadline
+    return now - compute_time * beta * math.log(1.0 - random.random()) >= deadline
+
+def estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """Estime la taille mémoire d'une valeur (conteneurs parcourus récursivement)"""
+    if _seen is None:
+        _seen = set()
+
+    obj_id = id(value)
+    if obj_id in _seen:
+        return 0
+    _seen.add(obj_id)
+
+    size = sys.getsizeof(value)
+
+    if isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+        return size
+
+    if isinstance(value, dict):
+        size += sum(
+            estimate_size(k, _seen) + estimate_size(v, _seen)
+            for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _seen) for item in value)
+    elif hasattr(value, '__dict__'):
+        size += estimate_size(vars(value), _seen)
 
-    def __init__(self, max_size: int = 1000, cleanup_interval: int = 300):
-        self.cache: Dict[str, CacheEntry] = {}
+    return size
+
+def _discard_from_index(index: Dict[str, Set[str]], name: str, key: str):
+    """Retire une clé d'un index inversé et supprime les ensembles vides"""
+    keys = index.get(name)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del index[name]
+
+class MemoryCache:
+    """
+    Cache en mémoire avec budget optionnel en octets
+
+    policy='lru' (défaut) évince l'entrée la moins récemment utilisée en
+    O(1) ; policy='tinylfu' résiste aux parcours de clés à usage unique
+    (W-TinyLFU, voir eviction_policy).
+    """
+
+    def __init__(self, max_size: int = 1000, cleanup_interval: int = 300,
+                 max_bytes: Optional[int] = None, codec: Optional[ValueCodec] = None,
+                 policy: str = 'lru'):
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {policy}")
+
+        # Ordre d'insertion = ordre d'utilisation : la tête est l'entrée LRU
+        self.cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.policy = policy
+        self._policy = TinyLFUPolicy(max_size) if policy == 'tinylfu' else None
         self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
         self.stats = CacheStats()
         self.lock = threading.Lock()
+        # Codec des sauvegardes (conserve les types des valeurs)
+        self.codec = codec or default_codec
+
+        # Index d'expiration : tas (échéance monotone, séquence, entrée)
+        self._expiry_heap: List[Tuple[float, int, CacheEntry]] = []
+        self._expiry_seq = itertools.count()
+
+        # Index inversés : tag -> clés, espace de noms -> clés
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._namespace_index: Dict[str, Set[str]] = {}
 
         # Démarrer le nettoyage automatique
         self.cleanup_interval = cleanup_interval
@@ -30,7 +120,6 @@ class MemoryCache:
         def cleanup_worker():
             while True:
                 try:
-                    import time
                     time.sleep(self.cleanup_interval)
                     self._cleanup_expired()
                 except Exception as e:
@@ -42,92 +131,324 @@ class MemoryCache:
     def get(self, key: str) -> Optional[Any]:
         """Récupère une valeur du cache"""
         with self.lock:
-            entry = self.cache.get(key)
-
-            if entry:
-                if entry.is_expired():
-                    # Supprimer l'entrée expirée
-                    del self.cache[key]
-                    self.stats.misses += 1
-                    self.stats.evictions += 1
-                    return None
+            return self._lookup(key)
 
-                # Mettre à jour les statistiques
-                entry.access_count += 1
-                entry.last_accessed = datetime.now()
-                self.stats.hits += 1
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Récupère plusieurs valeurs sous une seule prise de verrou (clés trouvées uniquement)"""
+        found = {}
+        with self.lock:
+            for key in keys:
+                value = self._lookup(key)
+                if value is not None:
+                    found[key] = value
+        return found
+
+    def _lookup(self, key: str) -> Optional[Any]:
+        """Lit une entrée et met à jour LRU et statistiques (appelé sous verrou)"""
+        entry = self.cache.get(key)
+
+        if entry:
+            if entry.is_expired():
+                # Supprimer l'entrée expirée
+                self._remove_entry(key)
+                self.stats.misses += 1
+                self.stats.evictions += 1
+                return None
+
+            # Marquer comme la plus récemment utilisée
+            self.cache.move_to_end(key)
+            if self._policy is not None:
+                self._policy.record_access(key)
+
+            # Mettre à jour les statistiques
+            entry.access_count += 1
+            entry.last_accessed = datetime.now()
+            self.stats.hits += 1
+
+            return entry.value
+
+        self.stats.misses += 1
+        return None
+
+    def get_metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        """Retourne les métadonnées d'une entrée valide sans toucher aux statistiques"""
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is None or entry.is_expired():
+                return None
+            return entry.metadata
+
+    def should_refresh_early(self, key: str, beta: float = 1.0) -> bool:
+        """
+        Indique si la valeur doit être recalculée avant son échéance (XFetch)
+
+        L'échéance est fresh_until (temps horloge) si présente, sinon la
+        fin du TTL. Seules les entrées ayant un coût de recalcul
+        (métadonnée compute_time) sont concernées. Aucun verrou n'est pris.
+        """
+        entry = self.cache.get(key)
+        if entry is None:
+            return False
 
-                return entry.value
+        compute_time = entry.metadata.get(COMPUTE_TIME_KEY)
+        if not compute_time:
+            return False
 
-            self.stats.misses += 1
-            return None
+        fresh_until = entry.metadata.get(FRESH_UNTIL_KEY)
+        if fresh_until is not None:
+            return xfetch_due(time.time(), fresh_until, compute_time, beta)
+        if entry.expires_at == math.inf:
+            return False
+        return xfetch_due(time.monotonic(), entry.expires_at, compute_time, beta)
 
     def set(self, key: str, value: Any, ttl: int = 3600, metadata: Optional[Dict] = None):
         """Stocke une valeur dans le cache"""
+        size = estimate_size(value)
+
         with self.lock:
-            # Éviction si nécessaire
-            if len(self.cache) >= self.max_size and key not in self.cache:
-                self._evict_lru()
+            self._store(key, value, size, ttl, metadata)
+            self._enforce_limits()
 
-            entry = CacheEntry(
-                key=key,
-                value=value,
-                timestamp=datetime.now(),
-                ttl=ttl,
-                metadata=metadata or {}
-            )
+    def set_many(self, items: Dict[str, Any], ttl: int = 3600, metadata: Optional[Dict] = None):
+        """Stocke plusieurs valeurs sous une seule prise de verrou"""
+        sized = [(key, value, estimate_size(value)) for key, value in items.items()]
 
-            self.cache[key] = entry
+        with self.lock:
+            for key, value, size in sized:
+                self._store(key, value, size, ttl, metadata)
+            self._enforce_limits()
+
+    def set_entries(self, entries: Dict[str, CacheEntry]):
+        """Stocke des entrées lues ailleurs (niveau L2) avec leur TTL restant et leurs métadonnées"""
+        sized = [(entry, estimate_size(entry.value)) for entry in entries.values()]
+
+        with self.lock:
+            for entry, size in sized:
+                self._store(entry.key, entry.value, size, entry.ttl, entry.metadata)
+            self._enforce_limits()
+
+    def _store(self, key: str, value: Any, size: int, ttl: int, metadata: Optional[Dict]):
+        """Remplace ou insère une entrée (appelé sous verrou)"""
+        # Une valeur plus grosse que tout le budget n'est pas mise en cache (l'ancienne est retirée)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self._remove_entry(key)
+            logger.debug(f"Value for {key} exceeds max_bytes ({size} > {self.max_bytes})")
+            return
+
+        entry = CacheEntry(
+            key=key,
+            value=value,
+            timestamp=datetime.now(),
+            ttl=ttl,
+            metadata=dict(metadata) if metadata else {},
+            size=size
+        )
+
+        self._replace_entry(entry)
 
     def delete(self, key: str) -> bool:
         """Supprime une entrée du cache"""
         with self.lock:
-            if key in self.cache:
-                del self.cache[key]
-                return True
-            return False
+            return self._remove_entry(key) is not None
+
+    def delete_many(self, keys: List[str]) -> int:
+        """Supprime plusieurs entrées, retourne le nombre supprimé"""
+        with self.lock:
+            return sum(1 for key in keys if self._remove_entry(key) is not None)
+
+    def _keys_with_prefix(self, prefix: str) -> List[str]:
+        """Clés commençant par le préfixe, via l'index d'espaces de noms (appelé sous verrou)"""
+        if ':' in prefix:
+            candidates = self._namespace_index.get(key_namespace(prefix), ())
+        else:
+            # Préfixe partiel d'espace de noms : peu d'espaces, beaucoup de clés
+            candidates = [
+                key
+                for namespace, keys in self._namespace_index.items()
+                if namespace.startswith(prefix)
+                for key in keys
+            ]
+        return [key for key in candidates if key.startswith(prefix)]
+
+    def keys_with_tag(self, tag: str) -> List[str]:
+        """Retourne les clés portant un tag"""
+        with self.lock:
+            return list(self._tag_index.get(tag, ()))
+
+    def get_pattern(self, pattern: str) -> Dict[str, Any]:
+        """Retourne les valeurs valides dont la clé correspond au motif glob (* et ?)"""
+        regex = glob_to_regex(pattern)
+
+        with self.lock:
+            return {
+                key: self.cache[key].value
+                for key in self._keys_with_prefix(pattern_prefix(pattern))
+                if regex.match(key) and not self.cache[key].is_expired()
+            }
+
+    def delete_tag(self, tag: str) -> int:
+        """Supprime toutes les entrées portant un tag"""
+        with self.lock:
+            keys = list(self._tag_index.get(tag, ()))
+            return sum(1 for key in keys if self._remove_entry(key) is not None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Supprime toutes les entrées dont la clé commence par le préfixe"""
+        with self.lock:
+            keys = self._keys_with_prefix(prefix)
+            return sum(1 for key in keys if self._remove_entry(key) is not None)
 
     def clear(self):
         """Vide complètement le cache"""
         with self.lock:
             self.cache.clear()
+            self._expiry_heap = []
+            self._tag_index.clear()
+            self._namespace_index.clear()
+            if self._policy is not None:
+                self._policy.clear()
+            self.current_bytes = 0
             self.stats = CacheStats()
 
-    def _evict_lru(self):
-        """Évince l'entrée la moins récemment utilisée"""
+    def _replace_entry(self, entry: CacheEntry):
+        """Insère ou remplace une entrée : une clé déjà présente garde son segment d'éviction (appelé sous verrou)"""
+        replaced = self._remove_entry(entry.key, replacing=True) is not None
+        self._insert_entry(entry, replacing=replaced)
+
+    def _insert_entry(self, entry: CacheEntry, replacing: bool = False):
+        """Insère une entrée en position MRU (appelé sous verrou)"""
+        self.cache[entry.key] = entry
+        self.cache.move_to_end(entry.key)
+        self.current_bytes += entry.size
+        self._index_entry(entry)
+        if self._policy is not None:
+            if replacing:
+                self._policy.record_update(entry.key)
+            else:
+                self._policy.record_insert(entry.key)
+
+        if entry.expires_at != math.inf:
+            heapq.heappush(
+                self._expiry_heap,
+                (entry.expires_at, next(self._expiry_seq), entry)
+            )
+            self._compact_expiry_heap()
+
+    def _compact_expiry_heap(self):
+        """Reconstruit le tas quand les références périmées dominent (appelé sous verrou)"""
+        # Les entrées remplacées ou supprimées restent dans le tas (suppression paresseuse)
+        if len(self._expiry_heap) <= 2 * len(self.cache) + 64:
+            return
+
+        self._expiry_heap = [
+            item for item in self._expiry_heap
+            if self.cache.get(item[2].key) is item[2]
+        ]
+        heapq.heapify(self._expiry_heap)
+
+    def _pop_expired(self, now: float, limit: int) -> int:
+        """Retire jusqu'à `limit` entrées échues depuis le tas (appelé sous verrou)"""
+        removed = 0
+        heap = self._expiry_heap
+
+        while heap and heap[0][0] < now and removed < limit:
+            _, _, entry = heapq.heappop(heap)
+            # Ignorer les références vers des entrées déjà remplacées ou supprimées
+            if self.cache.get(entry.key) is entry:
+                self._remove_entry(entry.key)
+                removed += 1
+
+        return removed
+
+    def _remove_entry(self, key: str, replacing: bool = False) -> Optional[CacheEntry]:
+        """Retire une entrée et libère sa taille (appelé sous verrou ; replacing : la politique la garde)"""
+        entry = self.cache.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry.size
+            self._unindex_entry(entry)
+            if self._policy is not None and not replacing:
+                self._policy.record_remove(key)
+        return entry
+
+    def _index_entry(self, entry: CacheEntry):
+        """Ajoute l'entrée aux index de tags et d'espaces de noms (appelé sous verrou)"""
+        self._namespace_index.setdefault(key_namespace(entry.key), set()).add(entry.key)
+        for tag in entry_tags(entry.metadata):
+            self._tag_index.setdefault(tag, set()).add(entry.key)
+
+    def _unindex_entry(self, entry: CacheEntry):
+        """Retire l'entrée des index (appelé sous verrou)"""
+        _discard_from_index(self._namespace_index, key_namespace(entry.key), entry.key)
+        for tag in entry_tags(entry.metadata):
+            _discard_from_index(self._tag_index, tag, entry.key)
+
+    def _over_limits(self) -> bool:
+        """Vérifie si le nombre d'entrées ou le budget en octets est dépassé"""
+        if len(self.cache) > self.max_size:
+            return True
+        return self.max_bytes is not None and self.current_bytes > self.max_bytes
+
+    def _enforce_limits(self):
+        """Évince selon la politique jusqu'à respecter les limites (appelé sous verrou)"""
+        while self.cache and self._over_limits():
+            self._evict()
+
+    def _evict(self):
+        """Évince une entrée : la moins récemment utilisée, ou la victime W-TinyLFU"""
         if not self.cache:
             return
 
-        # Trouver l'entrée la plus ancienne
-        oldest_key = min(
-            self.cache.keys(),
-            key=lambda k: self.cache[k].last_accessed or self.cache[k].timestamp
-        )
+        start = time.perf_counter()
+        victim = self._policy.victim() if self._policy is not None else None
+        if victim is not None and victim in self.cache:
+            self._remove_entry(victim)
+        else:
+            _, entry = self.cache.popitem(last=False)
+            self.current_bytes -= entry.size
+            self._unindex_entry(entry)
+            if self._policy is not None:
+                self._policy.record_remove(entry.key)
 
-        del self.cache[oldest_key]
         self.stats.evictions += 1
+        self.stats.capacity_evictions += 1
+        self.stats.eviction_time += time.perf_counter() - start
 
-    def _cleanup_expired(self):
-        """Nettoie les entrées expirées"""
-        with self.lock:
-            expired_keys = [
-                key for key, entry in self.cache.items()
-                if entry.is_expired()
-            ]
+    def _cleanup_expired(self) -> int:
+        """Nettoie les entrées expirées en O(expirées), par lots courts"""
+        total_removed = 0
+
+        while True:
+            # Relâcher le verrou entre les lots pour ne jamais bloquer get/set
+            with self.lock:
+                removed = self._pop_expired(time.monotonic(), EXPIRY_BATCH_SIZE)
+                self.stats.evictions += removed
+            total_removed += removed
+
+            if removed < EXPIRY_BATCH_SIZE:
+                break
+
+        if total_removed:
+            logger.info(f"Cleaned up {total_removed} expired cache entries")
 
-            for key in expired_keys:
-                del self.cache[key]
+        return total_removed
 
-            if expired_keys:
-                self.stats.evictions += len(expired_keys)
-                logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
+    def cleanup_expired(self) -> int:
+        """Nettoie immédiatement les entrées expirées"""
+        return self._cleanup_expired()
 
     def get_stats(self) -> Dict[str, Any]:
         """Retourne les statistiques du cache"""
         with self.lock:
             self.stats.total_entries = len(self.cache)
+            self.stats.total_bytes = self.current_bytes
 
-        return self.stats.to_dict()
+        stats = self.stats.to_dict()
+        stats['max_size'] = self.max_size
+        stats['max_bytes'] = self.max_bytes
+        stats['policy'] = self.policy
+        if self._policy is not None:
+            stats['policy_stats'] = self._policy.get_stats()
+        return stats
 
     def get_all_entries(self) -> List[CacheEntry]:
         """Retourne toutes les entrées du cache"""
@@ -142,50 +463,113 @@ class MemoryCache:
                 if entry.metadata.get(key) == value
             ]
 
-    def backup_data(self, filename: str):
-        """Sauvegarde les données du cache"""
-        try:
-            with self.lock:
-                data = {
-                    'entries': [entry.to_dict() for entry in self.cache.values()],
-                    'stats': self.stats.to_dict(),
-                    'backup_timestamp': datetime.now().isoformat()
-                }
+    def backup_data(self, filename: str, since: Optional[float] = None) -> Optional[float]:
+        """
+        Sauvegarde les entrées valides en flux (instantané binaire)
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+        Seules des références aux entrées sont copiées sous verrou ; chaque
+        valeur est encodée et écrite hors verrou. Avec since, seules les
+        entrées écrites après ce watermark sont sauvegardées.
 
-            logger.info(f"✅ Memory cache backed up to {filename}")
+        Returns:
+            Watermark à passer au prochain instantané incrémental
+        """
+        try:
+            watermark = time.time() - WATERMARK_OVERLAP
+            now = time.monotonic()
+            with self.lock:
+                entries = list(self.cache.values())
+                stats = self.stats.to_dict()
+
+            header = {'source': 'memory', 'since': since, 'stats': stats,
+                      'backup_timestamp': datetime.now().isoformat()}
+            with SnapshotWriter(filename, header, self.codec) as writer:
+                for entry in entries:
+                    timestamp = entry.timestamp.timestamp()
+                    if entry.is_expired(now) or (since is not None and timestamp <= since):
+                        continue
+                    writer.write({
+                        'key': entry.key,
+                        'payload': self.codec.encode(entry.value),
+                        'timestamp': timestamp,
+                        'ttl': entry.ttl,
+                        'metadata': entry.metadata,
+                        'access_count': entry.access_count,
+                        'last_accessed': to_epoch(entry.last_accessed)
+                    })
+                writer.close({'watermark': watermark})
+
+            logger.info(f"✅ Memory cache backed up to {filename} ({writer.count} entries)")
+            return watermark
 
         except Exception as e:
             logger.error(f"Backup error: {e}")
+            return None
 
     def restore_data(self, filename: str):
-        """Restaure les données du cache"""
+        """Restaure un instantané en flux (ou une ancienne sauvegarde complète)"""
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            with self.lock:
-                # Restaurer les entrées
-                for entry_data in data.get('entries', []):
-                    entry = CacheEntry.from_dict(entry_data)
-                    self.cache[entry.key] = entry
-
-                # Restaurer les statistiques
-                stats_data = data.get('stats', {})
-                self.stats = CacheStats(
-                    total_entries=stats_data.get('total_entries', 0),
-                    hits=stats_data.get('hits', 0),
-                    misses=stats_data.get('misses', 0),
-                    evictions=stats_data.get('evictions', 0)
-                )
+            if not is_snapshot(filename):
+                self._restore_legacy(filename)
+                return
+
+            with SnapshotReader(filename, self.codec) as reader:
+                for record in reader:
+                    last_accessed = record.get('last_accessed')
+                    value = self.codec.decode(record['payload'])
+                    entry = CacheEntry(
+                        key=record['key'],
+                        value=value,
+                        timestamp=datetime.fromtimestamp(record['timestamp']),
+                        ttl=record['ttl'],
+                        metadata=record.get('metadata') or {},
+                        access_count=record.get('access_count', 0),
+                        last_accessed=datetime.fromtimestamp(last_accessed) if last_accessed else None,
+                        size=estimate_size(value)
+                    )
+                    if entry.is_expired():
+                        continue
+                    with self.lock:
+                        self._replace_entry(entry)
+                        self._enforce_limits()
+
+                if reader.header.get('since') is None:
+                    stats_data = reader.header.get('stats', {})
+                    with self.lock:
+                        self.stats.hits = stats_data.get('hits', 0)
+                        self.stats.misses = stats_data.get('misses', 0)
+                        self.stats.evictions = stats_data.get('evictions', 0)
 
             logger.info(f"✅ Memory cache restored from {filename}")
 
         except Exception as e:
             logger.error(f"Restore error: {e}")
 
+    def _restore_legacy(self, filename: str):
+        """Restaure une sauvegarde complète (binaire ou ancien format JSON)"""
+        with open(filename, 'rb') as f:
+            raw = f.read()
+        data = self.codec.decode(raw) if is_encoded(raw) else json.loads(raw.decode('utf-8'))
+
+        with self.lock:
+            # Restaurer les entrées
+            for entry_data in data.get('entries', []):
+                entry = CacheEntry.from_dict(entry_data)
+                entry.size = estimate_size(entry.value)
+                self._replace_entry(entry)
+            self._enforce_limits()
+
+            # Restaurer les statistiques
+            stats_data = data.get('stats', {})
+            self.stats = CacheStats(
+                total_entries=stats_data.get('total_entries', 0),
+                hits=stats_data.get('hits', 0),
+                misses=stats_data.get('misses', 0),
+                evictions=stats_data.get('evictions', 0)
+            )
+
+        logger.info(f"✅ Memory cache restored from {filename}")
+
     def get_size(self) -> int:
         """Retourne la taille actuelle du cache"""
         with self.lock:
@@ -200,5 +584,37 @@ class MemoryCache:
         self.max_size = max_size
         # Éviction immédiate si nécessaire
         with self.lock:
-            while len(self.cache) > self.max_size:
-                self._evict_lru()
+            if self._policy is not None:
+                self._policy.resize(max_size)
+            self._enforce_limits()
+
+    def set_policy(self, policy: str):
+        """Change la politique d'éviction, les entrées présentes sont conservées"""
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {policy}")
+
+        with self.lock:
+            if policy == self.policy:
+                return
+            self.policy = policy
+            self._policy = None
+            if policy == 'tinylfu':
+                self._policy = TinyLFUPolicy(self.max_size)
+                # Les entrées existantes entrent de la moins à la plus récemment utilisée
+                for key in self.cache:
+                    self._policy.record_insert(key)
+
+    def get_max_bytes(self) -> Optional[int]:
+        """Retourne le budget mémoire en octets (None = illimité)"""
+        return self.max_bytes
+
+    def set_max_bytes(self, max_bytes: Optional[int]):
+        """Modifie le budget mémoire en octets"""
+        self.max_bytes = max_bytes
+        with self.lock:
+            self._enforce_limits()
+
+    def get_bytes(self) -> int:
+        """Retourne la taille estimée des valeurs en cache"""
+        with self.lock:
+            return self.current_bytes
@@ -3,30 +3,202 @@ Cache PostgreSQL spécialisé
 """
 
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Set, Tuple
+from datetime import datetime, timedelta, timezone
 import json
 import hashlib
 
 try:
-    from psycopg2.extras import RealDictCursor
-    from psycopg2.pool import SimpleConnectionPool
+    import psycopg2
+    from psycopg2.extras import RealDictCursor, execute_values
+    from psycopg2.pool import ThreadedConnectionPool
     POSTGRESQL_AVAILABLE = True
+    CONNECTION_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError)
 except ImportError:
     POSTGRESQL_AVAILABLE = False
+    RealDictCursor = None
+    CONNECTION_ERRORS = ()
 
-from .cache_models import CacheEntry, CacheStats
+from .cache_codec import ValueCodec, default_codec, is_encoded
+from .cache_keys import TAGS_METADATA_KEY, glob_to_like, like_prefix
+from .cache_models import CacheEntry, CacheStats, remaining_ttl
+from .cache_snapshot import WATERMARK_OVERLAP, SnapshotReader, SnapshotWriter, is_snapshot, to_epoch
 
 logger = logging.getLogger(__name__)
 
+# Lignes par requête pour les opérations par lot
+BATCH_PAGE_SIZE = 1000
+
+# Colonnes d'une entrée lue ; remaining_ttl (secondes) est NULL pour une entrée sans expiration
+ENTRY_COLUMNS = """
+    key, value, payload, metadata,
+    CASE WHEN ttl = 0 THEN NULL
+         ELSE EXTRACT(EPOCH FROM timestamp + INTERVAL '1 second' * ttl - NOW())
+    END AS remaining_ttl
+"""
+
+# Ligne encore valide (ttl = 0 : pas d'expiration)
+LIVE_CONDITION = "(ttl = 0 OR timestamp + INTERVAL '1 second' * ttl > NOW())"
+
+# Colonnes d'une recherche qui distingue clé absente et ligne expirée
+# (valeur non transférée pour une ligne expirée)
+LOOKUP_COLUMNS = f"""
+    key, metadata, {LIVE_CONDITION} AS live,
+    CASE WHEN {LIVE_CONDITION} THEN value END AS value,
+    CASE WHEN {LIVE_CONDITION} THEN payload END AS payload,
+    CASE WHEN ttl = 0 THEN NULL
+         ELSE EXTRACT(EPOCH FROM timestamp + INTERVAL '1 second' * ttl - NOW())
+    END AS remaining_ttl
+"""
+
+# Schéma partagé par les backends synchrone et asynchrone
+CACHE_TABLE_DDL = """
+CREATE TABLE IF NOT EXISTS {table} (
+    key VARCHAR(255) PRIMARY KEY,
+    value JSONB,
+    payload BYTEA,
+    timestamp TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    ttl INTEGER DEFAULT 3600,
+    metadata JSONB DEFAULT '{{}}',
+    access_count INTEGER DEFAULT 0,
+    last_accessed TIMESTAMP WITH TIME ZONE
+);
+
+-- Valeurs encodées par ValueCodec ; value (JSONB) n'est plus lu qu'en repli
+ALTER TABLE {table} ADD COLUMN IF NOT EXISTS payload BYTEA;
+
+CREATE INDEX IF NOT EXISTS idx_cache_timestamp
+ON {table} (timestamp);
+
+CREATE INDEX IF NOT EXISTS idx_cache_ttl
+ON {table} (timestamp, ttl);
+
+-- Invalidation par tag : metadata @> '{{"tags": [...]}}'
+CREATE INDEX IF NOT EXISTS idx_cache_metadata
+ON {table} USING GIN (metadata jsonb_path_ops);
+
+-- Recherche par préfixe / motif : key LIKE 'prefix%'
+CREATE INDEX IF NOT EXISTS idx_cache_key_prefix
+ON {table} (key text_pattern_ops);
+"""
+
+def decode_cached_value(payload: Optional[bytes], value: Any, codec: ValueCodec) -> Any:
+    """Décode une ligne : payload binaire si présent, sinon ancienne valeur JSON"""
+    if payload is not None:
+        return codec.decode(payload)
+    return json.loads(value) if isinstance(value, str) else value
+
+def access_stats_update_sql(table: str, placeholders: Tuple[str, str, str]) -> str:
+    """UPDATE groupé des compteurs d'accès à partir de tableaux parallèles"""
+    keys, hits, last_accessed = placeholders
+    return f"""
+        UPDATE {table} AS c
+        SET access_count = c.access_count + a.hits,
+            last_accessed = GREATEST(c.last_accessed, a.last_accessed)
+        FROM unnest({keys}::text[], {hits}::int[], {last_accessed}::timestamptz[])
+            AS a(key, hits, last_accessed)
+        WHERE c.key = a.key
+    """
+
+COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+def copy_text_field(value: Any) -> str:
+    """Formate un champ pour COPY ... FROM STDIN (format texte)"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea en hexadécimal ; la barre oblique est doublée par l'échappement COPY
+        return '\\\\x' + bytes(value).hex()
+    return str(value).translate(COPY_ESCAPES)
+
+class CopyRowStream:
+    """Fichier en lecture seule alimenté par un itérateur de lignes (pour copy_expert)"""
+
+    def __init__(self, rows: Iterable[Tuple]):
+        self._rows = iter(rows)
+        self._buffer = b''
+        self.rows = 0
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._buffer += ('\t'.join(copy_text_field(field) for field in row) + '\n').encode('utf-8')
+            self.rows += 1
+
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    readline = read
+
+class AccessStatsBuffer:
+    """Compteurs d'accès en mémoire, vidés périodiquement en une seule requête"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._last_accessed: Dict[str, datetime] = {}
+
+    def record(self, keys: List[str]):
+        """Enregistre un accès pour chaque clé"""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            for key in keys:
+                self._hits[key] = self._hits.get(key, 0) + 1
+                self._last_accessed[key] = now
+
+    def drain(self) -> Tuple[List[str], List[int], List[datetime]]:
+        """Retire et retourne les compteurs accumulés (tableaux parallèles)"""
+        with self._lock:
+            hits, self._hits = self._hits, {}
+            last_accessed, self._last_accessed = self._last_accessed, {}
+
+        keys = list(hits)
+        return keys, [hits[key] for key in keys], [last_accessed[key] for key in keys]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._hits)
+
 class PostgreSQLCache:
     """Cache PostgreSQL avec indexation temporelle"""
 
-    def __init__(self, connection_string: Optional[str] = None):
+    def __init__(self, connection_string: Optional[str] = None,
+                 min_connections: int = 1,
+                 max_connections: int = 20,
+                 health_check_interval: float = 30.0,
+                 pool_timeout: float = 30.0,
+                 track_access: bool = True,
+                 access_flush_interval: float = 30.0,
+                 codec: Optional[ValueCodec] = None):
         self.connection_string = connection_string
         self.pool = None
         self.table_name = 'cache_entries'
         self.stats = CacheStats()
+        self.codec = codec or default_codec
+
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        # Une connexion inutilisée depuis plus longtemps est vérifiée avant usage
+        self.health_check_interval = health_check_interval
+        self.pool_timeout = pool_timeout
+        # Bloque les appelants quand le pool est saturé au lieu de lever PoolError
+        self._pool_slots = threading.BoundedSemaphore(max_connections)
+        self._last_checked: Dict[int, float] = {}
+
+        # Statistiques d'accès en écriture différée (les lectures restent des SELECT purs)
+        self.track_access = track_access
+        self.access_flush_interval = access_flush_interval
+        self._access_buffer = AccessStatsBuffer()
+        self._flush_stop = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_thread_lock = threading.Lock()
 
         if POSTGRESQL_AVAILABLE and self.connection_string:
             try:
@@ -41,45 +213,182 @@ class PostgreSQLCache:
     def _initialize_database(self):
         """Initialise la base de données PostgreSQL"""
         if not self.pool:
-            self.pool = SimpleConnectionPool(
-                1, 20, self.connection_string
+            # Pool thread-safe : le cache est utilisé depuis plusieurs threads
+            self.pool = ThreadedConnectionPool(
+                self.min_connections, self.max_connections, self.connection_string
             )
 
         # Créer la table si elle n'existe pas
-        create_table_sql = f"""
-        CREATE TABLE IF NOT EXISTS {self.table_name} (
-            key VARCHAR(255) PRIMARY KEY,
-            value JSONB,
-            timestamp TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-            ttl INTEGER DEFAULT 3600,
-            metadata JSONB DEFAULT '{{}}',
-            access_count INTEGER DEFAULT 0,
-            last_accessed TIMESTAMP WITH TIME ZONE
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_cache_timestamp
-        ON {self.table_name} (timestamp);
-
-        CREATE INDEX IF NOT EXISTS idx_cache_ttl
-        ON {self.table_name} (timestamp, ttl);
-        """
+        create_table_sql = CACHE_TABLE_DDL.format(table=self.table_name)
 
-        with self.pool.getconn() as conn:
+        with self._get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(create_table_sql)
                 conn.commit()
 
+    @contextmanager
+    def _get_connection(self, autocommit: bool = False):
+        """
+        Emprunte une connexion saine au pool et la rend toujours
+
+        Avec autocommit, chaque requête s'exécute hors transaction : une
+        lecture n'ouvre pas de transaction que le retour au pool devrait
+        annuler (ROLLBACK, un aller-retour de plus).
+        """
+        if not self._pool_slots.acquire(timeout=self.pool_timeout):
+            raise TimeoutError(f"No PostgreSQL connection available after {self.pool_timeout}s")
+
+        try:
+            conn = self._checkout()
+            broken = False
+            try:
+                if autocommit:
+                    conn.autocommit = True
+                yield conn
+            except CONNECTION_ERRORS:
+                broken = True
+                raise
+            except Exception:
+                self._safe_rollback(conn)
+                raise
+            finally:
+                if autocommit:
+                    broken = not self._restore_transactions(conn) or broken
+                self._release(conn, broken)
+        finally:
+            self._pool_slots.release()
+
+    @staticmethod
+    def _restore_transactions(conn) -> bool:
+        """Remet la connexion en mode transactionnel avant son retour au pool (False si impossible)"""
+        try:
+            conn.autocommit = False
+            return True
+        except Exception:
+            return False
+
+    def _checkout(self):
+        """Récupère une connexion du pool en écartant les connexions mortes"""
+        for _ in range(self.max_connections + 1):
+            conn = self.pool.getconn()
+            if self._is_healthy(conn):
+                return conn
+            logger.warning("Discarding broken PostgreSQL connection")
+            self._release(conn, broken=True)
+
+        raise ConnectionError("Unable to obtain a healthy PostgreSQL connection")
+
+    def _is_healthy(self, conn) -> bool:
+        """Vérifie une connexion (ping seulement si elle est restée inactive)"""
+        if getattr(conn, 'closed', 0):
+            return False
+
+        now = time.monotonic()
+        if now - self._last_checked.get(id(conn), 0.0) < self.health_check_interval:
+            return True
+
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+        except Exception:
+            return False
+
+        self._last_checked[id(conn)] = now
+        return True
+
+    def _release(self, conn, broken: bool = False):
+        """Rend la connexion au pool (fermée si elle est cassée)"""
+        close = broken or bool(getattr(conn, 'closed', 0))
+        if close:
+            self._last_checked.pop(id(conn), None)
+        else:
+            self._last_checked[id(conn)] = time.monotonic()
+
+        try:
+            self.pool.putconn(conn, close=close)
+        except Exception as e:
+            logger.error(f"Failed to return connection to pool: {e}")
+
+    @staticmethod
+    def _safe_rollback(conn):
+        """Annule la transaction en cours sans masquer l'erreur d'origine"""
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+
+    def _record_access(self, keys: List[str]):
+        """Bufferise les accès et démarre le thread de vidage si nécessaire"""
+        if not self.track_access or not keys:
+            return
+
+        self._access_buffer.record(keys)
+
+        if self._flush_thread is None:
+            with self._flush_thread_lock:
+                if self._flush_thread is None:
+                    self._flush_thread = threading.Thread(
+                        target=self._flush_worker, name='pg-cache-access-flush', daemon=True
+                    )
+                    self._flush_thread.start()
+
+    def _flush_worker(self):
+        """Vide périodiquement les compteurs d'accès"""
+        while not self._flush_stop.wait(self.access_flush_interval):
+            try:
+                self.flush_access_stats()
+            except Exception as e:
+                logger.error(f"Access stats flush thread error: {e}")
+
+    def flush_access_stats(self) -> int:
+        """Écrit les compteurs d'accès bufferisés en un seul UPDATE, retourne le nombre de clés"""
+        if not self.pool or not len(self._access_buffer):
+            return 0
+
+        keys, hits, last_accessed = self._access_buffer.drain()
+
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        access_stats_update_sql(self.table_name, ('%s', '%s', '%s')),
+                        (keys, hits, last_accessed)
+                    )
+                    conn.commit()
+            return len(keys)
+
+        except Exception as e:
+            # Statistiques indicatives : on les abandonne plutôt que de bloquer
+            logger.warning(f"Access stats flush failed, dropping {len(keys)} counters: {e}")
+            return 0
+
+    def close(self):
+        """Ferme toutes les connexions du pool"""
+        self._flush_stop.set()
+        self.flush_access_stats()
+
+        if self.pool:
+            self.pool.closeall()
+            self.pool = None
+            self._last_checked.clear()
+
     def get(self, key: str) -> Optional[Any]:
         """Récupère une valeur du cache"""
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else None
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Récupère une entrée valide avec ses métadonnées et son TTL restant"""
         if not self.pool:
             return None
 
         try:
-            with self.pool.getconn() as conn:
+            with self._get_connection(autocommit=True) as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cursor:
                     # Récupérer et vérifier l'expiration
                     cursor.execute(f"""
-                        SELECT * FROM {self.table_name}
+                        SELECT {ENTRY_COLUMNS} FROM {self.table_name}
                         WHERE key = %s
                         AND (ttl = 0 OR timestamp + INTERVAL '1 second' * ttl > NOW())
                     """, (key,))
@@ -87,19 +396,10 @@ class PostgreSQLCache:
                     result = cursor.fetchone()
 
                     if result:
-                        # Mettre à jour les statistiques d'accès
-                        cursor.execute(f"""
-                            UPDATE {self.table_name}
-                            SET access_count = access_count + 1,
-                                last_accessed = NOW()
-                            WHERE key = %s
-                        """, (key,))
-
-                        conn.commit()
+                        self._record_access([key])
                         self.stats.hits += 1
 
-                        # Convertir la valeur JSON
-                        return json.loads(result['value']) if isinstance(result['value'], str) else result['value']
+                        return self._row_entry(key, result)
 
                     self.stats.misses += 1
                     return None
@@ -108,29 +408,38 @@ class PostgreSQLCache:
             logger.error(f"Cache get error: {e}")
             return None
 
+    def _row_entry(self, key: str, row: Dict[str, Any]) -> CacheEntry:
+        """Entrée lue : TTL restant à partir de maintenant (0 : pas d'expiration)"""
+        remaining = row['remaining_ttl']
+        return CacheEntry(
+            key=key,
+            value=decode_cached_value(row['payload'], row['value'], self.codec),
+            timestamp=datetime.now(),
+            ttl=remaining_ttl(float(remaining)) if remaining is not None else 0,
+            metadata=row['metadata'] or {}
+        )
+
     def set(self, key: str, value: Any, ttl: int = 3600, metadata: Optional[Dict] = None):
         """Stocke une valeur dans le cache"""
         if not self.pool:
             return
 
         try:
-            with self.pool.getconn() as conn:
+            with self._get_connection() as conn:
                 with conn.cursor() as cursor:
-                    # Convertir la valeur en JSON
-                    json_value = json.dumps(value, default=str)
-
-                    # Insérer ou mettre à jour
+                    # Insérer ou mettre à jour (valeur encodée, colonne JSON vidée)
                     cursor.execute(f"""
-                        INSERT INTO {self.table_name} (key, value, ttl, metadata)
-                        VALUES (%s, %s, %s, %s)
+                        INSERT INTO {self.table_name} (key, value, payload, ttl, metadata)
+                        VALUES (%s, NULL, %s, %s, %s)
                         ON CONFLICT (key) DO UPDATE SET
-                            value = EXCLUDED.value,
+                            value = NULL,
+                            payload = EXCLUDED.payload,
                             timestamp = NOW(),
                             ttl = EXCLUDED.ttl,
                             metadata = EXCLUDED.metadata,
                             access_count = 0,
                             last_accessed = NULL
-                    """, (key, json_value, ttl, json.dumps(metadata or {})))
+                    """, (key, self.codec.encode(value), ttl, json.dumps(metadata or {})))
 
                     conn.commit()
 
@@ -143,7 +452,7 @@ class PostgreSQLCache:
             return False
 
         try:
-            with self.pool.getconn() as conn:
+            with self._get_connection() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute(f"DELETE FROM {self.table_name} WHERE key = %s", (key,))
                     deleted = cursor.rowcount > 0
@@ -154,13 +463,269 @@ class PostgreSQLCache:
             logger.error(f"Cache delete error: {e}")
             return False
 
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Récupère plusieurs valeurs en un aller-retour par lot (clés trouvées uniquement)"""
+        return {key: entry.value for key, entry in self.get_many_entries(keys).items()}
+
+    def get_many_entries(self, keys: List[str]) -> Dict[str, CacheEntry]:
+        """Récupère plusieurs entrées avec métadonnées et TTL restant (clés trouvées uniquement)"""
+        if not self.pool or not keys:
+            return {}
+
+        found = {}
+        try:
+            with self._get_connection(autocommit=True) as conn:
+                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                    for start in range(0, len(keys), BATCH_PAGE_SIZE):
+                        chunk = list(keys[start:start + BATCH_PAGE_SIZE])
+                        cursor.execute(f"""
+                            SELECT {ENTRY_COLUMNS} FROM {self.table_name}
+                            WHERE key = ANY(%s)
+                            AND (ttl = 0 OR timestamp + INTERVAL '1 second' * ttl > NOW())
+                        """, (chunk,))
+
+                        for row in cursor.fetchall():
+                            found[row['key']] = self._row_entry(row['key'], row)
+
+        except Exception as e:
+            logger.error(f"Cache get_many error: {e}")
+            return found
+
+        self._record_access(list(found))
+
+        self.stats.hits += len(found)
+        self.stats.misses += len(keys) - len(found)
+        return found
+
+    def lookup_entries(self, keys: List[str]) -> Tuple[Dict[str, CacheEntry], Set[str]]:
+        """
+        Entrées valides et clés ayant une ligne en table, expirée ou non
+
+        Une clé présente mais expirée n'est pas un faux positif du filtre de
+        clés (voir AdvancedCache). En cas d'erreur, toutes les clés sont
+        considérées présentes.
+        """
+        if not self.pool or not keys:
+            return {}, set()
+
+        found, present = {}, set()
+        try:
+            with self._get_connection(autocommit=True) as conn:
+                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                    for start in range(0, len(keys), BATCH_PAGE_SIZE):
+                        chunk = list(keys[start:start + BATCH_PAGE_SIZE])
+                        cursor.execute(f"""
+                            SELECT {LOOKUP_COLUMNS} FROM {self.table_name}
+                            WHERE key = ANY(%s)
+                        """, (chunk,))
+
+                        for row in cursor.fetchall():
+                            present.add(row['key'])
+                            if row['live']:
+                                found[row['key']] = self._row_entry(row['key'], row)
+
+        except Exception as e:
+            logger.error(f"Cache lookup error: {e}")
+            return found, set(keys)
+
+        self._record_access(list(found))
+
+        self.stats.hits += len(found)
+        self.stats.misses += len(keys) - len(found)
+        return found, present
+
+    def set_many(self, items: Dict[str, Any], ttl: int = 3600, metadata: Optional[Dict] = None):
+        """Stocke plusieurs valeurs par UPSERT multi-lignes"""
+        if not self.pool or not items:
+            return
+
+        metadata_json = json.dumps(metadata or {})
+        rows = [
+            (key, self.codec.encode(value), ttl, metadata_json)
+            for key, value in items.items()
+        ]
+
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    execute_values(cursor, f"""
+                        INSERT INTO {self.table_name} (key, payload, ttl, metadata)
+                        VALUES %s
+                        ON CONFLICT (key) DO UPDATE SET
+                            value = NULL,
+                            payload = EXCLUDED.payload,
+                            timestamp = NOW(),
+                            ttl = EXCLUDED.ttl,
+                            metadata = EXCLUDED.metadata,
+                            access_count = 0,
+                            last_accessed = NULL
+                    """, rows, page_size=BATCH_PAGE_SIZE)
+
+                    conn.commit()
+
+        except Exception as e:
+            logger.error(f"Cache set_many error: {e}")
+
+    def delete_many(self, keys: List[str]) -> int:
+        """Supprime plusieurs entrées en une requête, retourne le nombre supprimé"""
+        if not self.pool or not keys:
+            return 0
+
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        f"DELETE FROM {self.table_name} WHERE key = ANY(%s)", (list(keys),)
+                    )
+                    deleted_count = cursor.rowcount
+                    conn.commit()
+                    return deleted_count
+
+        except Exception as e:
+            logger.error(f"Cache delete_many error: {e}")
+            return 0
+
+    def get_pattern(self, pattern: str) -> Dict[str, Any]:
+        """Récupère les valeurs dont la clé correspond au motif glob (index text_pattern_ops)"""
+        if not self.pool:
+            return {}
+
+        found = {}
+        try:
+            with self._get_connection(autocommit=True) as conn:
+                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                    cursor.execute(f"""
+                        SELECT key, value, payload FROM {self.table_name}
+                        WHERE key LIKE %s ESCAPE '\\'
+                        AND (ttl = 0 OR timestamp + INTERVAL '1 second' * ttl > NOW())
+                    """, (glob_to_like(pattern),))
+
+                    for row in cursor.fetchall():
+                        found[row['key']] = decode_cached_value(
+                            row['payload'], row['value'], self.codec
+                        )
+
+        except Exception as e:
+            logger.error(f"Cache get_pattern error: {e}")
+
+        return found
+
+    def delete_tag(self, tag: str) -> int:
+        """Supprime les entrées portant un tag (index GIN sur metadata)"""
+        if not self.pool:
+            return 0
+
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        f"DELETE FROM {self.table_name} WHERE metadata @> %s::jsonb",
+                        (json.dumps({TAGS_METADATA_KEY: [tag]}),)
+                    )
+                    deleted_count = cursor.rowcount
+                    conn.commit()
+                    return deleted_count
+
+        except Exception as e:
+            logger.error(f"Cache delete_tag error: {e}")
+            return 0
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Supprime les entrées dont la clé commence par le préfixe"""
+        if not self.pool:
+            return 0
+
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        f"DELETE FROM {self.table_name} WHERE key LIKE %s ESCAPE '\\'",
+                        (like_prefix(prefix),)
+                    )
+                    deleted_count = cursor.rowcount
+                    conn.commit()
+                    return deleted_count
+
+        except Exception as e:
+            logger.error(f"Cache delete_prefix error: {e}")
+            return 0
+
+    def iter_keys(self, batch_size: int = 10000) -> Iterator[str]:
+        """Parcourt les clés valides via un curseur serveur (sans charger les valeurs)"""
+        if not self.pool:
+            return
+
+        with self._get_connection() as conn:
+            with conn.cursor(name=f"{self.table_name}_key_scan") as cursor:
+                cursor.itersize = batch_size
+                cursor.execute(f"""
+                    SELECT key FROM {self.table_name}
+                    WHERE ttl = 0 OR timestamp + INTERVAL '1 second' * ttl > NOW()
+                """)
+                for (key,) in cursor:
+                    yield key
+            conn.commit()
+
+    def count_keys(self) -> int:
+        """Nombre approximatif de lignes (statistiques du planificateur, sans scan)"""
+        if not self.pool:
+            return 0
+
+        try:
+            with self._get_connection(autocommit=True) as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                        (self.table_name,)
+                    )
+                    row = cursor.fetchone()
+                    return max(0, int(row[0])) if row else 0
+
+        except Exception as e:
+            logger.error(f"Cache count_keys error: {e}")
+            return 0
+
+    def hot_keys(self, limit: int = 100) -> List[str]:
+        """Clés valides les plus récemment lues (statistiques d'accès), pour le préchauffage"""
+        if not self.pool or limit <= 0:
+            return []
+
+        try:
+            with self._get_connection(autocommit=True) as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(f"""
+                        SELECT key FROM {self.table_name}
+                        WHERE last_accessed IS NOT NULL
+                          AND (ttl = 0 OR timestamp + INTERVAL '1 second' * ttl > NOW())
+                        ORDER BY last_accessed DESC, access_count DESC
+                        LIMIT %s
+                    """, (limit,))
+                    return [row[0] for row in cursor.fetchall()]
+
+        except Exception as e:
+            logger.error(f"Cache hot_keys error: {e}")
+            return []
+
+    def notify(self, channel: str, payloads: List[str]) -> int:
+        """Envoie des notifications sur un canal en une transaction, retourne le nombre envoyé"""
+        if not self.pool or not payloads:
+            return 0
+
+        with self._get_connection() as conn:
+            with conn.cursor() as cursor:
+                for payload in payloads:
+                    cursor.execute("SELECT pg_notify(%s, %s)", (channel, payload))
+                conn.commit()
+
+        return len(payloads)
+
     def clear(self):
         """Vide complètement le cache"""
         if not self.pool:
             return
 
         try:
-            with self.pool.getconn() as conn:
+            with self._get_connection() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute(f"TRUNCATE TABLE {self.table_name}")
                     conn.commit()
@@ -174,7 +739,7 @@ class PostgreSQLCache:
             return 0
 
         try:
-            with self.pool.getconn() as conn:
+            with self._get_connection() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute(f"""
                         DELETE FROM {self.table_name}
@@ -191,8 +756,11 @@ class PostgreSQLCache:
 
     def get_stats(self) -> Dict[str, Any]:
         """Retourne les statistiques du cache"""
+        if not self.pool:
+            return self.stats.to_dict()
+
         try:
-            with self.pool.getconn() as conn:
+            with self._get_connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cursor:
                     cursor.execute(f"SELECT COUNT(*) as total FROM {self.table_name}")
                     result = cursor.fetchone()
@@ -203,58 +771,149 @@ class PostgreSQLCache:
 
         return self.stats.to_dict()
 
-    def backup_data(self, filename: str):
-        """Sauvegarde les données du cache"""
+    def backup_data(self, filename: str, since: Optional[float] = None) -> Optional[float]:
+        """
+        Sauvegarde les entrées valides en flux (instantané binaire)
+
+        Les lignes sont lues par un curseur serveur et écrites une à une,
+        les charges binaires telles quelles : la mémoire utilisée ne dépend
+        pas de la taille du cache. Avec since (epoch), seules les entrées
+        écrites après ce watermark sont sauvegardées.
+
+        Returns:
+            Watermark (horloge du serveur) à passer au prochain instantané incrémental
+        """
         if not self.pool:
-            return
+            return None
 
         try:
-            with self.pool.getconn() as conn:
-                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                    cursor.execute(f"SELECT * FROM {self.table_name}")
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT EXTRACT(EPOCH FROM clock_timestamp())")
+                    watermark = float(cursor.fetchone()[0]) - WATERMARK_OVERLAP
 
-                    data = []
-                    for row in cursor.fetchall():
-                        data.append(dict(row))
+                header = {'source': 'postgresql', 'since': since}
+                with conn.cursor(name=f"{self.table_name}_snapshot") as cursor, \
+                        SnapshotWriter(filename, header, self.codec) as writer:
+                    cursor.itersize = BATCH_PAGE_SIZE
+                    cursor.execute(f"""
+                        SELECT key, payload, value, EXTRACT(EPOCH FROM timestamp), ttl,
+                               metadata, access_count, EXTRACT(EPOCH FROM last_accessed)
+                        FROM {self.table_name}
+                        WHERE (ttl = 0 OR timestamp + INTERVAL '1 second' * ttl > NOW())
+                          AND (%(since)s::float8 IS NULL OR timestamp > to_timestamp(%(since)s))
+                    """, {'since': since})
+
+                    for key, payload, value, timestamp, ttl, metadata, access_count, last_accessed in cursor:
+                        writer.write({
+                            'key': key,
+                            # Anciennes lignes JSON : valeur réencodée
+                            'payload': bytes(payload) if payload is not None else self.codec.encode(value),
+                            'timestamp': float(timestamp),
+                            'ttl': ttl,
+                            'metadata': metadata or {},
+                            'access_count': access_count,
+                            'last_accessed': float(last_accessed) if last_accessed is not None else None
+                        })
+                    writer.close({'watermark': watermark})
 
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2, default=str)
+                conn.commit()
 
-                    logger.info(f"✅ Cache backed up to {filename}")
+            logger.info(f"✅ Cache backed up to {filename} ({writer.count} entries)")
+            return watermark
 
         except Exception as e:
             logger.error(f"Backup error: {e}")
+            return None
 
     def restore_data(self, filename: str):
-        """Restaure les données du cache"""
+        """
+        Restaure un instantané en flux (ou une ancienne sauvegarde complète)
+
+        Les lignes sont chargées par COPY dans une table temporaire puis
+        fusionnées : une entrée existante n'est remplacée que par une version
+        plus récente, ce qui permet de rejouer un instantané complet puis ses
+        incréments.
+        """
         if not self.pool:
             return
 
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if is_snapshot(filename):
+                with SnapshotReader(filename, self.codec) as reader:
+                    restored = self._copy_rows(self._snapshot_rows(reader))
+            else:
+                restored = self._copy_rows(self._snapshot_rows(self._legacy_records(filename)))
 
-            with self.pool.getconn() as conn:
-                with conn.cursor() as cursor:
-                    for entry in data:
-                        cursor.execute(f"""
-                            INSERT INTO {self.table_name}
-                            (key, value, timestamp, ttl, metadata, access_count, last_accessed)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s)
-                            ON CONFLICT (key) DO NOTHING
-                        """, (
-                            entry['key'],
-                            entry['value'],
-                            entry['timestamp'],
-                            entry.get('ttl', 3600),
-                            json.dumps(entry.get('metadata', {})),
-                            entry.get('access_count', 0),
-                            entry.get('last_accessed')
-                        ))
-
-                    conn.commit()
-
-            logger.info(f"✅ Cache restored from {filename}")
+            logger.info(f"✅ Cache restored from {filename} ({restored} entries)")
 
         except Exception as e:
             logger.error(f"Restore error: {e}")
+
+    def _legacy_records(self, filename: str) -> Iterator[Dict[str, Any]]:
+        """Enregistrements d'une ancienne sauvegarde complète (binaire ou JSON)"""
+        with open(filename, 'rb') as f:
+            raw = f.read()
+        data = self.codec.decode(raw) if is_encoded(raw) else json.loads(raw.decode('utf-8'))
+
+        for entry in data:
+            yield {
+                'key': entry['key'],
+                'payload': self.codec.encode(entry['value']),
+                'timestamp': to_epoch(entry['timestamp']),
+                'ttl': entry.get('ttl', 3600),
+                'metadata': entry.get('metadata', {}),
+                'access_count': entry.get('access_count', 0),
+                'last_accessed': to_epoch(entry.get('last_accessed'))
+            }
+
+    @staticmethod
+    def _snapshot_rows(records: Iterable[Dict[str, Any]]) -> Iterator[Tuple]:
+        """Convertit les enregistrements en lignes COPY"""
+        for record in records:
+            yield (
+                record['key'],
+                record['payload'],
+                record['timestamp'],
+                record['ttl'],
+                json.dumps(record.get('metadata') or {}, default=str),
+                record.get('access_count', 0),
+                record.get('last_accessed')
+            )
+
+    def _copy_rows(self, rows: Iterable[Tuple]) -> int:
+        """Charge les lignes par COPY puis les fusionne dans la table, retourne le nombre lu"""
+        staging = f"{self.table_name}_restore"
+        stream = CopyRowStream(rows)
+
+        with self._get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(f"""
+                    CREATE TEMP TABLE {staging} (
+                        key TEXT, payload BYTEA, ts DOUBLE PRECISION, ttl INTEGER,
+                        metadata JSONB, access_count INTEGER, last_accessed DOUBLE PRECISION
+                    ) ON COMMIT DROP
+                """)
+                cursor.copy_expert(f"COPY {staging} FROM STDIN", stream)
+                cursor.execute(f"""
+                    INSERT INTO {self.table_name}
+                    (key, value, payload, timestamp, ttl, metadata, access_count, last_accessed)
+                    SELECT DISTINCT ON (key)
+                           key, NULL, payload, to_timestamp(ts), ttl, metadata,
+                           access_count, to_timestamp(last_accessed)
+                    FROM {staging}
+                    WHERE ttl = 0 OR to_timestamp(ts + ttl) > NOW()
+                    ORDER BY key, ts DESC
+                    ON CONFLICT (key) DO UPDATE SET
+                        value = NULL,
+                        payload = EXCLUDED.payload,
+                        timestamp = EXCLUDED.timestamp,
+                        ttl = EXCLUDED.ttl,
+                        metadata = EXCLUDED.metadata,
+                        access_count = EXCLUDED.access_count,
+                        last_accessed = EXCLUDED.last_accessed
+                    WHERE {self.table_name}.timestamp <= EXCLUDED.timestamp
+                """)
+                conn.commit()
+
+        return stream.rows
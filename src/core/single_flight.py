@@ -0,0 +1,129 @@
+"""
+Coalescence des calculs concurrents (single-flight)
+Un seul appelant calcule une clé donnée, les autres attendent son résultat
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class _Call:
+    """Calcul en cours partagé entre threads"""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+class SingleFlight:
+    """Single-flight synchrone (threads)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.coalesced = 0
+
+    def do(self, key: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Exécute func une seule fois pour les appels concurrents sur la même clé"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def in_flight(self, key: str) -> bool:
+        """Indique si un calcul est en cours pour la clé"""
+        with self._lock:
+            return key in self._calls
+
+class AsyncSingleFlight:
+    """
+    Single-flight asynchrone (coroutines d'une même boucle)
+
+    Les calculs en cours sont rangés par boucle d'événements : une instance
+    de niveau module sert des boucles successives ou simultanées (threads,
+    asyncio.run répétés) sans qu'une coroutine attende un futur d'une autre
+    boucle.
+    """
+
+    def __init__(self):
+        self._loops: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]' = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def _calls(self) -> Dict[str, asyncio.Future]:
+        """Calculs en cours de la boucle courante (RuntimeError hors boucle)"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            calls = self._loops.get(loop)
+            if calls is None:
+                calls = self._loops[loop] = {}
+            return calls
+
+    def _start(self, key: str, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> asyncio.Future:
+        """Démarre le calcul ou retourne celui en cours"""
+        calls = self._calls()
+        future = calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return future
+
+        future = asyncio.ensure_future(func(*args, **kwargs))
+        calls[key] = future
+
+        def _forget(done: asyncio.Future):
+            if calls.get(key) is done:
+                del calls[key]
+
+        future.add_done_callback(_forget)
+        return future
+
+    async def do(self, key: str, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Attend le calcul partagé (l'annulation d'un appelant ne l'interrompt pas)"""
+        return await asyncio.shield(self._start(key, func, *args, **kwargs))
+
+    def do_background(self, key: str, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> asyncio.Future:
+        """Lance le calcul partagé sans l'attendre (erreurs journalisées)"""
+        future = self._start(key, func, *args, **kwargs)
+
+        def _log_error(done: asyncio.Future):
+            if not done.cancelled() and done.exception() is not None:
+                logger.error(f"Background refresh failed for {key}: {done.exception()}")
+
+        future.add_done_callback(_log_error)
+        return future
+
+    def in_flight(self, key: str) -> bool:
+        """Indique si un calcul est en cours pour la clé dans la boucle courante"""
+        try:
+            return key in self._calls()
+        except RuntimeError:
+            return False
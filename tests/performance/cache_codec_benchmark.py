@@ -0,0 +1,107 @@
+"""
+Benchmark de l'encodage des valeurs de cache
+
+Compare l'ancien chemin JSON (json.dumps(default=str)) à ValueCodec
+sur des charges représentatives (articles de veille, résultats d'analyse).
+
+Usage : python -m tests.performance.cache_codec_benchmark
+"""
+
+import json
+import statistics
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.cache_codec import ValueCodec
+
+
+@dataclass
+class BenchArticle:
+    """Même forme que veilleur.Article"""
+    title: str
+    link: str
+    description: str
+    published_date: Optional[datetime] = None
+    source: str = ""
+    content: str = ""
+    tags: List[str] = field(default_factory=list)
+
+
+def build_payloads() -> Dict[str, Any]:
+    """Charges types : une petite valeur, une veille et une analyse"""
+    articles = [
+        BenchArticle(
+            title=f"Concurrent {i} annonce une nouvelle offre",
+            link=f"https://news.example.com/articles/{i}",
+            description="Annonce produit et partenariat stratégique. " * 5,
+            published_date=datetime(2024, 5, 17, 9, 30, tzinfo=timezone.utc),
+            source="example",
+            content="Paragraphe de contenu éditorial. " * 80,
+            tags=["ia", "marketing", "produit"]
+        )
+        for i in range(50)
+    ]
+    analysis = {
+        "slide_count": 24,
+        "slides": [
+            {"index": i, "layout": "title_content", "score": 0.87, "issues": ["contraste", "densité"]}
+            for i in range(24)
+        ],
+        "generated_at": datetime.now(timezone.utc),
+    }
+    return {
+        "small": {"status": "ok", "count": 3},
+        "veille_articles": articles,
+        "vision_analysis": analysis,
+    }
+
+
+def _time(func: Callable[[], Any], rounds: int) -> float:
+    """Temps médian d'un appel, en microsecondes"""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6
+
+
+def run_benchmark(rounds: int = 200) -> List[Dict[str, Any]]:
+    """Mesure taille et temps d'encodage/décodage pour chaque charge"""
+    codec = ValueCodec()
+    results = []
+
+    for name, value in build_payloads().items():
+        json_bytes = json.dumps(value, default=str).encode('utf-8')
+        codec_bytes = codec.encode(value)
+
+        results.append({
+            "payload": name,
+            "json_bytes": len(json_bytes),
+            "codec_bytes": len(codec_bytes),
+            "json_encode_us": _time(lambda: json.dumps(value, default=str).encode('utf-8'), rounds),
+            "codec_encode_us": _time(lambda: codec.encode(value), rounds),
+            "json_decode_us": _time(lambda: json.loads(json_bytes), rounds),
+            "codec_decode_us": _time(lambda: codec.decode(codec_bytes), rounds),
+        })
+
+    return results
+
+
+def main():
+    print(f"Compression : {ValueCodec().compression}")
+    header = f"{'payload':<18}{'json B':>10}{'codec B':>10}{'enc json':>11}{'enc codec':>11}{'dec json':>11}{'dec codec':>11}"
+    print(header)
+    for row in run_benchmark():
+        print(
+            f"{row['payload']:<18}{row['json_bytes']:>10}{row['codec_bytes']:>10}"
+            f"{row['json_encode_us']:>11.1f}{row['codec_encode_us']:>11.1f}"
+            f"{row['json_decode_us']:>11.1f}{row['codec_decode_us']:>11.1f}"
+        )
+    print("(temps médians en µs ; le décodage JSON ne restitue ni datetime ni dataclass)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Benchmark des backends d'extraction PDF (table de routage par profil de document)
+
+Génère un corpus de briefs par profil (texte simple, mise en page sur deux
+colonnes, pages scannées, document chiffré), mesure pour chaque backend
+disponible le temps d'extraction et la qualité du texte (mots et phrases
+retrouvés), puis classe les backends : les plus rapides parmi ceux qui
+atteignent le seuil de qualité du profil, les autres ensuite.
+
+Usage : python -m tests.performance.pdf_backend_benchmark [--briefs 12] [--output routing.json]
+Le fichier produit se charge via PDF_BACKEND_ROUTING.
+"""
+
+import argparse
+import json
+import random
+import re
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from fpdf import FPDF
+
+from src.bot.parser.pdf_backends import BACKENDS, available_backends, probe_pdf
+
+HEADERS = ["Objectives", "Target audience", "Budget", "Timeline", "Deliverables", "Success metrics"]
+VOCABULARY = (
+    "campaign brand awareness launch market audience budget media social video retail "
+    "conversion partner agency creative concept message product season digital channel "
+    "reach young urban families premium insight strategy quarter growth launch event"
+).split()
+
+# Qualité minimale par profil : part des mots (text) ou des phrases intactes (layout)
+QUALITY_THRESHOLDS = {'text': 0.99, 'layout': 0.95, 'encrypted': 0.99, 'scanned': 0.0}
+
+
+def make_sentence(rng: random.Random) -> str:
+    words = rng.choices(VOCABULARY, k=rng.randint(8, 16))
+    return ' '.join(words).capitalize() + '.'
+
+
+def write_brief(path: Path, profile: str, pages: int, rng: random.Random, image: str) -> List[str]:
+    """Écrit un brief et retourne ses phrases (texte attendu)"""
+    pdf = FPDF()
+    pdf.set_auto_page_break(False)
+    if profile == 'encrypted':
+        pdf.set_encryption(owner_password='owner', user_password='')
+    pdf.set_font('Helvetica', size=10)
+    sentences = []
+
+    for page in range(pages):
+        pdf.add_page()
+        if profile == 'scanned':
+            pdf.image(image, x=10, y=10, w=190)
+            continue
+
+        columns = [(10, 90), (110, 90)] if profile == 'layout' else [(10, 190)]
+        for x, width in columns:
+            pdf.set_xy(x, 15)
+            header = HEADERS[page % len(HEADERS)]
+            paragraph = [make_sentence(rng) for _ in range(12 if profile == 'layout' else 20)]
+            pdf.multi_cell(width, 5, header + '\n' + ' '.join(paragraph))
+            sentences.extend(paragraph)
+
+    pdf.output(str(path))
+    return sentences
+
+
+def supported_profiles() -> List[str]:
+    """Profils que la version installée de fpdf sait produire"""
+    profiles = ['text', 'layout']
+    try:
+        import PIL  # noqa: F401
+        profiles.append('scanned')
+    except ImportError:
+        print("Pillow absent : profil 'scanned' ignoré")
+    if hasattr(FPDF, 'set_encryption'):
+        profiles.append('encrypted')
+    else:
+        print("fpdf sans chiffrement (fpdf2 requis) : profil 'encrypted' ignoré")
+    return profiles
+
+
+def generate_corpus(directory: Path, briefs: int, seed: int = 42) -> Dict[str, List[Tuple[Path, List[str]]]]:
+    """Corpus de briefs par profil, de 1 à 40 pages"""
+    rng = random.Random(seed)
+    profiles = supported_profiles()
+    image = directory / "scan.png"
+    if 'scanned' in profiles:
+        _write_scan_image(image)
+
+    corpus = {}
+    for profile in profiles:
+        corpus[profile] = []
+        for i in range(briefs):
+            path = directory / f"{profile}_{i}.pdf"
+            pages = rng.choice([1, 2, 4, 8, 16, 40])
+            corpus[profile].append((path, write_brief(path, profile, pages, rng, str(image))))
+    return corpus
+
+
+def _write_scan_image(path: Path):
+    """Image de page scannée (bruit gris, sans couche texte)"""
+    from PIL import Image
+    Image.effect_noise((850, 1100), 40).convert('L').save(path)
+
+
+def normalize(text: str) -> str:
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+
+def quality(profile: str, text: str, sentences: List[str]) -> float:
+    """Part des mots retrouvés (phrases intactes pour le profil layout)"""
+    if not sentences:
+        return 1.0
+    if profile == 'layout':
+        extracted = normalize(text)
+        return sum(normalize(sentence) in extracted for sentence in sentences) / len(sentences)
+
+    expected = Counter(normalize(' '.join(sentences)).replace('.', '').split())
+    found = Counter(normalize(text).replace('.', '').split())
+    return sum((expected & found).values()) / sum(expected.values())
+
+
+def extract(backend_name: str, path: Path) -> str:
+    backend = BACKENDS[backend_name]
+    with backend.open_pages(str(path)) as pages:
+        texts = []
+        for page in pages:
+            texts.append(backend.page_text(page) or '')
+            backend.release_page(page)
+    return '\n\n'.join(texts)
+
+
+def measure(corpus: Dict[str, List[Tuple[Path, List[str]]]], repeats: int) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Temps total (meilleur de repeats) et qualité moyenne par profil et backend"""
+    results = {}
+    for profile, briefs in corpus.items():
+        results[profile] = {}
+        for name in available_backends():
+            best = float('inf')
+            scores = []
+            try:
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    texts = [extract(name, path) for path, _ in briefs]
+                    best = min(best, time.perf_counter() - start)
+                scores = [quality(profile, text, sentences) for text, (_, sentences) in zip(texts, briefs)]
+            except Exception as e:
+                print(f"  {name} a échoué sur le profil {profile} : {e}")
+                continue
+            results[profile][name] = {'seconds': best, 'quality': sum(scores) / len(scores)}
+    return results
+
+
+def routing_table(results: Dict[str, Dict[str, Dict[str, float]]]) -> Dict[str, List[str]]:
+    """Backends au-dessus du seuil par temps croissant, puis les autres par qualité décroissante"""
+    routing = {}
+    for profile, backends in results.items():
+        threshold = QUALITY_THRESHOLDS[profile]
+        good = sorted((name for name, r in backends.items() if r['quality'] >= threshold),
+                      key=lambda name: backends[name]['seconds'])
+        rest = sorted((name for name in backends if name not in good),
+                      key=lambda name: -backends[name]['quality'])
+        routing[profile] = good + rest
+    return routing
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--briefs', type=int, default=12, help="Briefs par profil")
+    parser.add_argument('--repeats', type=int, default=3, help="Mesures par backend (meilleur temps retenu)")
+    parser.add_argument('--output', help="Fichier JSON de routage à écrire")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        corpus = generate_corpus(Path(directory), args.briefs)
+        pages = {profile: sum(probe_pdf(str(path)).page_count or 0 for path, _ in briefs)
+                 for profile, briefs in corpus.items()}
+        results = measure(corpus, args.repeats)
+
+    print(f"Backends disponibles : {', '.join(available_backends())}")
+    print(f"{'profil':<11}{'backend':<12}{'pages':>7}{'temps (s)':>11}{'ms/page':>9}{'qualité':>9}")
+    for profile, backends in results.items():
+        for name, r in sorted(backends.items(), key=lambda item: item[1]['seconds']):
+            print(
+                f"{profile:<11}{name:<12}{pages[profile]:>7}{r['seconds']:>11.3f}"
+                f"{1000 * r['seconds'] / max(pages[profile], 1):>9.2f}{r['quality']:>9.3f}"
+            )
+
+    routing = routing_table(results)
+    print(json.dumps(routing, indent=2))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(routing, f, indent=2)
+        print(f"Table de routage écrite dans {args.output}")
+
+
+if __name__ == "__main__":
+    main()
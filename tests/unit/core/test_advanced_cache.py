@@ -7,7 +7,8 @@ from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 import json
 from src.core.advanced_cache import (
-    PostgreSQLCache, MemoryCache, AdvancedCache, CacheEntry
+    PostgreSQLCache, MemoryCache, AdvancedCache, CacheEntry, default_connection_string,
+    get_advanced_cache
 )
 
 
@@ -384,5 +385,125 @@ class TestAdvancedCache:
         assert result == "test_value"
 
 
+
+class TestAdvancedCacheBatch:
+    """Tests pour les opérations par lot d'AdvancedCache"""
+
+    def setup_method(self):
+        """Setup avant chaque test"""
+        self.cache = AdvancedCache()
+
+    def test_get_many_promotes_from_postgresql(self):
+        """Test lecture L1 puis un seul appel L2 pour les clés absentes"""
+        self.cache.memory_cache.set("l1", "from_memory")
+
+        l2_entry = CacheEntry(key="l2", value="from_postgresql", timestamp=datetime.now(),
+                              ttl=120, metadata={"tags": ["brand:acme"]})
+        with patch.object(self.cache.postgresql_cache, 'get_many_entries',
+                          return_value={"l2": l2_entry}) as pg_get_many:
+            found = self.cache.get_many(["l1", "l2", "missing"])
+
+        pg_get_many.assert_called_once_with(["l2", "missing"])
+        assert found == {"l1": "from_memory", "l2": "from_postgresql"}
+        assert self.cache.memory_cache.get("l2") == "from_postgresql"
+        promoted = self.cache.memory_cache.cache["l2"]
+        assert promoted.ttl == 120
+        assert promoted.metadata == {"tags": ["brand:acme"]}
+
+    def test_preload_keys_batches_reads_and_writes(self):
+        """Test préchargement : une lecture et une écriture par lot"""
+        self.cache.set("already", "cached")
+
+        with patch.object(self.cache.postgresql_cache, 'set_many') as pg_set_many:
+            loaded = self.cache.preload_keys(["already", "k1", "k2"], lambda key: key.upper())
+
+        assert loaded == 2
+        pg_set_many.assert_called_once()
+        assert self.cache.get_many(["k1", "k2"]) == {"k1": "K1", "k2": "K2"}
+
+    def test_delete_many(self):
+        """Test suppression par lot sur les deux niveaux"""
+        self.cache.set_many({"a": 1, "b": 2})
+
+        assert self.cache.delete_many(["a", "b"]) == 2
+        assert self.cache.get_many(["a", "b"]) == {}
+
+class TestAdvancedCacheInvalidation:
+    """Tests pour les tags et l'invalidation par préfixe d'AdvancedCache"""
+
+    def setup_method(self):
+        """Setup avant chaque test"""
+        self.cache = AdvancedCache()
+
+    def test_invalidate_tag(self):
+        """Test invalidation de toutes les entrées d'une marque"""
+        self.cache.set("veille:v1:a", 1, tags=["brand:acme"])
+        self.cache.set_many({"veille:v1:b": 2}, tags=["brand:acme", "prompt:v3"])
+        self.cache.set("veille:v1:c", 3, tags=["brand:other"])
+
+        with patch.object(self.cache.postgresql_cache, 'delete_tag', return_value=0) as pg_delete_tag:
+            assert self.cache.invalidate_tag("brand:acme") == 2
+
+        pg_delete_tag.assert_called_once_with("brand:acme")
+        assert self.cache.get("veille:v1:c") == 3
+        assert self.cache.get("veille:v1:a") is None
+
+    def test_invalidate_prefix_and_get_pattern(self):
+        """Test recherche par motif et invalidation par préfixe"""
+        self.cache.set("veille:v1:a", 1)
+        self.cache.set("veille:v2:a", 2)
+
+        with patch.object(self.cache.postgresql_cache, 'get_pattern',
+                          return_value={"veille:v1:l2": 0}):
+            assert self.cache.get_pattern("veille:v1:*") == {"veille:v1:a": 1, "veille:v1:l2": 0}
+
+        assert self.cache.invalidate_prefix("veille:v1:") == 1
+        assert self.cache.get("veille:v2:a") == 2
+
+class TestAdvancedCachePolicy:
+    """Tests de la politique d'éviction de L1"""
+
+    def test_policy_passed_through(self):
+        """Test politique transmise par get_advanced_cache"""
+        cache = get_advanced_cache(memory_policy="tinylfu")
+        assert cache.memory_cache.policy == "tinylfu"
+
+    def test_optimize_switches_policy(self):
+        """Test optimisation lecture (W-TinyLFU, L1 agrandi) puis écriture (LRU, L1 réduit)"""
+        cache = AdvancedCache(memory_size=1000)
+
+        cache.optimize_for_read()
+        assert cache.memory_cache.policy == "tinylfu"
+        assert cache.memory_cache.get_max_size() == 2000
+
+        cache.optimize_for_write()
+        assert cache.memory_cache.policy == "lru"
+        assert cache.memory_cache.get_max_size() == 1000
+
+class TestDefaultConnectionString:
+    """Tests du DSN du cache partagé"""
+
+    def test_explicit_url_wins(self, monkeypatch):
+        """Test CACHE_DATABASE_URL prioritaire sur DATABASE_URL"""
+        monkeypatch.setenv("DATABASE_URL", "postgresql://app@db/app")
+        monkeypatch.setenv("CACHE_DATABASE_URL", "postgresql://cache@db/cache")
+        assert default_connection_string() == "postgresql://cache@db/cache"
+
+    def test_built_from_db_config(self, monkeypatch):
+        """Test DSN construit depuis DB_* quand DB_HOST est défini"""
+        monkeypatch.delenv("CACHE_DATABASE_URL", raising=False)
+        monkeypatch.delenv("DATABASE_URL", raising=False)
+        monkeypatch.setenv("DB_HOST", "db")
+        monkeypatch.setenv("DB_PASS", "secret")
+        dsn = default_connection_string()
+        assert dsn.startswith("postgresql://")
+        assert ":secret@db:" in dsn
+
+    def test_memory_only_without_configuration(self, monkeypatch):
+        """Test aucun DSN sans configuration base de données"""
+        for name in ("CACHE_DATABASE_URL", "DATABASE_URL", "DB_HOST"):
+            monkeypatch.delenv(name, raising=False)
+        assert default_connection_string() is None
+
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -0,0 +1,171 @@
+"""
+Tests pour le filtre de Bloom devant le cache PostgreSQL (L2)
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from src.core.advanced_cache_orchestrator import AdvancedCache
+from src.core.bloom_filter import BloomFilter, KeyPresenceFilter
+from src.core.cache_models import CacheEntry
+
+
+class TestBloomFilter:
+    """Tests pour BloomFilter"""
+
+    def test_no_false_negatives(self):
+        """Test toute clé ajoutée est reconnue"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        keys = [f"veille:v1:{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+
+    def test_false_positive_rate_near_target(self):
+        """Test taux de faux positifs proche de la cible à pleine capacité"""
+        bloom = BloomFilter(capacity=5000, error_rate=0.01)
+        for i in range(5000):
+            bloom.add(f"present:{i}")
+
+        false_positives = sum(f"absent:{i}" in bloom for i in range(20000))
+
+        assert false_positives / 20000 < 0.02
+        assert bloom.estimated_false_positive_rate() == pytest.approx(0.01, rel=0.2)
+
+    def test_re_adding_keys_does_not_count(self):
+        """Test clés réécrites : pas de saturation artificielle du compteur"""
+        bloom = BloomFilter(capacity=100, error_rate=0.01)
+        for _ in range(50):
+            bloom.add("veille:v1:hot")
+            bloom.add("veille:v1:other")
+
+        assert bloom.count == 2
+
+    def test_invalid_parameters(self):
+        """Test paramètres invalides"""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            BloomFilter(error_rate=1.5)
+
+
+class TestKeyPresenceFilter:
+    """Tests pour KeyPresenceFilter"""
+
+    def test_not_ready_lets_everything_through(self):
+        """Test avant le premier scan, aucune clé n'est écartée"""
+        key_filter = KeyPresenceFilter(capacity=100)
+
+        assert key_filter.might_contain("anything")
+
+    def test_rebuild_keeps_concurrent_writes(self):
+        """Test écritures pendant le scan reportées dans le nouveau filtre"""
+        key_filter = KeyPresenceFilter(capacity=100)
+
+        def scan():
+            yield "scanned"
+            key_filter.add("written_during_scan")
+            yield "scanned_2"
+
+        assert key_filter.rebuild(scan()) == 2
+        assert key_filter.ready
+        assert key_filter.might_contain("written_during_scan")
+        assert key_filter.might_contain("scanned")
+        assert not key_filter.might_contain("absent")
+        assert key_filter.get_stats()['skipped_lookups'] == 1
+
+    def test_invalidation_during_scan_keeps_filter_unready(self):
+        """Test resynchronisation pendant le scan : filtre non fiable"""
+        key_filter = KeyPresenceFilter(capacity=100)
+
+        def scan():
+            yield "a"
+            key_filter.invalidate()
+
+        key_filter.rebuild(scan())
+
+        assert not key_filter.ready
+        assert key_filter.might_contain("absent")
+
+    def test_deletions_trigger_rebuild(self):
+        """Test accumulation de suppressions"""
+        key_filter = KeyPresenceFilter(capacity=10)
+        key_filter.rebuild([])
+
+        key_filter.record_deletions(6)
+
+        assert key_filter.needs_rebuild()
+
+
+class TestAdvancedCacheKeyFilter:
+    """Tests pour l'utilisation du filtre par AdvancedCache"""
+
+    def setup_method(self):
+        """Setup avant chaque test"""
+        self.cache = AdvancedCache()
+        self.cache.key_filter = KeyPresenceFilter(capacity=100)
+        self.cache.key_filter.rebuild(["known"])
+
+    def test_definite_miss_skips_postgresql(self):
+        """Test absence certaine : pas de requête L2"""
+        with patch.object(self.cache.postgresql_cache, 'get_entry') as pg_get:
+            assert self.cache.get("unknown") is None
+
+        pg_get.assert_not_called()
+        assert self.cache.get_stats()['bloom']['skipped_lookups'] == 1
+
+    def test_possible_hit_queries_postgresql(self):
+        """Test clé connue : requête L2, faux positif comptabilisé si absente"""
+        with patch.object(self.cache.postgresql_cache, 'lookup_entries',
+                          return_value=({}, set())) as pg_lookup:
+            assert self.cache.get("known") is None
+
+        pg_lookup.assert_called_once_with(["known"])
+        stats = self.cache.get_stats()['bloom']
+        assert stats['false_positives'] == 1
+        assert stats['false_positive_rate'] == 1.0
+
+    def test_expired_row_is_not_a_false_positive(self):
+        """Test ligne présente mais expirée : le filtre avait raison"""
+        with patch.object(self.cache.postgresql_cache, 'lookup_entries',
+                          return_value=({}, {"known"})):
+            assert self.cache.get("known") is None
+            assert self.cache.get_many(["known"]) == {}
+
+        assert self.cache.get_stats()['bloom']['false_positives'] == 0
+
+    def test_get_many_only_queries_possible_keys(self):
+        """Test lecture par lot limitée aux clés possibles"""
+        known = CacheEntry(key="known", value=1, timestamp=datetime.now(), ttl=60, metadata={})
+        with patch.object(self.cache.postgresql_cache, 'lookup_entries',
+                          return_value=({"known": known}, {"known"})) as pg_lookup:
+            assert self.cache.get_many(["known", "unknown"]) == {"known": 1}
+
+        pg_lookup.assert_called_once_with(["known"])
+        assert self.cache.get_stats()['bloom']['false_positives'] == 0
+
+    def test_writes_update_filter(self):
+        """Test écritures locales et distantes ajoutées au filtre"""
+        self.cache.set("local", 1)
+        self.cache._apply_invalidation({'op': 'set', 'keys': ["remote"]})
+
+        assert self.cache.key_filter.might_contain("local")
+        assert self.cache.key_filter.might_contain("remote")
+
+    def test_resync_disables_filter_until_rebuilt(self):
+        """Test resynchronisation : filtre désactivé puis reconstruit"""
+        with patch.object(self.cache, '_schedule_filter_rebuild') as schedule:
+            self.cache._apply_invalidation({'op': 'resync'})
+
+        schedule.assert_called_once()
+        assert self.cache.key_filter.might_contain("unknown")
+
+    def test_no_filter_without_postgresql(self):
+        """Test pas de filtre sans PostgreSQL"""
+        assert AdvancedCache().key_filter is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,133 @@
+"""
+Tests pour l'encodage binaire des valeurs de cache
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import pytest
+from src.core.cache_codec import HEADER_SIZE, ValueCodec, is_encoded
+from src.core.memory_cache import MemoryCache
+
+
+@dataclass
+class SampleArticle:
+    """Même forme que veilleur.Article"""
+    title: str
+    link: str
+    description: str
+    published_date: Optional[datetime] = None
+    source: str = ""
+    content: str = ""
+    tags: List[str] = field(default_factory=list)
+
+
+def make_article(i: int = 0) -> SampleArticle:
+    return SampleArticle(
+        title=f"Article {i}",
+        link=f"https://example.com/{i}",
+        description="Lancement produit " * 20,
+        published_date=datetime(2024, 5, 17, 9, 30, tzinfo=timezone.utc),
+        source="example",
+        content="Contenu " * 200,
+        tags=["ia", "marketing"]
+    )
+
+
+class TestValueCodec:
+    """Tests pour ValueCodec"""
+
+    def test_dataclass_round_trip(self):
+        """Test fidélité pour une dataclass contenant des datetimes"""
+        codec = ValueCodec()
+        article = make_article()
+
+        decoded = codec.decode(codec.encode(article))
+
+        assert decoded == article
+        assert isinstance(decoded.published_date, datetime)
+
+    def test_nested_structures_round_trip(self):
+        """Test listes, tuples, bytes et datetimes imbriqués"""
+        codec = ValueCodec()
+        value = {
+            "articles": [make_article(i) for i in range(3)],
+            "window": (datetime(2024, 1, 1), datetime(2024, 1, 31)),
+            "raw": b"\x00\x01",
+        }
+
+        assert codec.decode(codec.encode(value)) == value
+
+    def test_small_values_not_compressed(self):
+        """Test pas de compression sous le seuil"""
+        codec = ValueCodec(compress_threshold=1024)
+        encoded = codec.encode("short")
+
+        assert encoded[4] == 0
+
+    def test_large_values_compressed(self):
+        """Test compression au-delà du seuil"""
+        codec = ValueCodec(compression='zlib', compress_threshold=64)
+        value = [make_article(i) for i in range(20)]
+
+        encoded = codec.encode(value)
+        uncompressed = ValueCodec(compression='none').encode(value)
+
+        assert encoded[4] != 0
+        assert len(encoded) < len(uncompressed)
+        assert codec.decode(encoded) == value
+
+    def test_decode_is_codec_agnostic(self):
+        """Test décodage indépendant de la configuration du lecteur"""
+        writer = ValueCodec(serializer='json', compression='zlib', compress_threshold=0)
+        reader = ValueCodec()
+
+        assert reader.decode(writer.encode({"a": [1, 2]})) == {"a": [1, 2]}
+
+    def test_is_encoded(self):
+        """Test détection de l'en-tête"""
+        assert is_encoded(ValueCodec().encode(1))
+        assert not is_encoded(b'{"entries": []}')
+        assert not is_encoded(b"RC")
+        assert len(ValueCodec().encode(None)) > HEADER_SIZE
+
+    def test_unknown_serializer_rejected(self):
+        """Test sérialiseur inconnu"""
+        with pytest.raises(ValueError):
+            ValueCodec(serializer='xml')
+
+
+class TestMemoryCacheBackup:
+    """Tests pour les sauvegardes binaires du cache mémoire"""
+
+    def test_backup_restore_preserves_types(self, tmp_path):
+        """Test sauvegarde/restauration sans perte de type"""
+        backup_file = tmp_path / "memory.bin"
+        source = MemoryCache()
+        source.set("article", make_article(), ttl=3600)
+        source.backup_data(str(backup_file))
+
+        target = MemoryCache()
+        target.restore_data(str(backup_file))
+
+        assert target.get("article") == make_article()
+
+    def test_restore_legacy_json_backup(self, tmp_path):
+        """Test restauration d'une ancienne sauvegarde JSON"""
+        backup_file = tmp_path / "memory.json"
+        source = MemoryCache()
+        source.set("key", {"value": 1}, ttl=3600)
+        with source.lock:
+            data = {'entries': [entry.to_dict() for entry in source.cache.values()], 'stats': {}}
+        backup_file.write_text(json.dumps(data, default=str), encoding='utf-8')
+
+        target = MemoryCache()
+        target.restore_data(str(backup_file))
+
+        assert target.get("key") == {"value": 1}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
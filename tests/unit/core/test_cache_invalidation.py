@@ -0,0 +1,192 @@
+"""
+Tests pour la cohérence L1 entre workers (LISTEN/NOTIFY)
+"""
+
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+from src.core.advanced_cache_orchestrator import AdvancedCache
+from src.core.async_postgresql_cache import AsyncPostgreSQLCache
+from src.core.bloom_filter import KeyPresenceFilter
+from src.core.cache_invalidation import (
+    MAX_NOTIFY_PAYLOAD, CacheInvalidationBus, build_invalidation_messages
+)
+from src.core.memory_cache import FRESH_UNTIL_KEY
+
+
+class FakeNotifier:
+    """Remplace PostgreSQLCache.notify et relaie vers les autres bus"""
+
+    def __init__(self):
+        self.buses = []
+        self.sent = []
+
+    def __call__(self, channel, payloads):
+        self.sent.extend(payloads)
+        for bus in self.buses:
+            for payload in payloads:
+                bus.handle_payload(payload)
+        return len(payloads)
+
+
+class FakeAsyncConnection:
+    """Connexion asyncpg factice : les pg_notify sont relayés au commit"""
+
+    def __init__(self, notifier):
+        self.notifier = notifier
+        self.pending = []
+
+    async def execute(self, sql, *args):
+        if "pg_notify" in sql:
+            self.pending.append(args[1])
+        return "DELETE 1"
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+        self.notifier("cache_invalidation", self.pending)
+        self.pending = []
+
+
+class FakeAsyncPool:
+    """Pool asyncpg factice à connexion unique"""
+
+    def __init__(self, notifier):
+        self.conn = FakeAsyncConnection(notifier)
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+def make_worker(notifier, **kwargs):
+    """Crée un worker dont le bus est branché sur le notificateur factice"""
+    cache = AdvancedCache(invalidation_channel=None, **kwargs)
+    cache._invalidation_bus = CacheInvalidationBus(
+        "postgresql://unused", on_message=cache._apply_invalidation, notify=notifier
+    )
+    notifier.buses.append(cache._invalidation_bus)
+    return cache
+
+
+class TestInvalidationMessages:
+    """Tests pour l'encodage des notifications"""
+
+    def test_keys_are_chunked_under_notify_limit(self):
+        """Test découpage des listes de clés sous la limite de NOTIFY"""
+        keys = [f"veille:v1:{i:064d}" for i in range(500)]
+
+        messages = build_invalidation_messages("origin", "keys", keys=keys)
+
+        assert len(messages) > 1
+        assert all(len(message.encode('utf-8')) <= MAX_NOTIFY_PAYLOAD for message in messages)
+        assert [key for message in messages for key in json.loads(message)['keys']] == keys
+
+    def test_tag_message(self):
+        """Test message d'invalidation par tag"""
+        (message,) = build_invalidation_messages("origin", "tag", tag="brand:acme")
+
+        assert json.loads(message) == {"origin": "origin", "op": "tag", "tag": "brand:acme"}
+
+
+class TestCrossWorkerCoherence:
+    """Tests pour l'application des invalidations entre workers"""
+
+    def setup_method(self):
+        """Setup avant chaque test"""
+        self.notifier = FakeNotifier()
+        self.worker_a = make_worker(self.notifier)
+        self.worker_b = make_worker(self.notifier)
+
+    def test_set_drops_stale_copy_in_other_worker(self):
+        """Test une écriture retire la copie L1 des autres workers"""
+        self.worker_b.memory_cache.set("key", "old")
+
+        self.worker_a.set("key", "new")
+
+        assert self.worker_b.memory_cache.get("key") is None
+        assert self.worker_a.memory_cache.get("key") == "new"
+
+    def test_own_notifications_are_ignored(self):
+        """Test un worker n'invalide pas sa propre écriture"""
+        self.worker_a.set("key", "value")
+
+        assert self.worker_a._invalidation_bus.received == 0
+        assert self.worker_b._invalidation_bus.received == 1
+
+    def test_tag_prefix_and_clear_propagate(self):
+        """Test propagation des invalidations par tag, préfixe et vidage"""
+        self.worker_b.memory_cache.set("veille:v1:a", 1, metadata={"tags": ["brand:acme"]})
+        self.worker_b.memory_cache.set("vision:v1:a", 2)
+        self.worker_b.memory_cache.set("other", 3)
+
+        self.worker_a.invalidate_tag("brand:acme")
+        assert self.worker_b.memory_cache.get("veille:v1:a") is None
+
+        self.worker_a.invalidate_prefix("vision:")
+        assert self.worker_b.memory_cache.get("vision:v1:a") is None
+
+        self.worker_a.clear()
+        assert self.worker_b.memory_cache.get_size() == 0
+
+    def test_tag_invalidation_reaches_promoted_copy(self, tmp_path):
+        """Test copie promue depuis un L2 partagé : tags, fraîcheur et TTL restant conservés"""
+        path = str(tmp_path / "shared.db")
+        worker_a = make_worker(self.notifier, disk_cache_path=path)
+        worker_b = make_worker(self.notifier, disk_cache_path=path)
+        worker_a.set("veille:v1:a", "v1", ttl=120, tags=["brand:x"])
+        worker_a.set("veille:v1:b", "v2", metadata={FRESH_UNTIL_KEY: time.time() + 60}, tags=["brand:x"])
+
+        assert worker_b.get("veille:v1:a") == "v1"
+        assert worker_b.get_many(["veille:v1:b"]) == {"veille:v1:b": "v2"}
+        promoted = worker_b.memory_cache.cache["veille:v1:a"]
+        assert promoted.metadata["tags"] == ["brand:x"]
+        assert 0 < promoted.ttl <= 120
+        assert FRESH_UNTIL_KEY in worker_b.memory_cache.cache["veille:v1:b"].metadata
+
+        worker_a.invalidate_tag("brand:x")
+
+        assert worker_b.get("veille:v1:a") is None
+        assert worker_b.get("veille:v1:b") is None
+
+    def test_async_cache_writes_reach_workers(self):
+        """Test écritures du cache asynchrone : L1 et filtre de Bloom des workers à jour"""
+        async_cache = AsyncPostgreSQLCache()
+        async_cache.pool = FakeAsyncPool(self.notifier)
+        self.worker_b.key_filter = KeyPresenceFilter(capacity=100)
+        self.worker_b.key_filter.rebuild([])
+        self.worker_b.memory_cache.set("veille:v1:a", "old")
+
+        asyncio.run(async_cache.set("veille:v1:a", "new"))
+        assert self.worker_b.memory_cache.get("veille:v1:a") is None
+        assert self.worker_b.key_filter.might_contain("veille:v1:a")
+
+        self.worker_b.memory_cache.set("veille:v1:a", "new")
+        asyncio.run(async_cache.delete("veille:v1:a"))
+        assert self.worker_b.memory_cache.get("veille:v1:a") is None
+
+    def test_delete_many_publishes_once(self):
+        """Test une seule notification pour une suppression par lot"""
+        self.worker_a.delete_many(["a", "b", "c"])
+
+        assert len(self.notifier.sent) == 1
+
+    def test_invalid_payload_is_ignored(self):
+        """Test charge invalide journalisée sans exception"""
+        self.worker_b._invalidation_bus.handle_payload("not json")
+
+        assert self.worker_b._invalidation_bus.received == 0
+
+    def test_no_bus_without_postgresql(self):
+        """Test pas d'écoute sans pool PostgreSQL"""
+        cache = AdvancedCache()
+
+        assert cache._invalidation_bus is None
+        assert 'coherence' not in cache.get_stats()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,87 @@
+"""
+Tests pour les clés de cache déterministes
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+from src.core.cache_keys import make_key, canonical_serialize, function_namespace
+
+
+@dataclass
+class Query:
+    brand: str
+    limit: int
+
+
+class TestMakeKey:
+    """Tests pour make_key"""
+
+    def test_key_format(self):
+        """Test préfixe namespace/version et empreinte blake2b"""
+        key = make_key("veille", "nike", version=3)
+        namespace, version, digest = key.split(":")
+
+        assert namespace == "veille"
+        assert version == "v3"
+        assert len(digest) == 32
+
+    def test_kwargs_order_does_not_matter(self):
+        """Test indépendance vis-à-vis de l'ordre des kwargs"""
+        assert make_key("ns", a=1, b={"x": 1, "y": 2}) == make_key("ns", b={"y": 2, "x": 1}, a=1)
+
+    def test_distinguishes_values_and_types(self):
+        """Test valeurs et types distincts donnent des clés distinctes"""
+        assert make_key("ns", 1) != make_key("ns", "1")
+        assert make_key("ns", 1) != make_key("ns", 2)
+        assert make_key("ns", 1, version=1) != make_key("ns", 1, version=2)
+        assert make_key("a", 1) != make_key("b", 1)
+
+    def test_rich_types(self):
+        """Test types non JSON (datetime, set, dataclass)"""
+        moment = datetime(2025, 1, 15, 10, 30)
+        assert make_key("ns", moment) == make_key("ns", datetime(2025, 1, 15, 10, 30))
+        assert make_key("ns", {3, 1, 2}) == make_key("ns", {2, 3, 1})
+        assert make_key("ns", Query("nike", 10)) == make_key("ns", Query("nike", 10))
+        assert make_key("ns", Query("nike", 10)) != make_key("ns", Query("nike", 11))
+
+    def test_rejects_objects_without_canonical_form(self):
+        """Test objet arbitraire refusé plutôt que sérialisé par repr() ou vars()"""
+        class Options:
+            def __init__(self, depth):
+                self.depth = depth
+
+        with pytest.raises(TypeError, match="Options"):
+            make_key("ns", Options(2))
+
+    def test_canonical_serialize_is_compact(self):
+        """Test sérialisation canonique compacte et triée"""
+        assert canonical_serialize({"b": 1, "a": [1, 2]}) == b'{"a":[1,2],"b":1}'
+
+    def test_function_namespace(self):
+        """Test espace de noms d'une fonction"""
+        assert function_namespace(make_key) == "src.core.cache_keys.make_key"
+
+    def test_stable_across_processes(self):
+        """Test clé identique quel que soit PYTHONHASHSEED"""
+        code = (
+            "from src.core.cache_keys import make_key;"
+            "print(make_key('ns', 'nike', {'a', 'b'}, brand='x'))"
+        )
+        keys = set()
+        for seed in ("1", "2"):
+            env = dict(os.environ, PYTHONHASHSEED=seed)
+            output = subprocess.run(
+                [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+            )
+            keys.add(output.stdout.strip())
+
+        assert len(keys) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
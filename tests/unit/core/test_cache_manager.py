@@ -8,7 +8,9 @@ import asyncio
 from unittest.mock import patch, AsyncMock
 from datetime import datetime, timedelta
 import json
-from src.core.cache import CacheManager, cache_manager, cache_veille_data, cached
+from src.core.cache import (
+    CacheManager, cache_manager, cache_veille_data, cached, veille_cache_key
+)
 
 
 class TestCacheManager:
@@ -22,9 +24,8 @@ class TestCacheManager:
     @pytest.mark.asyncio
     async def test_cache_initialization(self, cache):
         """Test cache initialization"""
-        assert hasattr(cache, '_cache')
-        assert hasattr(cache, '_ttl')
-        assert hasattr(cache, '_lock')
+        assert hasattr(cache, '_shards')
+        assert all(hasattr(shard, 'lock') for shard in cache._shards)
     
     @pytest.mark.asyncio
     async def test_set_and_get(self, cache):
@@ -157,6 +158,70 @@ class TestCacheManager:
         assert value is None
 
 
+class TestCacheManagerStats:
+    """Test hit/miss/eviction accounting and sharding"""
+    
+    @pytest.mark.asyncio
+    async def test_hit_miss_counters(self):
+        """Test real hit and miss tracking"""
+        cache = CacheManager()
+        await cache.set("key", "value")
+        await cache.get("key")
+        await cache.get("key")
+        await cache.get("missing")
+        
+        stats = await cache.get_stats()
+        assert stats["cache_hits"] == 2
+        assert stats["cache_misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+    
+    @pytest.mark.asyncio
+    async def test_expired_entry_counts_as_eviction(self):
+        """Test expired entries are counted as evictions and misses"""
+        cache = CacheManager()
+        await cache.set("key", "value", ttl=-1)
+        
+        assert await cache.get("key") is None
+        stats = await cache.get_stats()
+        assert stats["cache_evictions"] == 1
+        assert stats["cache_misses"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_memory_usage_is_incremental(self):
+        """Test memory estimate follows sets and deletes"""
+        cache = CacheManager()
+        await cache.set("key", "x" * 1000)
+        stats = await cache.get_stats()
+        assert stats["memory_usage"] >= 1000
+        
+        await cache.delete("key")
+        stats = await cache.get_stats()
+        assert stats["memory_usage"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_keys_spread_over_shards(self):
+        """Test keys are distributed across shards"""
+        cache = CacheManager(num_shards=8)
+        for i in range(200):
+            await cache.set(f"key_{i}", i)
+        
+        populated = [shard for shard in cache._shards if shard.entries]
+        assert len(populated) == 8
+        assert (await cache.get_stats())["cache_size"] == 200
+    
+    @pytest.mark.asyncio
+    async def test_max_size_evicts_oldest(self):
+        """Test capacity-bound eviction"""
+        cache = CacheManager(num_shards=1, max_size=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.set("c", 3)
+        
+        assert await cache.get("a") is None
+        assert await cache.get("c") == 3
+        assert (await cache.get_stats())["cache_evictions"] == 1
+
+
 class TestCacheManagerInstance:
     """Test the global cache_manager instance"""
     
@@ -188,7 +253,7 @@ class TestCacheVeilleData:
         data = await cache_veille_data(competitors, date)
         
         # Verify it was cached
-        key = f"veille_{date}_{'_'.join(competitors)}"
+        key = veille_cache_key(competitors, date)
         cached_data = await cache_manager.get(key)
         assert cached_data is not None
         assert cached_data["competitors"] == competitors
@@ -253,6 +318,46 @@ class TestCachedDecorator:
         assert result3 == "result_a_b_different"
         assert call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_cached_decorator_with_version_and_namespace_kwargs(self):
+        """Test arguments named like make_key's own parameters"""
+        calls = []
+
+        @cached(ttl=60, version=2)
+        async def test_function(namespace, version=1):
+            calls.append((namespace, version))
+            return f"{namespace}_{version}"
+
+        assert await test_function(namespace="brand", version=3) == "brand_3"
+        assert await test_function(namespace="brand", version=3) == "brand_3"
+        assert await test_function(namespace="brand", version=4) == "brand_4"
+        assert calls == [("brand", 3), ("brand", 4)]
+
+    @pytest.mark.asyncio
+    async def test_cached_decorator_with_key_function(self):
+        """Test explicit key function for arguments without a canonical form"""
+        class Client:
+            def __init__(self, account):
+                self.account = account
+
+        calls = []
+
+        @cached(ttl=60, key=lambda client, brand: [client.account, brand])
+        async def test_function(client, brand):
+            calls.append(brand)
+            return f"{client.account}_{brand}"
+
+        assert await test_function(Client("acme"), "nike") == "acme_nike"
+        assert await test_function(Client("acme"), "nike") == "acme_nike"
+        assert calls == ["nike"]
+
+        @cached(ttl=60)
+        async def without_key(client):
+            return client.account
+
+        with pytest.raises(TypeError):
+            await without_key(Client("acme"))
+
 
 class TestCacheManagerIntegration:
     """Integration tests for CacheManager"""
@@ -297,7 +402,7 @@ class TestCacheManagerIntegration:
         data = await cache_veille_data(competitors, date)
         
         # 2. Verify data is cached
-        key = f"veille_{date}_{'_'.join(competitors)}"
+        key = veille_cache_key(competitors, date)
         cached_data = await cache_manager.get(key)
         assert cached_data is not None
         assert cached_data["competitors"] == competitors
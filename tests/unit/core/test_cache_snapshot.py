@@ -0,0 +1,118 @@
+"""
+Tests pour les instantanés de cache en flux et les sauvegardes incrémentales
+"""
+
+import json
+import time
+
+import pytest
+from src.core.advanced_cache_orchestrator import AdvancedCache
+from src.core.cache_snapshot import SnapshotReader, SnapshotWriter, is_snapshot
+from src.core.disk_cache import DiskCache
+from src.core.memory_cache import MemoryCache
+
+
+class TestSnapshotFormat:
+    """Tests pour SnapshotWriter / SnapshotReader"""
+
+    def test_round_trip(self, tmp_path):
+        """Test écriture et relecture entrée par entrée"""
+        path = str(tmp_path / "snap.bin")
+        with SnapshotWriter(path, {'source': 'test'}) as writer:
+            for i in range(3):
+                writer.write({'key': f"k{i}", 'payload': b"x" * i})
+            writer.close({'watermark': 12.5})
+
+        assert is_snapshot(path)
+        with SnapshotReader(path) as reader:
+            assert reader.header == {'source': 'test'}
+            assert [record['key'] for record in reader] == ["k0", "k1", "k2"]
+        assert reader.trailer == {'watermark': 12.5, 'count': 3}
+
+    def test_interrupted_write_keeps_previous_snapshot(self, tmp_path):
+        """Test une erreur pendant l'écriture ne remplace pas l'instantané existant"""
+        path = tmp_path / "snap.bin"
+        path.write_bytes(b"previous")
+
+        with pytest.raises(RuntimeError):
+            with SnapshotWriter(str(path)) as writer:
+                writer.write({'key': "k"})
+                raise RuntimeError("scan failed")
+
+        assert path.read_bytes() == b"previous"
+        assert not (tmp_path / "snap.bin.tmp").exists()
+
+    def test_truncated_snapshot_detected(self, tmp_path):
+        """Test fichier tronqué signalé"""
+        path = tmp_path / "snap.bin"
+        with SnapshotWriter(str(path)) as writer:
+            writer.write({'key': "k"})
+        path.write_bytes(path.read_bytes()[:-10])
+
+        with pytest.raises(ValueError):
+            with SnapshotReader(str(path)) as reader:
+                list(reader)
+
+
+class TestIncrementalSnapshots:
+    """Tests des instantanés incrémentaux par niveau"""
+
+    def test_memory_incremental(self, tmp_path):
+        """Test seules les entrées écrites après le watermark sont sauvegardées"""
+        cache = MemoryCache()
+        cache.set("old", 1, ttl=3600)
+        watermark = cache.backup_data(str(tmp_path / "full.bin"))
+
+        with cache.lock:
+            cache.cache["old"].timestamp = cache.cache["old"].timestamp.replace(year=2020)
+        cache.set("new", 2, ttl=3600)
+        cache.backup_data(str(tmp_path / "incr.bin"), since=watermark)
+
+        with SnapshotReader(str(tmp_path / "incr.bin")) as reader:
+            assert [record['key'] for record in reader] == ["new"]
+
+    def test_disk_restore_keeps_newer_entries(self, tmp_path):
+        """Test une entrée plus récente n'est pas écrasée par un ancien instantané"""
+        cache = DiskCache(str(tmp_path / "cache.db"))
+        cache.set("key", "old", ttl=3600)
+        cache.set("other", "kept", ttl=0)
+        cache.backup_data(str(tmp_path / "disk.bin"))
+
+        time.sleep(0.01)
+        cache.set("key", "new", ttl=3600)
+        cache.delete("other")
+        cache.restore_data(str(tmp_path / "disk.bin"))
+
+        assert cache.get("key") == "new"
+        assert cache.get("other") == "kept"
+        cache.close()
+
+    def test_advanced_cache_incremental_chain(self, tmp_path):
+        """Test sauvegarde complète puis incrémentale, restauration de la chaîne"""
+        source = AdvancedCache(disk_cache_path=str(tmp_path / "source.db"))
+        source.set("a", 1, ttl=3600)
+        full = str(tmp_path / "full.json")
+        source.backup_data(full)
+
+        source.disk_cache._connection().execute(
+            "UPDATE cache_entries SET created_at = created_at - 3600"
+        )
+        source.set("b", 2, ttl=3600)
+        incremental = str(tmp_path / "incr.json")
+        source.backup_data(incremental, since_backup=full)
+
+        with open(incremental, encoding='utf-8') as f:
+            index_data = json.load(f)
+        assert index_data['base'] == full
+        with SnapshotReader(f"{incremental}_disk.bin") as reader:
+            assert [record['key'] for record in reader] == ["b"]
+
+        target = AdvancedCache(disk_cache_path=str(tmp_path / "target.db"))
+        target.restore_data(incremental)
+
+        assert target.disk_cache.get("a") == 1
+        assert target.disk_cache.get("b") == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,133 @@
+"""
+Tests pour le préchauffage du cache au démarrage
+"""
+
+import json
+import threading
+import time
+
+import pytest
+from src.core.advanced_cache_orchestrator import AdvancedCache
+from src.core.cache_warmup import CacheWarmer, resolve_loader
+
+
+def load_brief(name, suffix=""):
+    """Loader de manifeste pour les tests"""
+    return f"brief:{name}{suffix}"
+
+
+async def load_veille(name):
+    """Loader asynchrone de manifeste pour les tests"""
+    return f"veille:{name}"
+
+
+class TestCacheWarmer:
+    """Tests pour CacheWarmer"""
+
+    def setup_method(self):
+        """Setup avant chaque test"""
+        self.cache = AdvancedCache()
+
+    def test_manifest_loaders(self, tmp_path):
+        """Test manifeste : loaders synchrones et asynchrones, TTL par défaut"""
+        manifest = tmp_path / "warmup.json"
+        manifest.write_text(json.dumps({
+            "defaults": {"ttl": 600},
+            "entries": [
+                {"key": "brief:a", "loader": f"{__name__}:load_brief", "args": ["a"],
+                 "kwargs": {"suffix": "!"}},
+                {"key": "veille:b", "loader": f"{__name__}.load_veille", "args": ["b"], "ttl": 60},
+                {"key": "broken", "loader": "src.core.missing_module:loader"}
+            ]
+        }), encoding='utf-8')
+
+        warmer = CacheWarmer(self.cache)
+        assert warmer.load_manifest(str(manifest)) == 2
+        assert warmer.tasks["brief:a"].ttl == 600
+
+        stats = warmer.run()
+
+        assert stats['ready'] and stats['loaded'] == 2
+        assert self.cache.get("brief:a") == "brief:a!"
+        assert self.cache.get("veille:b") == "veille:b"
+
+    def test_loaders_run_concurrently(self):
+        """Test loaders exécutés en parallèle sur le pool borné"""
+        barrier = threading.Barrier(4, timeout=2)
+
+        def slow_loader(i):
+            barrier.wait()
+            return i
+
+        warmer = CacheWarmer(self.cache, max_workers=4)
+        for i in range(4):
+            warmer.add(f"k{i}", slow_loader, args=(i,))
+
+        assert warmer.run()['loaded'] == 4
+
+    def test_existing_keys_and_failures(self):
+        """Test clés déjà présentes non recalculées, échecs comptabilisés"""
+        self.cache.set("present", "cached")
+        calls = []
+
+        def loader(key):
+            calls.append(key)
+            if key == "fails":
+                raise RuntimeError("API down")
+            return key
+
+        warmer = CacheWarmer(self.cache)
+        for key in ("present", "fails", "ok"):
+            warmer.add(key, loader, args=(key,))
+
+        stats = warmer.run()
+
+        assert sorted(calls) == ["fails", "ok"]
+        assert stats['failed'] == 1
+        assert stats['processed'] == 3
+        assert self.cache.get("present") == "cached"
+
+    def test_hot_keys_promoted_from_l2(self, tmp_path):
+        """Test clés chaudes de L2 promues en L1 sans loader"""
+        cache = AdvancedCache(disk_cache_path=str(tmp_path / "cache.db"))
+        cache.disk_cache.set("hot", "value", ttl=3600)
+
+        warmer = CacheWarmer(cache)
+        assert warmer.add_hot_keys(10) == 1
+        assert warmer.run()['promoted'] == 1
+        assert cache.memory_cache.get("hot") == "value"
+
+    def test_readiness_threshold_and_timeout(self):
+        """Test readiness : faux avant le démarrage, vrai au seuil ou après le délai"""
+        release = threading.Event()
+        warmer = CacheWarmer(self.cache, max_workers=1, ready_threshold=0.5, timeout=0.2, chunk_size=1)
+        warmer.add("slow", lambda: release.wait(5))
+        warmer.add("slow_2", lambda: release.wait(5))
+
+        assert not warmer.ready
+        warmer.start()
+        assert not warmer.ready
+
+        time.sleep(0.3)
+        assert warmer.ready and not warmer.get_stats()['finished']
+        release.set()
+        assert warmer.wait(5)
+
+    def test_empty_warmup_is_ready(self):
+        """Test sans clé à préchauffer : prêt dès la fin du run"""
+        warmer = CacheWarmer(self.cache)
+        warmer.run()
+
+        assert warmer.ready
+        assert warmer.progress == 1.0
+
+    def test_resolve_loader(self):
+        """Test résolution des chemins de loader"""
+        assert resolve_loader("json:dumps") is json.dumps
+        assert resolve_loader("json.dumps") is json.dumps
+        with pytest.raises(TypeError):
+            resolve_loader("json:decoder.JSONDecodeError.__doc__")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,143 @@
+"""
+Tests pour le cache disque local (SQLite WAL)
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+from src.core.advanced_cache_orchestrator import AdvancedCache
+from src.core.disk_cache import DiskCache
+
+
+class TestDiskCache:
+    """Tests pour DiskCache"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = DiskCache(str(tmp_path / "cache.db"))
+        yield cache
+        cache.close()
+
+    def test_wal_mode_enabled(self, cache):
+        """Test journal en mode WAL"""
+        mode = cache._connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_set_get_preserves_types(self, cache):
+        """Test écriture/lecture avec types conservés"""
+        value = {"published": datetime(2024, 5, 17, 9, 30), "tags": ("ia",)}
+        cache.set("key", value, ttl=60)
+
+        assert cache.get("key") == value
+        assert cache.get("missing") is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_ttl_expiry(self, cache):
+        """Test expiration et nettoyage"""
+        cache.set("short", 1, ttl=60)
+        cache.set("forever", 2, ttl=0)
+        cache._connection().execute(
+            "UPDATE cache_entries SET expires_at = ? WHERE key = 'short'", (time.time() - 1,)
+        )
+
+        assert cache.get("short") is None
+        assert cache.get("forever") == 2
+        assert cache.cleanup_expired() == 1
+
+    def test_batch_operations(self, cache):
+        """Test opérations par lot au-delà d'une page"""
+        items = {f"k{i}": i for i in range(1200)}
+        cache.set_many(items, ttl=60)
+
+        found = cache.get_many(list(items) + ["missing"])
+        assert found == items
+        assert cache.delete_many(list(items)[:700]) == 700
+        assert cache.get_stats()['total_entries'] == 500
+
+    def test_survives_restart(self, tmp_path):
+        """Test persistance entre deux instances (redémarrage)"""
+        path = str(tmp_path / "cache.db")
+        first = DiskCache(path)
+        first.set("veille", ["article"], ttl=3600)
+        first.close()
+
+        second = DiskCache(path)
+        assert second.get("veille") == ["article"]
+        second.close()
+
+    def test_backup_restore(self, cache, tmp_path):
+        """Test sauvegarde et restauration"""
+        cache.set("a", {"x": 1}, ttl=3600)
+        backup_file = str(tmp_path / "backup.bin")
+        cache.backup_data(backup_file)
+        cache.clear()
+
+        cache.restore_data(backup_file)
+        assert cache.get("a") == {"x": 1}
+
+    def test_tags_and_prefix_invalidation(self, cache):
+        """Test index de tags maintenu par triggers et suppression par préfixe"""
+        cache.set("veille:v1:a", 1, metadata={"tags": ["brand:acme"]})
+        cache.set("veille:v1:b", 2, metadata={"tags": ["brand:acme"]})
+        cache.set("vision:v1:a", 3)
+
+        # Réécriture sans tag : l'ancien tag ne doit plus cibler la clé
+        cache.set("veille:v1:b", 4)
+
+        assert cache.delete_tag("brand:acme") == 1
+        assert cache.get("veille:v1:b") == 4
+        assert cache.get_pattern("v*:v1:?") == {"veille:v1:b": 4, "vision:v1:a": 3}
+        assert cache.delete_prefix("veille:") == 1
+        assert cache._connection().execute("SELECT COUNT(*) FROM cache_entries_tags").fetchone()[0] == 0
+
+    def test_unavailable_path_degrades(self, tmp_path):
+        """Test chemin inutilisable : cache désactivé sans exception"""
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        cache = DiskCache(str(blocker / "cache.db"))
+
+        assert not cache.available
+        assert cache.get("key") is None
+        cache.set("key", 1)
+
+
+class TestAdvancedCacheDiskTier:
+    """Tests pour le niveau disque dans la hiérarchie L1/L2"""
+
+    def test_disk_used_as_l2_without_postgresql(self, tmp_path):
+        """Test L2 disque quand PostgreSQL est absent"""
+        path = str(tmp_path / "cache.db")
+        cache = AdvancedCache(disk_cache_path=path)
+
+        assert cache.l2_cache is cache.disk_cache
+        cache.set("key", "value", ttl=3600)
+
+        assert cache.get_stats()['cache_levels'] == 2
+        assert cache.health_check()['overall_status'] == 'healthy'
+
+        # Nouveau processus : L1 froid, L2 chaud
+        restarted = AdvancedCache(disk_cache_path=path)
+        assert restarted.memory_cache.get("key") is None
+        assert restarted.get("key") == "value"
+        assert restarted.memory_cache.get("key") == "value"
+
+    def test_env_var_enables_disk_tier(self, tmp_path, monkeypatch):
+        """Test activation par CACHE_DISK_PATH"""
+        monkeypatch.setenv('CACHE_DISK_PATH', str(tmp_path / "env.db"))
+        cache = AdvancedCache()
+
+        assert cache.disk_cache is not None
+
+    def test_memory_only_by_default(self, monkeypatch):
+        """Test pas de niveau disque sans configuration"""
+        monkeypatch.delenv('CACHE_DISK_PATH', raising=False)
+        cache = AdvancedCache()
+
+        assert cache.disk_cache is None
+        assert cache.l2_cache is cache.postgresql_cache
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
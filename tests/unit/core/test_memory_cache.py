@@ -0,0 +1,382 @@
+"""
+Tests pour le cache mémoire (L1)
+"""
+
+import heapq
+import math
+import time
+
+import pytest
+from src.core.memory_cache import MemoryCache, estimate_size, xfetch_due
+
+
+class TestMemoryCacheLRU:
+    """Tests pour l'éviction LRU et le budget en octets"""
+
+    def test_evicts_least_recently_used(self):
+        """Test éviction de l'entrée la moins récemment utilisée"""
+        cache = MemoryCache(max_size=3)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        # "a" devient la plus récemment utilisée
+        assert cache.get("a") == 1
+
+        cache.set("d", 4)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get_size() == 3
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_overwrite_does_not_evict(self):
+        """Test réécriture d'une clé existante sans éviction"""
+        cache = MemoryCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+
+        assert cache.get("a") == 10
+        assert cache.get("b") == 2
+        assert cache.get_stats()['evictions'] == 0
+
+    def test_max_bytes_budget(self):
+        """Test éviction selon le budget en octets"""
+        cache = MemoryCache(max_size=100, max_bytes=4000)
+        cache.set("small", "x")
+        cache.set("large1", "y" * 1500)
+        cache.set("large2", "z" * 1500)
+        cache.set("large3", "w" * 1500)
+
+        assert cache.get_bytes() <= 4000
+        assert cache.get("small") is None
+        assert cache.get("large3") == "w" * 1500
+
+    def test_value_larger_than_budget_is_skipped(self):
+        """Test valeur plus grosse que le budget non mise en cache"""
+        cache = MemoryCache(max_size=100, max_bytes=1000)
+        cache.set("keep", "x")
+        cache.set("huge", "y" * 5000)
+
+        assert cache.get("huge") is None
+        assert cache.get("keep") == "x"
+
+    def test_bytes_tracking(self):
+        """Test suivi des octets lors des ajouts et suppressions"""
+        cache = MemoryCache()
+        cache.set("a", {"payload": "x" * 100})
+        held = cache.get_bytes()
+        assert held >= estimate_size("x" * 100)
+
+        cache.delete("a")
+        assert cache.get_bytes() == 0
+
+    def test_stats_report_bytes_and_eviction_cost(self):
+        """Test statistiques : octets détenus et coût d'éviction"""
+        cache = MemoryCache(max_size=1)
+        cache.set("a", "value")
+        cache.set("b", "value")
+
+        stats = cache.get_stats()
+        assert stats['total_bytes'] == cache.get_bytes()
+        assert stats['evictions'] == 1
+        assert stats['eviction_time'] >= 0.0
+        assert 'avg_eviction_time' in stats
+
+    def test_avg_eviction_time_ignores_expiries(self):
+        """Test coût moyen d'éviction calculé sur les seules évictions pour capacité"""
+        cache = MemoryCache(max_size=1)
+        cache.set("a", "value")
+        cache.set("b", "value")
+        cache.set("c", "value", ttl=1)
+        cache.cache["c"].expires_at = time.monotonic() - 1
+        assert cache.get("c") is None
+
+        stats = cache.get_stats()
+        assert stats['evictions'] == 3
+        assert stats['capacity_evictions'] == 2
+        assert stats['avg_eviction_time'] == stats['eviction_time'] / 2
+
+    def test_set_max_size_shrinks(self):
+        """Test réduction de la taille maximale"""
+        cache = MemoryCache(max_size=10)
+        for i in range(10):
+            cache.set(f"k{i}", i)
+
+        cache.set_max_size(4)
+
+        assert cache.get_size() == 4
+        assert cache.get("k9") == 9
+        assert cache.get("k0") is None
+
+
+class TestMemoryCacheBatch:
+    """Tests pour les opérations par lot"""
+
+    def test_set_many_and_get_many(self):
+        """Test écriture et lecture par lot"""
+        cache = MemoryCache()
+        cache.set_many({"a": 1, "b": 2, "c": 3}, ttl=60)
+
+        assert cache.get_many(["a", "c", "missing"]) == {"a": 1, "c": 3}
+        stats = cache.get_stats()
+        assert stats['hits'] == 2
+        assert stats['misses'] == 1
+
+    def test_set_many_respects_max_size(self):
+        """Test limites appliquées après une écriture par lot"""
+        cache = MemoryCache(max_size=2)
+        cache.set_many({"a": 1, "b": 2, "c": 3})
+
+        assert cache.get_size() == 2
+        assert cache.get("a") is None
+
+    def test_delete_many(self):
+        """Test suppression par lot"""
+        cache = MemoryCache()
+        cache.set_many({"a": 1, "b": 2})
+
+        assert cache.delete_many(["a", "b", "missing"]) == 2
+        assert cache.get_size() == 0
+        assert cache.get_bytes() == 0
+
+
+class TestMemoryCacheExpiry:
+    """Tests pour l'index d'expiration (tas d'échéances monotones)"""
+
+    def test_entry_precomputes_monotonic_deadline(self):
+        """Test échéance monotone précalculée sur l'entrée"""
+        cache = MemoryCache()
+        before = time.monotonic()
+        cache.set("a", 1, ttl=60)
+
+        entry = cache.cache["a"]
+        assert before + 60 <= entry.expires_at <= time.monotonic() + 60
+
+    def test_no_ttl_never_expires(self):
+        """Test TTL nul : l'entrée n'expire pas et n'est pas indexée"""
+        cache = MemoryCache()
+        cache.set("forever", 1, ttl=0)
+
+        assert cache.cache["forever"].expires_at == math.inf
+        assert cache._expiry_heap == []
+
+    def test_cleanup_removes_only_expired(self):
+        """Test nettoyage limité aux entrées échues"""
+        cache = MemoryCache()
+        cache.set("expired1", 1, ttl=60)
+        cache.set("expired2", 2, ttl=60)
+        cache.set("valid", 3, ttl=3600)
+
+        # Avancer artificiellement les échéances
+        for key in ("expired1", "expired2"):
+            cache.cache[key].expires_at = time.monotonic() - 1
+        cache._expiry_heap = [
+            (entry.expires_at, i, entry) for i, entry in enumerate(cache.cache.values())
+        ]
+        heapq.heapify(cache._expiry_heap)
+
+        assert cache.cleanup_expired() == 2
+        assert list(cache.cache) == ["valid"]
+        assert cache.get_stats()['evictions'] == 2
+
+    def test_overwritten_entry_is_not_expired_by_stale_deadline(self):
+        """Test une ancienne échéance ne supprime pas la nouvelle valeur"""
+        cache = MemoryCache()
+        cache.set("a", "old", ttl=1)
+        cache.set("a", "new", ttl=3600)
+
+        # L'échéance de l'ancienne entrée est dépassée
+        stale = cache._expiry_heap[0][2]
+        stale.expires_at = time.monotonic() - 1
+        cache._expiry_heap[0] = (stale.expires_at,) + cache._expiry_heap[0][1:]
+
+        assert cache.cleanup_expired() == 0
+        assert cache.get("a") == "new"
+
+    def test_expiry_heap_is_compacted(self):
+        """Test compaction du tas après de nombreuses réécritures"""
+        cache = MemoryCache()
+        for _ in range(1000):
+            cache.set("hot", "value", ttl=3600)
+
+        assert len(cache._expiry_heap) <= 2 * cache.get_size() + 65
+
+
+class TestMemoryCacheIndexes:
+    """Tests pour les index de tags et d'espaces de noms"""
+
+    def test_delete_tag(self):
+        """Test invalidation par tag"""
+        cache = MemoryCache()
+        cache.set("veille:v1:a", 1, metadata={"tags": ["brand:acme"]})
+        cache.set("veille:v1:b", 2, metadata={"tags": ["brand:acme", "prompt:v3"]})
+        cache.set("veille:v1:c", 3, metadata={"tags": ["brand:other"]})
+
+        assert sorted(cache.keys_with_tag("brand:acme")) == ["veille:v1:a", "veille:v1:b"]
+        assert cache.delete_tag("brand:acme") == 2
+        assert cache.get("veille:v1:c") == 3
+        assert cache.keys_with_tag("prompt:v3") == []
+
+    def test_delete_prefix(self):
+        """Test invalidation par préfixe"""
+        cache = MemoryCache()
+        cache.set("veille:v1:a", 1)
+        cache.set("veille:v2:a", 2)
+        cache.set("vision:v1:a", 3)
+
+        assert cache.delete_prefix("veille:v1:") == 1
+        assert cache.delete_prefix("vei") == 1
+        assert cache.get("vision:v1:a") == 3
+
+    def test_get_pattern(self):
+        """Test recherche par motif glob"""
+        cache = MemoryCache()
+        cache.set("veille:v1:aa", 1)
+        cache.set("veille:v2:ab", 2)
+        cache.set("vision:v1:aa", 3)
+
+        assert cache.get_pattern("veille:*") == {"veille:v1:aa": 1, "veille:v2:ab": 2}
+        assert cache.get_pattern("*:v1:a?") == {"veille:v1:aa": 1, "vision:v1:aa": 3}
+
+    def test_indexes_follow_eviction_and_overwrite(self):
+        """Test index mis à jour à l'éviction et à la réécriture"""
+        cache = MemoryCache(max_size=1)
+        cache.set("ns:a", 1, metadata={"tags": ["t"]})
+        cache.set("ns:b", 2)
+
+        assert cache.keys_with_tag("t") == []
+        cache.set("ns:b", 3, metadata={"tags": ["u"]})
+        assert cache.keys_with_tag("u") == ["ns:b"]
+
+        cache.clear()
+        assert cache._tag_index == {}
+        assert cache._namespace_index == {}
+
+
+class TestMemoryCacheEarlyRefresh:
+    """Tests pour le rafraîchissement anticipé probabiliste (XFetch)"""
+
+    def test_xfetch_probability_grows_with_cost_and_proximity(self):
+        """Test probabilité croissante avec le coût et la proximité de l'échéance"""
+        def rate(remaining, compute_time):
+            return sum(xfetch_due(0.0, remaining, compute_time) for _ in range(2000)) / 2000
+
+        assert rate(remaining=100, compute_time=0.01) == 0
+        assert rate(remaining=10, compute_time=10) > rate(remaining=10, compute_time=2) > 0
+        assert rate(remaining=1, compute_time=2) > rate(remaining=10, compute_time=2)
+        assert xfetch_due(5.0, 5.0, 0.0)
+
+    def test_only_entries_with_compute_cost(self):
+        """Test seules les entrées avec un coût de recalcul sont concernées"""
+        cache = MemoryCache()
+        cache.set("cheap", 1, ttl=1)
+        cache.set("costly", 2, ttl=1, metadata={"compute_time": 1000.0})
+        cache.set("forever", 3, ttl=0, metadata={"compute_time": 1000.0})
+
+        assert not cache.should_refresh_early("cheap")
+        assert cache.should_refresh_early("costly")
+        assert not cache.should_refresh_early("forever")
+        assert not cache.should_refresh_early("missing")
+
+    def test_uses_fresh_until_when_present(self):
+        """Test échéance de fraîcheur prioritaire sur le TTL"""
+        cache = MemoryCache()
+        cache.set("a", 1, ttl=3600, metadata={
+            "compute_time": 0.001, "fresh_until": time.time() - 1
+        })
+
+        assert cache.should_refresh_early("a")
+
+
+class TestMemoryCacheTinyLFU:
+    """Tests pour la politique W-TinyLFU"""
+
+    def test_unknown_policy_rejected(self):
+        """Test politique inconnue"""
+        with pytest.raises(ValueError):
+            MemoryCache(policy="fifo")
+
+    def test_scan_does_not_flush_hot_entries(self):
+        """Test un parcours de clés uniques ne chasse pas les entrées chaudes"""
+        cache = MemoryCache(max_size=100, policy="tinylfu")
+        hot = [f"ai:brief:{i}" for i in range(50)]
+        for key in hot:
+            cache.set(key, key)
+        for _ in range(5):
+            for key in hot:
+                cache.get(key)
+
+        for i in range(1000):
+            cache.set(f"veille:scan:{i}", i)
+
+        assert sum(cache.get(key) is not None for key in hot) >= 45
+        assert cache.get_size() == 100
+        assert cache.get_stats()['policy_stats']['rejected'] > 0
+
+    def test_lru_is_flushed_by_scan(self):
+        """Test référence : LRU perd les entrées chaudes lors du même parcours"""
+        cache = MemoryCache(max_size=100)
+        hot = [f"ai:brief:{i}" for i in range(50)]
+        for key in hot:
+            cache.set(key, key)
+            cache.get(key)
+
+        for i in range(1000):
+            cache.set(f"veille:scan:{i}", i)
+
+        assert all(cache.get(key) is None for key in hot)
+
+    def test_overwrite_keeps_protected_segment(self):
+        """Test réécriture d'une clé chaude : elle reste dans le segment protégé"""
+        cache = MemoryCache(max_size=100, policy="tinylfu")
+        for i in range(10):
+            cache.set(f"k{i}", i)
+        cache.get("k0")
+        assert "k0" in cache._policy.protected
+
+        cache.set("k0", "updated")
+        cache.set_many({"k0": "again"})
+
+        assert "k0" in cache._policy.protected
+        assert "k0" not in cache._policy.window
+        segments = cache._policy.get_stats()
+        assert segments['window'] + segments['probation'] + segments['protected'] == cache.get_size()
+
+    def test_policy_tracks_removals(self):
+        """Test cohérence de la politique après suppressions et vidage"""
+        cache = MemoryCache(max_size=10, policy="tinylfu")
+        for i in range(20):
+            cache.set(f"k{i}", i)
+        cache.delete("k19")
+
+        segments = cache._policy.get_stats()
+        assert segments['window'] + segments['probation'] + segments['protected'] == cache.get_size()
+
+        cache.clear()
+        assert cache._policy.get_stats()['probation'] == 0
+
+    def test_set_policy_keeps_entries(self):
+        """Test changement de politique à chaud, entrées conservées"""
+        cache = MemoryCache(max_size=10)
+        for i in range(10):
+            cache.set(f"k{i}", i)
+
+        cache.set_policy("tinylfu")
+        segments = cache._policy.get_stats()
+        assert segments['window'] + segments['probation'] + segments['protected'] == cache.get_size() == 10
+
+        cache.set("k10", 10)
+        assert cache.get_size() == 10
+
+        cache.set_policy("lru")
+        assert cache._policy is None
+        assert cache.get_stats()['policy'] == "lru"
+
+        with pytest.raises(ValueError):
+            cache.set_policy("fifo")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,459 @@
+"""
+Tests pour le cache PostgreSQL (pool factice, sans Docker)
+"""
+
+import json
+import threading
+
+import pytest
+from src.core.cache_models import CacheStats
+from src.core.cache_snapshot import WATERMARK_OVERLAP, SnapshotReader, SnapshotWriter
+from src.core.postgresql_cache import CACHE_TABLE_DDL, PostgreSQLCache, POSTGRESQL_AVAILABLE
+
+
+class FakeCursor:
+    """Curseur factice enregistrant les requêtes"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.connection = conn
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if self.conn.fail_next:
+            self.conn.fail_next = False
+            self.conn.closed = 1
+            raise ConnectionResetError("server closed the connection")
+        if isinstance(sql, bytes):
+            sql = sql.decode()
+        self.conn.executed.append((" ".join(sql.split()), params))
+        self.conn.autocommit_statements += self.conn.autocommit
+        self.rowcount = self.conn.rowcount
+
+    def mogrify(self, template, args):
+        # Utilisé par psycopg2.extras.execute_values
+        return repr(tuple(args)).encode()
+
+    def fetchone(self):
+        return self.conn.rows.pop(0) if self.conn.rows else None
+
+    def fetchall(self):
+        rows, self.conn.rows = self.conn.rows, []
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def copy_expert(self, sql, file, size=8192):
+        self.conn.executed.append((sql, None))
+        while True:
+            chunk = file.read(size)
+            if not chunk:
+                break
+            self.conn.copied += chunk
+
+
+class FakeConnection:
+    """Connexion factice"""
+
+    def __init__(self):
+        self.closed = 0
+        self.encoding = 'UTF8'
+        self.executed = []
+        self.rows = []
+        self.rowcount = 0
+        self.commits = 0
+        self.rollbacks = 0
+        self.autocommit = False
+        self.autocommit_statements = 0
+        self.fail_next = False
+        self.copied = b''
+
+    def cursor(self, cursor_factory=None, name=None):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class FakePool:
+    """Pool factice qui lève une erreur quand il est épuisé, comme psycopg2"""
+
+    def __init__(self, maxconn=2):
+        self.maxconn = maxconn
+        self.idle = []
+        self.used = set()
+        self.created = 0
+        self.discarded = 0
+        self.lock = threading.Lock()
+
+    def getconn(self):
+        with self.lock:
+            if len(self.used) >= self.maxconn:
+                raise RuntimeError("connection pool exhausted")
+            conn = self.idle.pop() if self.idle else None
+            if conn is None:
+                conn = FakeConnection()
+                self.created += 1
+            self.used.add(conn)
+            return conn
+
+    def putconn(self, conn, close=False):
+        with self.lock:
+            self.used.discard(conn)
+            if close:
+                self.discarded += 1
+            else:
+                self.idle.append(conn)
+
+    def closeall(self):
+        self.idle.clear()
+
+
+def make_cache(maxconn=2, **kwargs):
+    """Crée un cache branché sur un pool factice"""
+    cache = PostgreSQLCache(max_connections=maxconn, **kwargs)
+    cache.pool = FakePool(maxconn)
+    return cache
+
+
+class TestPostgreSQLConnectionLifecycle:
+    """Tests du cycle de vie des connexions"""
+
+    def test_connections_are_returned_to_pool(self):
+        """Test le pool n'est jamais épuisé après de nombreuses opérations"""
+        cache = make_cache(maxconn=2)
+
+        for i in range(50):
+            cache.set(f"key_{i}", {"i": i})
+            cache.get(f"key_{i}")
+            cache.delete(f"key_{i}")
+
+        assert cache.pool.used == set()
+        assert cache.pool.created == 1
+
+    def test_broken_connection_is_discarded(self):
+        """Test une connexion cassée n'est pas remise dans le pool"""
+        cache = make_cache()
+        cache.get("warmup")
+        conn = cache.pool.idle[0]
+        conn.fail_next = True
+
+        assert cache.get("key") is None
+        assert cache.pool.discarded == 1
+        assert conn not in cache.pool.idle
+
+        # Une nouvelle connexion est ouverte pour l'appel suivant
+        cache.get("key")
+        assert cache.pool.created == 2
+
+    def test_closed_connection_skipped_on_checkout(self):
+        """Test une connexion fermée par le serveur est écartée à l'emprunt"""
+        cache = make_cache()
+        cache.get("warmup")
+        cache.pool.idle[0].closed = 1
+
+        cache.get("key")
+
+        assert cache.pool.discarded == 1
+        assert cache.pool.created == 2
+
+    def test_idle_connection_is_pinged(self):
+        """Test ping des connexions restées inactives"""
+        cache = make_cache(health_check_interval=0)
+        cache.get("key")
+
+        conn = cache.pool.idle[0]
+        assert ("SELECT 1", None) in conn.executed
+
+    def test_fresh_connection_not_pinged_again(self):
+        """Test pas de ping pour une connexion utilisée récemment"""
+        cache = make_cache(health_check_interval=60)
+        cache.get("a")
+        cache.get("b")
+
+        pings = [sql for sql, _ in cache.pool.idle[0].executed if sql == "SELECT 1"]
+        assert len(pings) == 1
+
+    def test_concurrent_threads_wait_for_free_connection(self):
+        """Test les threads attendent une connexion libre au lieu d'échouer"""
+        cache = make_cache(maxconn=2)
+        errors = []
+
+        def worker():
+            for i in range(20):
+                try:
+                    cache.set(f"k{i}", i)
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert errors == []
+        assert cache.pool.used == set()
+
+    def test_no_pool_is_noop(self):
+        """Test mode dégradé sans PostgreSQL"""
+        cache = PostgreSQLCache()
+        assert cache.get("key") is None
+        assert cache.delete("key") is False
+        assert isinstance(cache.get_stats(), dict)
+
+
+class TestPostgreSQLBatchOperations:
+    """Tests des opérations par lot"""
+
+    def setup_method(self):
+        """Setup avant chaque test"""
+        self.cache = make_cache()
+        self.cache.get("warmup")
+        self.conn = self.cache.pool.idle[0]
+        self.conn.executed.clear()
+        self.cache.stats = CacheStats()
+
+    def test_get_many_single_select(self):
+        """Test une seule requête ANY pour plusieurs clés"""
+        self.conn.rows = [
+            {'key': 'a', 'value': '{"x": 1}', 'payload': None, 'metadata': {}, 'remaining_ttl': None},
+            {'key': 'b', 'value': {'x': 2}, 'payload': None, 'metadata': {}, 'remaining_ttl': None},
+        ]
+
+        found = self.cache.get_many(['a', 'b', 'c'])
+
+        assert found == {'a': {'x': 1}, 'b': {'x': 2}}
+        selects = [sql for sql, _ in self.conn.executed if sql.startswith("SELECT key, value")]
+        assert len(selects) == 1
+        assert "WHERE key = ANY(%s)" in selects[0]
+        assert self.cache.stats.hits == 2
+        assert self.cache.stats.misses == 1
+
+    def test_lookup_separates_expired_rows(self):
+        """Test recherche : ligne expirée présente mais non renvoyée"""
+        self.conn.rows = [
+            {'key': 'a', 'live': True, 'value': None, 'payload': None, 'metadata': {}, 'remaining_ttl': 30},
+            {'key': 'b', 'live': False, 'value': None, 'payload': None, 'metadata': {}, 'remaining_ttl': -5},
+        ]
+
+        found, present = self.cache.lookup_entries(['a', 'b', 'c'])
+
+        assert list(found) == ['a']
+        assert present == {'a', 'b'}
+        sql = self.conn.executed[-1][0]
+        assert "AS live" in sql
+        assert "ttl" not in sql.split("WHERE")[1]
+        assert self.cache.stats.hits == 1
+        assert self.cache.stats.misses == 2
+
+    @pytest.mark.skipif(not POSTGRESQL_AVAILABLE, reason="psycopg2 non installé")
+    def test_set_many_multi_row_upsert(self):
+        """Test UPSERT multi-lignes : quelques requêtes pour des milliers de clés"""
+        items = {f"key_{i}": {"i": i} for i in range(2500)}
+
+        self.cache.set_many(items, ttl=60)
+
+        inserts = [sql for sql, _ in self.conn.executed if sql.startswith("INSERT")]
+        assert len(inserts) == 3
+        assert self.conn.commits == 1
+
+    def test_delete_many_single_statement(self):
+        """Test suppression par lot en une requête"""
+        self.conn.rowcount = 2
+
+        assert self.cache.delete_many(['a', 'b']) == 2
+        assert self.conn.executed == [
+            ("DELETE FROM cache_entries WHERE key = ANY(%s)", (['a', 'b'],))
+        ]
+
+    def test_empty_batches_skip_database(self):
+        """Test lots vides sans aller-retour"""
+        assert self.cache.get_many([]) == {}
+        self.cache.set_many({})
+        assert self.cache.delete_many([]) == 0
+        assert self.conn.executed == []
+
+
+
+class TestPostgreSQLInvalidation:
+    """Tests des recherches par motif et invalidations indexées"""
+
+    def setup_method(self):
+        """Setup avant chaque test"""
+        self.cache = make_cache()
+        self.cache.get("warmup")
+        self.conn = self.cache.pool.idle[0]
+        self.conn.executed.clear()
+
+    def test_get_pattern_uses_like(self):
+        """Test motif glob traduit en LIKE échappé"""
+        self.conn.rows = [{'key': 'veille:v1:a_b', 'value': None, 'payload': self.cache.codec.encode(1), 'metadata': {}, 'remaining_ttl': None}]
+
+        assert self.cache.get_pattern("veille:v1:a_*") == {'veille:v1:a_b': 1}
+        sql, params = self.conn.executed[0]
+        assert "WHERE key LIKE %s ESCAPE" in sql
+        assert params == ('veille:v1:a\\_%',)
+
+    def test_delete_tag_uses_containment(self):
+        """Test invalidation par tag via @> (index GIN)"""
+        self.conn.rowcount = 3
+
+        assert self.cache.delete_tag("brand:acme") == 3
+        sql, params = self.conn.executed[0]
+        assert "metadata @> %s::jsonb" in sql
+        assert json.loads(params[0]) == {"tags": ["brand:acme"]}
+
+    def test_delete_prefix(self):
+        """Test invalidation par préfixe littéral"""
+        self.conn.rowcount = 2
+
+        assert self.cache.delete_prefix("veille:v1:") == 2
+        assert self.conn.executed[0][1] == ('veille:v1:%',)
+
+    def test_notify_sends_all_payloads_in_one_transaction(self):
+        """Test pg_notify pour chaque charge, un seul commit"""
+        assert self.cache.notify("cache_invalidation", ['{"a":1}', '{"b":2}']) == 2
+
+        assert [params for _, params in self.conn.executed] == [
+            ("cache_invalidation", '{"a":1}'),
+            ("cache_invalidation", '{"b":2}'),
+        ]
+        assert self.conn.commits == 1
+
+    def test_schema_declares_indexes(self):
+        """Test index GIN et text_pattern_ops dans le schéma"""
+        assert "USING GIN (metadata jsonb_path_ops)" in CACHE_TABLE_DDL
+        assert "(key text_pattern_ops)" in CACHE_TABLE_DDL
+
+
+class TestPostgreSQLSnapshots:
+    """Tests des instantanés en flux (curseur serveur et COPY)"""
+
+    def setup_method(self):
+        """Setup avant chaque test"""
+        self.cache = make_cache()
+        self.cache.get("warmup")
+        self.conn = self.cache.pool.idle[0]
+        self.conn.executed.clear()
+
+    def test_backup_streams_rows(self, tmp_path):
+        """Test sauvegarde incrémentale : filtre since, charges binaires conservées"""
+        payload = self.cache.codec.encode({"x": 1})
+        self.conn.rows = [
+            (1000.0,),
+            ('a', payload, None, 1000.0, 60, {}, 2, None),
+            ('legacy', None, {"y": 2}, 1000.0, 0, {"tags": ["t"]}, 0, 1001.0),
+        ]
+        backup_file = str(tmp_path / "pg.bin")
+
+        watermark = self.cache.backup_data(backup_file, since=900.0)
+
+        assert watermark == 1000.0 - WATERMARK_OVERLAP
+        assert self.conn.executed[1][1] == {'since': 900.0}
+        with SnapshotReader(backup_file) as reader:
+            records = list(reader)
+        assert records[0]['payload'] == payload
+        assert self.cache.codec.decode(records[1]['payload']) == {"y": 2}
+        assert reader.trailer == {'watermark': watermark, 'count': 2}
+
+    def test_restore_uses_copy_and_keeps_newer_rows(self, tmp_path):
+        """Test restauration par COPY dans une table temporaire puis fusion"""
+        backup_file = str(tmp_path / "pg.bin")
+        with SnapshotWriter(backup_file) as writer:
+            writer.write({'key': 'tab\tkey', 'payload': b'\x00\xff', 'timestamp': 1000.0,
+                          'ttl': 0, 'metadata': {}, 'access_count': 1, 'last_accessed': None})
+
+        self.cache.restore_data(backup_file)
+
+        statements = [sql for sql, _ in self.conn.executed]
+        assert statements[1] == "COPY cache_entries_restore FROM STDIN"
+        assert "WHERE cache_entries.timestamp <= EXCLUDED.timestamp" in statements[2]
+        assert self.conn.copied == b'tab\\tkey\t\\\\x00ff\t1000.0\t0\t{}\t1\t\\N\n'
+        assert self.conn.commits == 1
+
+
+class TestPostgreSQLAccessStats:
+    """Tests des statistiques d'accès en écriture différée"""
+
+    def make_warm_cache(self, **kwargs):
+        cache = make_cache(access_flush_interval=3600, **kwargs)
+        cache.get("warmup")
+        conn = cache.pool.idle[0]
+        conn.executed.clear()
+        return cache, conn
+
+    def test_get_is_pure_select(self):
+        """Test une lecture L2 ne fait ni UPDATE ni COMMIT"""
+        cache, conn = self.make_warm_cache()
+        conn.rows = [{'value': '"hello"', 'payload': None, 'metadata': {}, 'remaining_ttl': None}]
+
+        assert cache.get("key") == "hello"
+        assert [sql.split()[0] for sql, _ in conn.executed] == ["SELECT"]
+        assert conn.commits == 0
+
+    def test_reads_run_in_autocommit(self):
+        """Test lectures hors transaction : rien à annuler au retour dans le pool"""
+        cache, conn = self.make_warm_cache()
+        conn.autocommit_statements = conn.rollbacks = 0
+        conn.rows = [{'key': 'a', 'value': '1', 'payload': None, 'metadata': {}, 'remaining_ttl': None}]
+
+        assert cache.get_many(["a", "b"]) == {"a": 1}
+        cache.get_pattern("veille:*")
+        cache.set("key", 1)
+
+        assert conn.autocommit_statements == 2
+        assert conn.autocommit is False
+        assert conn.rollbacks == 0
+
+    def test_access_counters_flushed_in_one_update(self):
+        """Test un seul UPDATE groupé pour tous les accès bufferisés"""
+        cache, conn = self.make_warm_cache()
+        for _ in range(3):
+            conn.rows = [{'value': '1', 'payload': None, 'metadata': {}, 'remaining_ttl': None}]
+            cache.get("hot")
+        conn.rows = [{'value': '2', 'payload': None, 'metadata': {}, 'remaining_ttl': None}]
+        cache.get("warm")
+        conn.executed.clear()
+
+        assert cache.flush_access_stats() == 2
+
+        assert len(conn.executed) == 1
+        sql, (keys, hits, last_accessed) = conn.executed[0]
+        assert sql.startswith("UPDATE cache_entries AS c")
+        assert dict(zip(keys, hits)) == {"hot": 3, "warm": 1}
+        assert len(last_accessed) == 2
+        assert cache.flush_access_stats() == 0
+
+    def test_tracking_disabled(self):
+        """Test mode sans suivi des accès"""
+        cache, conn = self.make_warm_cache(track_access=False)
+        conn.rows = [{'value': '1', 'payload': None, 'metadata': {}, 'remaining_ttl': None}]
+        cache.get("key")
+
+        assert cache.flush_access_stats() == 0
+        assert cache._flush_thread is None
+
+    def test_close_flushes_pending_counters(self):
+        """Test vidage des compteurs à la fermeture"""
+        cache, conn = self.make_warm_cache()
+        conn.rows = [{'value': '1', 'payload': None, 'metadata': {}, 'remaining_ttl': None}]
+        cache.get("key")
+        conn.executed.clear()
+
+        cache.close()
+
+        assert conn.executed[0][0].startswith("UPDATE cache_entries AS c")
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,298 @@
+"""
+Tests pour la coalescence des calculs (single-flight)
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from src.core.advanced_cache import AdvancedCache
+from src.core.cache import cache_result, cache_manager
+from src.core.cache_keys import function_namespace
+from src.core.single_flight import SingleFlight, AsyncSingleFlight
+
+
+class TestSingleFlight:
+    """Tests pour SingleFlight (threads)"""
+
+    def test_concurrent_calls_share_one_computation(self):
+        """Test un seul calcul pour des appels concurrents"""
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(2)
+            return "result"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+        leader.start()
+        started.wait(2)
+
+        followers = [
+            threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+            for _ in range(5)
+        ]
+        for thread in followers:
+            thread.start()
+        while flight.coalesced < 5:
+            time.sleep(0.01)
+        release.set()
+        for thread in [leader] + followers:
+            thread.join(2)
+
+        assert len(calls) == 1
+        assert results == ["result"] * 6
+        assert not flight.in_flight("k")
+
+    def test_error_is_propagated(self):
+        """Test propagation de l'erreur du calcul"""
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            flight.do("k", fail)
+        assert not flight.in_flight("k")
+
+
+class TestAsyncSingleFlight:
+    """Tests pour AsyncSingleFlight"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_awaits_share_one_call(self):
+        """Test une seule coroutine exécutée pour des appels concurrents"""
+        flight = AsyncSingleFlight()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return calls
+
+        results = await asyncio.gather(*[flight.do("k", compute) for _ in range(10)])
+
+        assert calls == 1
+        assert results == [1] * 10
+        assert flight.coalesced == 9
+        assert not flight.in_flight("k")
+
+    def test_calls_are_tracked_per_event_loop(self):
+        """Test instance partagée : pas d'attente d'un futur d'une autre boucle"""
+        flight = AsyncSingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        async def slow():
+            started.set()
+            while not release.is_set():
+                await asyncio.sleep(0.01)
+            return "slow"
+
+        async def fast():
+            return "fast"
+
+        other_loop = threading.Thread(target=lambda: asyncio.run(flight.do("k", slow)))
+        other_loop.start()
+        assert started.wait(5)
+        try:
+            assert asyncio.run(flight.do("k", fast)) == "fast"
+            assert asyncio.run(flight.do("k", fast)) == "fast"
+        finally:
+            release.set()
+            other_loop.join(5)
+
+        assert flight.coalesced == 0
+
+
+class TestAdvancedCacheFallback:
+    """Tests pour AdvancedCache.get_with_fallback"""
+
+    def setup_method(self):
+        """Setup avant chaque test"""
+        self.cache = AdvancedCache()
+
+    def test_thundering_herd_is_coalesced(self):
+        """Test un seul fallback pour des lectures concurrentes d'une clé absente"""
+        calls = []
+
+        def expensive():
+            calls.append(1)
+            time.sleep(0.2)
+            return {"veille": "data"}
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(self.cache.get_with_fallback("hot", expensive))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(2)
+
+        assert len(calls) == 1
+        assert results == [{"veille": "data"}] * 8
+
+    def test_stale_value_served_while_refreshing(self):
+        """Test valeur périmée servie pendant le rafraîchissement en arrière-plan"""
+        cache = AdvancedCache(default_ttl=60, stale_ttl=60)
+        versions = iter(["v1", "v2"])
+        refreshed = threading.Event()
+
+        def compute():
+            value = next(versions)
+            if value == "v2":
+                refreshed.set()
+            return value
+
+        assert cache.get_with_fallback("report", compute) == "v1"
+
+        # Simuler le dépassement de la fenêtre de fraîcheur
+        with patch("src.core.advanced_cache_orchestrator.time.time", return_value=time.time() + 120):
+            assert cache.get_with_fallback("report", compute) == "v1"
+            assert refreshed.wait(2)
+
+        for _ in range(100):
+            if cache.get("report") == "v2":
+                break
+            time.sleep(0.01)
+        assert cache.get("report") == "v2"
+        assert cache.get_stats()['single_flight']['background_refreshes'] == 1
+
+    def test_early_refresh_before_expiry(self):
+        """Test XFetch : recalcul en arrière-plan avant l'échéance, valeur servie"""
+        cache = AdvancedCache(default_ttl=3600, early_refresh_beta=1.0)
+        refreshed = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            if len(calls) == 2:
+                refreshed.set()
+            return len(calls)
+
+        assert cache.get_with_fallback("report", compute) == 1
+        assert cache.memory_cache.get_metadata("report")["compute_time"] >= 0
+
+        with patch.object(cache.memory_cache, 'should_refresh_early', return_value=True):
+            assert cache.get_with_fallback("report", compute) == 1
+            assert refreshed.wait(2)
+
+        assert cache.get_stats()['single_flight']['early_refreshes'] == 1
+
+    def test_early_refresh_disabled_by_default(self):
+        """Test pas de rafraîchissement anticipé sans early_refresh_beta"""
+        cache = AdvancedCache(default_ttl=3600)
+        cache.get_with_fallback("report", lambda: 1)
+
+        with patch.object(cache.memory_cache, 'should_refresh_early', return_value=True) as check:
+            cache.get_with_fallback("report", lambda: 2)
+
+        check.assert_not_called()
+
+
+class TestCacheResultCoalescing:
+    """Tests pour le décorateur cache_result"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_call_once(self):
+        """Test un seul appel pour des misses concurrents"""
+        calls = 0
+
+        @cache_result(ttl=60)
+        async def collect(brand):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return f"data_{brand}"
+
+        results = await asyncio.gather(*[collect("nike") for _ in range(10)])
+
+        assert calls == 1
+        assert results == ["data_nike"] * 10
+        await cache_manager.clear()
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self):
+        """Test résultat périmé servi puis rafraîchi en arrière-plan"""
+        calls = 0
+
+        @cache_result(ttl=60, stale_ttl=60)
+        async def collect(brand):
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await collect("nike") == 1
+
+        with patch("src.core.cache.time.time", return_value=time.time() + 120):
+            assert await collect("nike") == 1
+            await asyncio.sleep(0.01)
+
+        assert calls == 2
+        assert await collect("nike") == 2
+        await cache_manager.clear()
+
+    @pytest.mark.asyncio
+    async def test_stale_ttl_tolerates_plain_cached_value(self):
+        """Test valeur en cache sans enveloppe de fraîcheur : recalculée"""
+        calls = 0
+
+        @cache_result(ttl=60)
+        async def plain(brand):
+            nonlocal calls
+            calls += 1
+            return {"brand": brand}
+
+        @cache_result(ttl=60, stale_ttl=60, namespace=function_namespace(plain))
+        async def with_stale(brand):
+            nonlocal calls
+            calls += 1
+            return {"brand": brand}
+
+        assert await plain("nike") == {"brand": "nike"}
+        assert await with_stale("nike") == {"brand": "nike"}
+        assert calls == 2
+        assert await with_stale("nike") == {"brand": "nike"}
+        assert calls == 2
+        await cache_manager.clear()
+
+    @pytest.mark.asyncio
+    async def test_result_shaped_like_envelope_is_not_unwrapped(self):
+        """Test résultat avec les clés value/fresh_until : pris pour une valeur, pas une enveloppe"""
+        calls = 0
+        lookalike = {"value": 42, "fresh_until": time.time() + 3600}
+
+        @cache_result(ttl=60)
+        async def plain(brand):
+            nonlocal calls
+            calls += 1
+            return lookalike
+
+        @cache_result(ttl=60, stale_ttl=60, namespace=function_namespace(plain))
+        async def with_stale(brand):
+            nonlocal calls
+            calls += 1
+            return lookalike
+
+        assert await plain("nike") == lookalike
+        assert await with_stale("nike") == lookalike
+        assert calls == 2
+        assert await with_stale("nike") == lookalike
+        assert calls == 2
+        await cache_manager.clear()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
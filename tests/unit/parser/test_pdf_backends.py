@@ -0,0 +1,229 @@
+"""
+Tests du registre de backends PDF et du routage par document
+"""
+
+import json
+from contextlib import contextmanager
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.bot.parser import pdf_backends, pdf_text_extractor
+from src.bot.parser.pdf_backends import DEFAULT_ROUTING, PDFBackend, PDFProbe, load_routing, route
+from src.bot.parser.pdf_section_extractor import PDFSectionExtractor
+from src.bot.parser.pdf_text_extractor import PDFTextExtractor
+
+
+class FakeBackend(PDFBackend):
+    """Backend factice : pages fixes, échec ou texte vide à la demande"""
+
+    def __init__(self, name, pages=("Objectives", "Budget"), error=None):
+        self.name = name
+        self.pages = list(pages)
+        self.error = error
+        self.released = 0
+
+    @property
+    def available(self):
+        return True
+
+    @contextmanager
+    def open_pages(self, pdf_path):
+        if self.error:
+            raise self.error
+        yield [Mock(extract_text=Mock(return_value=text)) for text in self.pages]
+
+    def release_page(self, page):
+        self.released += 1
+
+
+class TestPDFBackendRouting:
+    """Tests pour la sonde, la table de routage et le registre"""
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_probe_profiles(self):
+        """Test profil : chiffré, scanné (aucune page texte), texte ou mise en page"""
+        assert PDFProbe(encrypted=True, sampled_pages=3, text_pages=3).profile() == 'encrypted'
+        assert PDFProbe(sampled_pages=3, image_only_pages=3).profile() == 'scanned'
+        assert PDFProbe(sampled_pages=3, text_pages=1).profile() == 'text'
+        assert PDFProbe(sampled_pages=3, text_pages=1).profile(layout=True) == 'layout'
+        # Sonde impossible : profil texte par défaut
+        assert PDFProbe().profile() == 'text'
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_route_keeps_available_backends_in_table_order(self):
+        """Test route filtrée sur les backends installés, les autres en dernier recours"""
+        routing = {'text': ['pypdfium2', 'pypdf', 'pdfplumber'], 'scanned': ['pdfplumber']}
+
+        with patch.multiple(pdf_backends, PDFPLUMBER_AVAILABLE=True, PYPDF_AVAILABLE=True,
+                            PYPDFIUM2_AVAILABLE=False):
+            assert route(PDFProbe(), routing) == ['pypdf', 'pdfplumber']
+            assert route(PDFProbe(sampled_pages=1), routing) == ['pdfplumber', 'pypdf']
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_sample_indexes(self):
+        """Test pages sondées réparties du début à la fin"""
+        assert pdf_backends._sample_indexes(40, 3) == [0, 20, 39]
+        assert pdf_backends._sample_indexes(2, 3) == [0, 1]
+        assert pdf_backends._sample_indexes(0, 3) == []
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_load_routing_overrides(self, tmp_path):
+        """Test table du benchmark fusionnée avec la table par défaut, fichier invalide ignoré"""
+        path = tmp_path / "routing.json"
+        path.write_text(json.dumps({'text': ['pypdf']}), encoding='utf-8')
+
+        routing = load_routing(str(path))
+        assert routing['text'] == ['pypdf']
+        assert routing['scanned'] == pdf_backends.DEFAULT_ROUTING['scanned']
+        assert load_routing(str(tmp_path / "missing.json")) == pdf_backends.DEFAULT_ROUTING
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_probe_changes_route(self):
+        """Test sonde utile seulement si les profils possibles ont des routes différentes"""
+        routing = pdf_backends.DEFAULT_ROUTING
+
+        assert not pdf_backends.probe_changes_route(routing)
+        assert pdf_backends.probe_changes_route(routing, layout=True)
+        assert pdf_backends.probe_changes_route({'text': ['pypdf'], 'scanned': ['pypdfium2']})
+
+
+class TestPDFTextExtractorBackends:
+    """Tests de l'extraction routée par PDFTextExtractor"""
+
+    def extractor(self, *backends, probe=None, routing=None):
+        extractor = PDFTextExtractor(routing=routing or {'text': [backend.name for backend in backends]})
+        extractor.validator.validate_file = Mock(return_value={'is_valid': True, 'errors': []})
+        probe = probe or PDFProbe(page_count=2, sampled_pages=2, text_pages=2)
+        patch.object(pdf_text_extractor, 'probe_pdf', return_value=probe).start()
+        patch.dict(pdf_backends.BACKENDS, {backend.name: backend for backend in backends}, clear=True).start()
+        return extractor
+
+    @pytest.fixture(autouse=True)
+    def stop_patches(self):
+        yield
+        patch.stopall()
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_result_records_backend_and_timing(self):
+        """Test backend utilisé, durée et statistiques par backend"""
+        fast = FakeBackend('fast')
+        extractor = self.extractor(fast, FakeBackend('slow'),
+                                   routing={'text': ['fast', 'slow'], 'scanned': ['slow']})
+
+        result = extractor.extract_text("brief.pdf")
+
+        assert result['extraction_success']
+        assert result['extraction_method'] == 'fast'
+        assert result['backend_time'] >= 0
+        assert result['probe']['text_pages'] == 2
+        assert result['text'] == "Objectives\n\nBudget"
+        assert fast.released == 2
+        assert extractor.get_extraction_stats()['backends']['fast']['documents'] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_probe_deferred_when_routes_are_identical(self):
+        """Test même route pour tous les profils : sonde seulement si le texte est vide"""
+        extractor = self.extractor(FakeBackend('fast'), FakeBackend('slow'))
+
+        result = extractor.extract_text("brief.pdf")
+
+        pdf_text_extractor.probe_pdf.assert_not_called()
+        assert result['probe'] is None
+        assert result['extraction_method'] == 'fast'
+
+        pdf_backends.BACKENDS['fast'].pages = ["", ""]
+        result = extractor.extract_text("brief.pdf")
+
+        pdf_text_extractor.probe_pdf.assert_called_once()
+        assert result['probe']['text_pages'] == 2
+        assert result['extraction_method'] == 'slow'
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_failing_backend_falls_through(self):
+        """Test échec du backend préféré : le suivant prend le relais"""
+        extractor = self.extractor(FakeBackend('fast', error=OSError("corrupt xref")), FakeBackend('slow'))
+
+        result = extractor.extract_text("brief.pdf")
+
+        assert result['extraction_method'] == 'slow'
+        assert result['backend_failures'] == {'fast': "corrupt xref"}
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_empty_text_despite_text_layer_falls_through(self):
+        """Test texte vide alors que la sonde voit une couche texte : backend suivant"""
+        extractor = self.extractor(FakeBackend('fast', pages=("", "")), FakeBackend('slow'))
+
+        assert extractor.extract_text("brief.pdf")['extraction_method'] == 'slow'
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_scanned_document_flagged_for_ocr(self):
+        """Test document scanné : pas de second essai, besoin d'OCR signalé"""
+        empty = FakeBackend('fast', pages=("", ""))
+        extractor = self.extractor(empty, FakeBackend('slow'),
+                                   probe=PDFProbe(page_count=2, sampled_pages=2, image_only_pages=2),
+                                   routing={'scanned': ['fast', 'slow']})
+
+        result = extractor.extract_text("scan.pdf")
+
+        assert result['extraction_method'] == 'fast'
+        assert result['needs_ocr'] is True
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_no_backend_available(self):
+        """Test aucune bibliothèque installée"""
+        extractor = self.extractor()
+
+        result = extractor.extract_text("brief.pdf")
+
+        assert not result['extraction_success']
+        assert result['error'] == 'No PDF library available'
+
+
+class TestPypdfium2Sections:
+    """Tests de non-régression : sections extraites du texte de pypdfium2 (backend par défaut)"""
+
+    BRIEF = [
+        "Objectives",
+        "Increase brand awareness among young adults by 20 percent.",
+        "Target audience",
+        "Urban professionals aged 25 to 35 interested in design.",
+        "Budget",
+        "Total budget of 50 000 euros for the whole campaign.",
+        "Timeline",
+        "Launch in week 12, final deadline at the end of the month.",
+    ]
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_sections_from_pypdfium2_text(self, tmp_path):
+        """Test sections d'un brief reconnues sur le texte extrait par PDFium"""
+        fpdf = pytest.importorskip("fpdf")
+        pytest.importorskip("pypdfium2")
+        assert DEFAULT_ROUTING['text'][0] == 'pypdfium2'
+
+        pdf = fpdf.FPDF()
+        pdf.add_page()
+        pdf.set_font('Helvetica', size=11)
+        for line in self.BRIEF:
+            pdf.cell(0, 8, line, new_x='LMARGIN', new_y='NEXT')
+        path = tmp_path / "brief.pdf"
+        pdf.output(str(path))
+
+        text_result = PDFTextExtractor().extract_text(str(path))
+        assert text_result['extraction_method'] == 'pypdfium2'
+
+        sections = PDFSectionExtractor().extract_brief_sections(text_result['text'])['sections']
+        assert {'objectives', 'target_audience', 'budget', 'timeline'} <= set(sections)
+        assert '50 000 euros' in sections['budget']
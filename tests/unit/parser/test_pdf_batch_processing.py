@@ -0,0 +1,157 @@
+"""
+Tests du traitement par lot concurrent des PDF
+"""
+
+import os
+import signal
+import time
+
+import pytest
+from unittest.mock import patch
+
+from src.bot.parser import pdf_processor
+from src.bot.parser.pdf_extraction_cache import PDFExtractionCache
+from src.bot.parser.pdf_processor import PDFProcessor
+from src.core.memory_cache import MemoryCache
+
+
+def fake_process_pdf(self, pdf_path, extract_sections=True, output_dir=None):
+    """process_pdf factice : le nom du fichier choisit le comportement"""
+    name = os.path.basename(pdf_path)
+    if name.startswith("slow"):
+        while True:
+            time.sleep(0.01)
+    if name.startswith("stuck"):
+        # Code natif bloqué : SIGALRM ne peut pas l'interrompre
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})
+        while True:
+            time.sleep(0.01)
+    if name.startswith("crash"):
+        os._exit(1)
+    if name.startswith("bad"):
+        return {'processing_success': False, 'pdf_path': pdf_path, 'error': 'PDF validation failed'}
+    return {'processing_success': True, 'pdf_path': pdf_path, 'pid': os.getpid()}
+
+
+def fake_extracting_process_pdf(self, pdf_path, extract_sections=True, output_dir=None):
+    """process_pdf factice qui rend un texte et des sections extraits"""
+    return {
+        'processing_success': True,
+        'pdf_path': pdf_path,
+        'pid': os.getpid(),
+        'cache_enabled': self.extraction_cache.enabled,
+        'text_extraction': {'text': str(pdf_path), 'extraction_success': True},
+        'sections_extraction': {'sections': {}, 'extraction_metadata': {}}
+    }
+
+
+class TestPDFBatchProcessing:
+    """Tests pour iter_pdf_batch / process_pdf_batch"""
+
+    @pytest.fixture(autouse=True)
+    def fake_processing(self):
+        with patch.object(PDFProcessor, 'process_pdf', fake_process_pdf):
+            yield
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_results_stream_with_progress(self):
+        """Test résultats produits au fil de l'eau avec progression"""
+        progress = []
+        paths = [f"brief_{i}.pdf" for i in range(12)] + ["bad.pdf"]
+
+        items = PDFProcessor().iter_pdf_batch(
+            paths, max_workers=3, max_in_flight=4,
+            progress_callback=lambda done, total, item: progress.append((done, total))
+        )
+        first = next(items)
+        assert first['path'] in paths
+        rest = list(items)
+
+        assert sorted(item['path'] for item in [first] + rest) == sorted(paths)
+        assert progress[-1] == (13, 13)
+        assert len({item['result']['pid'] for item in [first] + rest if item['success']}) > 1
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_poison_pdfs_do_not_stall_batch(self):
+        """Test fichier bloquant interrompu, fichier qui tue son worker écarté"""
+        paths = ["slow.pdf", "crash.pdf"] + [f"brief_{i}.pdf" for i in range(6)]
+
+        result = PDFProcessor().process_pdf_batch(paths, max_workers=2, timeout=0.5)
+
+        failed = {entry['path']: entry['error'] for entry in result['failed_files']}
+        assert set(failed) == {"slow.pdf", "crash.pdf"}
+        assert "timed out" in failed["slow.pdf"]
+        assert len(result['processed_files']) == 6
+        assert result['success_rate'] == 75.0
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_stuck_worker_stopped_by_parent(self):
+        """Test fichier insensible à SIGALRM : pool arrêté à l'échéance, autres fichiers rejoués"""
+        paths = ["stuck.pdf"] + [f"brief_{i}.pdf" for i in range(4)] + ["crash.pdf", "brief_4.pdf"]
+
+        with patch.object(pdf_processor, 'BATCH_WATCHDOG_GRACE', 0.2):
+            result = PDFProcessor().process_pdf_batch(paths, max_workers=2, timeout=0.2)
+
+        failed = {entry['path']: entry['error'] for entry in result['failed_files']}
+        assert set(failed) == {"stuck.pdf", "crash.pdf"}
+        assert "worker stopped" in failed["stuck.pdf"]
+        assert sorted(result['processed_files']) == [f"brief_{i}.pdf" for i in range(5)]
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_pool_recycled_and_iterables_accepted(self):
+        """Test recyclage du pool et chemins fournis par un générateur"""
+        paths = (f"brief_{i}.pdf" for i in range(9))
+
+        with patch.object(pdf_processor, 'BATCH_TASKS_PER_WORKER', 2):
+            items = list(PDFProcessor().iter_pdf_batch(paths, max_workers=2))
+
+        assert len(items) == 9 and all(item['success'] for item in items)
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_sequential_mode_by_default(self):
+        """Test process_pdf_batch séquentiel par défaut, dans ce processus"""
+        result = PDFProcessor().process_pdf_batch(["a.pdf", "bad.pdf"])
+
+        assert result['processed_files'] == ["a.pdf"]
+        assert result['failed_files'] == [{'path': "bad.pdf", 'error': 'PDF validation failed'}]
+
+
+class TestPDFBatchExtractionCache:
+    """Tests du cache d'extraction lors d'un lot parallèle"""
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_worker_has_no_cache(self):
+        """Test processeur des workers sans cache d'extraction"""
+        try:
+            pdf_processor._init_batch_worker()
+            assert pdf_processor._batch_processor.extraction_cache.enabled is False
+        finally:
+            pdf_processor._batch_processor = None
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_parent_stores_and_serves_extractions(self, tmp_path):
+        """Test extractions des workers stockées par le parent, puis servies sans le pool"""
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"brief_{i}.pdf"
+            path.write_bytes(f"%PDF-1.4 brief {i}".encode())
+            paths.append(str(path))
+        cache = PDFExtractionCache(cache=MemoryCache(max_size=100), enabled=True)
+        processor = PDFProcessor(extraction_cache=cache)
+
+        with patch.object(PDFProcessor, 'process_pdf', fake_extracting_process_pdf):
+            first = list(processor.iter_pdf_batch(paths, max_workers=2))
+            second = list(processor.iter_pdf_batch(paths, max_workers=2))
+
+        assert all(item['result']['pid'] != os.getpid() for item in first)
+        assert all(item['result']['cache_enabled'] is False for item in first)
+        assert all(item['result']['content_hash'] for item in first)
+        assert sorted(item['path'] for item in second) == sorted(paths)
+        assert all(item['result']['pid'] == os.getpid() for item in second)
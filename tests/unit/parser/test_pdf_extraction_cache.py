@@ -0,0 +1,103 @@
+"""
+Tests du cache d'extraction PDF indexé par contenu
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.bot.parser import pdf_processor
+from src.bot.parser.pdf_extraction_cache import PDFExtractionCache, content_digest
+from src.bot.parser.pdf_processor import PDFProcessor
+from src.core.memory_cache import MemoryCache
+
+
+def text_result(text):
+    """Résultat d'extraction de texte factice"""
+    return {'text': text, 'pages': [text], 'total_pages': 1, 'text_length': len(text),
+            'extraction_method': 'pdfplumber', 'extraction_success': True}
+
+
+class TestPDFExtractionCache:
+    """Tests pour PDFExtractionCache et son utilisation par PDFProcessor"""
+
+    @pytest.fixture
+    def processor(self):
+        processor = PDFProcessor(extraction_cache=PDFExtractionCache(MemoryCache()))
+        processor.validator.validate_file = Mock(return_value={'is_valid': True, 'errors': []})
+        processor.text_extractor.extract_text = Mock(return_value=text_result("Objectives: grow"))
+        processor.section_extractor.extract_brief_sections = Mock(
+            return_value={'sections': {'objectives': 'grow'}, 'extraction_metadata': {'sections_found': 1}}
+        )
+        return processor
+
+    def write_pdf(self, path, content=b"%PDF-1.4 brief %%EOF"):
+        path.write_bytes(content)
+        return str(path)
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_reupload_served_from_cache(self, processor, tmp_path):
+        """Test même contenu sous un autre nom : ni texte ni sections recalculés"""
+        first = processor.process_pdf(self.write_pdf(tmp_path / "slack.pdf"))
+        second = processor.process_pdf(self.write_pdf(tmp_path / "cli_copy.pdf"))
+
+        assert first['cache_hits'] == []
+        assert second['cache_hits'] == ['text_extraction', 'sections_extraction']
+        assert second['sections_extraction'] == first['sections_extraction']
+        assert second['content_hash'] == content_digest(str(tmp_path / "slack.pdf"))
+        processor.text_extractor.extract_text.assert_called_once()
+        processor.section_extractor.extract_brief_sections.assert_called_once()
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_different_content_misses(self, processor, tmp_path):
+        """Test contenu différent : nouvelle extraction"""
+        processor.process_pdf(self.write_pdf(tmp_path / "a.pdf", b"%PDF-1.4 a"))
+        processor.process_pdf(self.write_pdf(tmp_path / "b.pdf", b"%PDF-1.4 b"))
+
+        assert processor.text_extractor.extract_text.call_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_version_bump_invalidates(self, processor, tmp_path):
+        """Test version des patterns incrémentée : texte repris, sections recalculées"""
+        path = self.write_pdf(tmp_path / "brief.pdf")
+        processor.process_pdf(path)
+
+        with patch.object(pdf_processor, 'PATTERNS_VERSION', pdf_processor.PATTERNS_VERSION + 1):
+            result = processor.process_pdf(path)
+        assert result['cache_hits'] == ['text_extraction']
+
+        with patch.object(pdf_processor, 'EXTRACTOR_VERSION', pdf_processor.EXTRACTOR_VERSION + 1):
+            result = processor.process_pdf(path)
+        assert result['cache_hits'] == []
+        assert processor.text_extractor.extract_text.call_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_failures_not_cached(self, processor, tmp_path):
+        """Test une extraction en échec n'est pas mise en cache"""
+        processor.text_extractor.extract_text.return_value = {'extraction_success': False}
+        path = self.write_pdf(tmp_path / "broken.pdf")
+
+        processor.process_pdf(path)
+        processor.process_pdf(path)
+
+        assert processor.text_extractor.extract_text.call_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_cache_errors_and_disabled_cache(self, processor, tmp_path):
+        """Test cache en panne ou désactivé : extraction normale"""
+        path = self.write_pdf(tmp_path / "brief.pdf")
+        broken = Mock(get=Mock(side_effect=ConnectionError("L2 down")),
+                      set=Mock(side_effect=ConnectionError("L2 down")))
+        processor.extraction_cache = PDFExtractionCache(broken)
+
+        assert processor.process_pdf(path)['processing_success']
+        assert processor.extraction_cache.get_stats()['errors'] == 4
+
+        processor.extraction_cache = PDFExtractionCache(broken, enabled=False)
+        result = processor.process_pdf(path)
+        assert result['processing_success'] and result['content_hash'] is None
+        assert broken.get.call_count == 2
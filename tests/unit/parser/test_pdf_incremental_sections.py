@@ -0,0 +1,194 @@
+"""
+Tests de l'extraction incrémentale des sections (arrêt anticipé, budget de pages)
+"""
+
+from contextlib import contextmanager
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.bot.parser import pdf_backends, pdf_text_extractor
+from src.bot.parser.pdf_backends import PDFBackend, PDFProbe
+from src.bot.parser.pdf_extraction_cache import PDFExtractionCache
+from src.bot.parser.pdf_processor import PDFProcessor
+from src.bot.parser.pdf_section_extractor import PDFSectionExtractor
+from src.core.memory_cache import MemoryCache
+
+
+# Lignes de contenu longues : au-delà de 100 caractères, jamais prises pour un en-tête
+OBJECTIVES_TEXT = (
+    "Our first goal is to grow awareness of the spring range among new customers in every region. "
+    "The aim is to double online sales. The second goal is to win back lapsed customers this year. "
+    "Each aim is measured against the previous spring. The final objective is a stronger brand preference."
+)
+
+BRIEF_PAGES = [
+    "Objectives\n" + OBJECTIVES_TEXT + "\nTarget audience\nYoung adults in large cities.",
+    "Budget\n50 000 € for media.\nTimeline\n3 months from March.\nDeliverables\nThree short videos.",
+    "Appendix A\n" + "Store list. " * 20,
+    "Appendix B\n" + "Store list. " * 20,
+]
+
+
+class PageFeed:
+    """Pages fournies à la demande, avec le nombre de pages demandées"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = 0
+
+    def __iter__(self):
+        for page in self.pages:
+            self.requested += 1
+            yield page
+
+
+class TestIncrementalSectionExtraction:
+    """Tests pour PDFSectionExtractor.extract_sections_incremental"""
+
+    def setup_method(self):
+        """Setup avant chaque test"""
+        self.extractor = PDFSectionExtractor()
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_stops_when_essential_sections_are_complete(self):
+        """Test arrêt dès que les quatre sections essentielles sont terminées"""
+        feed = PageFeed(BRIEF_PAGES)
+
+        result = self.extractor.extract_sections_incremental(feed)
+
+        assert feed.requested == 2
+        assert result['extraction_metadata']['pages_read'] == 2
+        assert result['extraction_metadata']['stop_reason'] == 'sections_complete'
+        assert result['analysis']['completeness_score'] == 100.0
+        # Sections suivantes non extraites, dernière section peut-être incomplète
+        assert result['extraction_metadata']['partial']
+        assert result['extraction_metadata']['truncated_section'] == 'deliverables'
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_same_sections_as_full_extraction_of_read_pages(self):
+        """Test sections et positions identiques à l'extraction complète du texte lu"""
+        result = self.extractor.extract_sections_incremental(BRIEF_PAGES)
+        full = self.extractor.extract_brief_sections('\n\n'.join(BRIEF_PAGES[:2]))
+
+        assert result['sections'] == full['sections']
+        assert result['section_spans'] == full['section_spans']
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_whole_document_matches_full_extraction(self):
+        """Test document lu jusqu'au bout (section manquante) : même résultat que l'extraction complète"""
+        pages = ["", "Objectives\n" + OBJECTIVES_TEXT, "Budget\n5 000 €.", "", "Objectives\nRevised goals."]
+
+        result = self.extractor.extract_sections_incremental(pages)
+        full = self.extractor.extract_brief_sections('\n\n'.join(pages))
+
+        assert result['extraction_metadata']['stop_reason'] == 'end_of_document'
+        assert not result['extraction_metadata']['partial']
+        assert result['extraction_metadata']['truncated_section'] is None
+        assert result['sections'] == full['sections']
+        assert result['section_spans'] == full['section_spans']
+        assert result['analysis']['missing_sections'] == ['target_audience', 'timeline']
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_page_budget(self):
+        """Test sections incomplètes : arrêt au budget de pages"""
+        feed = PageFeed(["Objectives\n" + OBJECTIVES_TEXT] + ["Appendix\n" + "Store list. " * 20] * 10)
+
+        result = self.extractor.extract_sections_incremental(feed, page_budget=3)
+
+        assert feed.requested == 3
+        assert result['extraction_metadata']['stop_reason'] == 'page_budget'
+        assert result['extraction_metadata']['truncated_section'] == 'objectives'
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_open_section_read_until_confident(self):
+        """Test section ouverte sans contenu : page suivante lue, arrêt quand elle est sûre"""
+        feed = PageFeed([
+            "Budget\n50 000 €.\nTimeline\n3 months.\nTarget audience\nYoung adults.\nObjectives",
+            OBJECTIVES_TEXT,
+            "Appendix\n" + "Store list. " * 20,
+        ])
+
+        result = self.extractor.extract_sections_incremental(feed)
+
+        assert feed.requested == 2
+        assert result['analysis']['quality_indicators']['objectives']['confidence'] >= 50
+        assert 'objectives' in result['analysis']['confident_sections']
+
+
+class TestPDFProcessorIncremental:
+    """Tests du mode incrémental de PDFProcessor"""
+
+    @pytest.fixture
+    def backend(self):
+        pages = [Mock(extract_text=Mock(return_value=text)) for text in BRIEF_PAGES]
+
+        class ListBackend(PDFBackend):
+            name = 'list'
+            available = True
+
+            @contextmanager
+            def open_pages(self, pdf_path):
+                yield pages
+
+        with patch.dict(pdf_backends.BACKENDS, {'list': ListBackend()}, clear=True), \
+                patch.object(pdf_text_extractor, 'probe_pdf', return_value=PDFProbe()):
+            yield pages
+
+    @pytest.fixture
+    def processor(self):
+        processor = PDFProcessor(extraction_cache=PDFExtractionCache(MemoryCache()))
+        processor.validator.validate_file = Mock(return_value={'is_valid': True, 'errors': []})
+        processor.text_extractor.validator.validate_file = processor.validator.validate_file
+        processor.text_extractor.routing = {'text': ['list']}
+        return processor
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_skipped_pages_not_extracted(self, processor, backend):
+        """Test pages restantes ni extraites ni analysées, et listées dans le résultat"""
+        result = processor.process_pdf("long_brief.pdf", incremental=True)
+
+        assert result['processing_success']
+        text_result = result['text_extraction']
+        assert text_result['total_pages'] == 2
+        assert text_result['document_pages'] == 4
+        assert text_result['skipped_pages'] == [2, 3]
+        assert text_result['text'] == '\n\n'.join(BRIEF_PAGES[:2])
+        assert [page.extract_text.called for page in backend] == [True, True, False, False]
+        assert result['metadata']['sections_found'] == 5
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_incremental_result_cached(self, processor, backend, tmp_path):
+        """Test extraction incrémentale reprise du cache pour le même contenu et le même budget"""
+        path = tmp_path / "long_brief.pdf"
+        path.write_bytes(b"%PDF-1.4 long brief %%EOF")
+
+        first = processor.process_pdf(str(path), incremental=True)
+        second = processor.process_pdf(str(path), incremental=True)
+        other_budget = processor.process_pdf(str(path), incremental=True, page_budget=1)
+
+        assert second['cache_hits'] == ['incremental_extraction']
+        assert second['sections_extraction'] == first['sections_extraction']
+        assert other_budget['cache_hits'] == []
+        assert other_budget['sections_extraction']['extraction_metadata']['stop_reason'] == 'page_budget'
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_incremental_failure(self, processor, backend):
+        """Test document illisible : extraction en échec"""
+        processor.text_extractor.validator.validate_file = Mock(
+            return_value={'is_valid': False, 'errors': ['Invalid PDF content']}
+        )
+
+        result = processor.process_pdf("broken.pdf", incremental=True)
+
+        assert not result['processing_success']
+        assert result['error'] == 'Text extraction failed'
+        assert 'Invalid PDF content' in result['text_extraction']['error']
@@ -0,0 +1,88 @@
+"""
+Tests de la détection de sections en une passe
+"""
+
+import pytest
+
+from src.bot.parser.pdf_section_extractor import PDFSectionExtractor
+
+
+BRIEF = """Campagne printemps
+  Objectives  \t of the campaign
+Grow awareness by 20%.
+Reach new customers.
+
+Budget
+50 000 € for media.
+Timeline : 3 months"""
+
+
+class TestPDFSectionSpans:
+    """Tests pour find_section_spans et extract_brief_sections"""
+
+    def setup_method(self):
+        """Setup avant chaque test"""
+        self.extractor = PDFSectionExtractor()
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_spans_are_offsets_into_original_text(self):
+        """Test positions dans le texte d'origine, de l'en-tête à la dernière ligne non vide"""
+        spans = self.extractor.find_section_spans(BRIEF)
+
+        assert list(spans) == ['objectives', 'budget', 'timeline']
+        start, end = spans['objectives']
+        assert BRIEF[start:end] == "Objectives  \t of the campaign\nGrow awareness by 20%.\nReach new customers."
+        assert BRIEF[slice(*spans['budget'])] == "Budget\n50 000 € for media."
+        assert spans['timeline'][1] == len(BRIEF)
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_sections_cleaned_from_spans(self):
+        """Test sections nettoyées, positions exposées dans le résultat"""
+        result = self.extractor.extract_brief_sections(BRIEF)
+
+        assert result['sections']['objectives'].startswith("Objectives of the campaign\nGrow")
+        assert result['section_spans'] == self.extractor.find_section_spans(BRIEF)
+        assert result['analysis']['completeness_score'] == 75.0
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_header_classification(self):
+        """Test premier pattern déclaré prioritaire, lignes longues et texte avant le premier en-tête"""
+        long_line = "Budget" + " detail" * 20
+        text = f"Preamble without header\nAudience objectives\nyoung adults\n{long_line}"
+
+        spans = self.extractor.find_section_spans(text)
+
+        assert list(spans) == ['objectives']
+        assert text[slice(*spans['objectives'])].endswith(long_line)
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_header_precedence_matches_pattern_order(self):
+        """Test même section que les patterns testés un à un dans leur ordre"""
+        lines = ["Audience objectives", "Target audience", "Public cible et budget",
+                 "Planning des livrables", "Contact client", "Résultats et KPIs"]
+
+        for line in lines:
+            expected = next(name for name, pattern in self.extractor.section_patterns.items()
+                            if pattern.search(line))
+            assert list(self.extractor.find_section_spans(line)) == [expected], line
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_header_length_counts_collapsed_spaces(self):
+        """Test longueur d'en-tête mesurée après réduction des espaces multiples"""
+        padded = "Budget" + " " * 120 + "2025"
+
+        assert list(self.extractor.find_section_spans(padded)) == ['budget']
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_section_quality_keywords(self):
+        """Test score de contenu : mots-clés distincts, insensible à la casse"""
+        quality = self.extractor._assess_section_quality('budget', "BUDGET: 5000 € or 5000 €. Budget is firm.")
+
+        assert quality['content_score'] == 50
+        assert quality['clarity_score'] == 20
@@ -0,0 +1,159 @@
+"""
+Tests du traitement des PDF en mémoire (bytes, bytearray, memoryview, mmap)
+"""
+
+import io
+import mmap
+from contextlib import contextmanager
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.bot.parser import pdf_backends, pdf_text_extractor
+from src.bot.parser.pdf_backends import PDFBackend, PDFProbe
+from src.bot.parser.pdf_extraction_cache import PDFExtractionCache, content_digest
+from src.bot.parser.pdf_processor import PDFProcessor
+from src.bot.parser.pdf_source import MAX_STREAM_SIZE, BufferStream, read_pdf_stream, source_name
+from src.bot.parser.pdf_validator import PDFValidator
+from src.core.memory_cache import MemoryCache
+
+
+PDF_BYTES = b"%PDF-1.4\n" + b"0" * 2048 + b"\n%%EOF\n"
+
+
+class RecordingBackend(PDFBackend):
+    """Backend factice qui retient les sources ouvertes"""
+
+    name = 'recording'
+
+    def __init__(self):
+        self.sources = []
+
+    @property
+    def available(self):
+        return True
+
+    @contextmanager
+    def open_pages(self, pdf_path):
+        self.sources.append(pdf_path)
+        yield [Mock(extract_text=Mock(return_value="Objectives: grow"))]
+
+
+class TestBufferStream:
+    """Tests pour BufferStream et read_pdf_stream"""
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_read_seek_and_readinto(self):
+        """Test lecture, positionnement et lecture dans un buffer fourni"""
+        stream = BufferStream(bytearray(b"%PDF-body-%%EOF"))
+
+        assert stream.read(5) == b"%PDF-"
+        assert stream.seek(-5, io.SEEK_END) == 10
+        assert stream.read() == b"%%EOF"
+        assert stream.read(3) == b""
+
+        stream.seek(1)
+        target = bytearray(3)
+        assert stream.readinto(target) == 3
+        assert target == b"PDF"
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_close_releases_mmap(self, tmp_path):
+        """Test fermeture du flux : le mmap peut être fermé ensuite"""
+        path = tmp_path / "brief.pdf"
+        path.write_bytes(PDF_BYTES)
+
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            with BufferStream(data) as stream:
+                assert stream.read(8) == b"%PDF-1.4"
+            data.close()
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_read_pdf_stream(self):
+        """Test blocs assemblés dans un buffer, taille maximale respectée"""
+        assert read_pdf_stream([b"%PDF", b"-1.4"]) == bytearray(b"%PDF-1.4")
+
+        with pytest.raises(ValueError):
+            read_pdf_stream(iter([b"x" * 6, b"x" * 6]), max_size=10)
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_stream_limit_matches_validator(self):
+        """Test un téléchargement s'arrête à la taille que la validation accepte"""
+        assert MAX_STREAM_SIZE == PDFValidator().max_file_size
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_source_name(self, tmp_path):
+        """Test nom d'un chemin, nom par défaut d'un buffer"""
+        assert source_name(tmp_path / "brief.pdf") == str(tmp_path / "brief.pdf")
+        assert source_name(PDF_BYTES) == 'document.pdf'
+
+
+class TestPDFBufferPipeline:
+    """Tests de la validation et de l'extraction depuis un buffer"""
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_validate_buffer(self):
+        """Test buffers valides, trop petits ou sans marqueurs PDF"""
+        validator = PDFValidator()
+
+        result = validator.validate_file(memoryview(PDF_BYTES))
+        assert result['is_valid']
+        assert result['file_info']['size'] == len(PDF_BYTES)
+
+        assert validator.validate_file(b"%PDF-1.4 %%EOF")['errors'] == ['File too small: 14 bytes']
+        assert validator.validate_file(bytearray(b"0" * 2048))['errors'] == ['Invalid PDF content']
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_digest_matches_file(self, tmp_path):
+        """Test même empreinte pour le fichier et son contenu en mémoire"""
+        path = tmp_path / "brief.pdf"
+        path.write_bytes(PDF_BYTES)
+
+        assert content_digest(bytearray(PDF_BYTES)) == content_digest(str(path))
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_process_buffer_shares_one_source(self):
+        """Test validation, sonde et extraction sur le même buffer, sans fichier"""
+        backend = RecordingBackend()
+        processor = PDFProcessor(extraction_cache=PDFExtractionCache(MemoryCache()))
+        # Route propre aux documents scannés : la sonde est lancée avant l'extraction
+        processor.text_extractor.routing = {'text': ['recording'], 'scanned': ['ocr', 'recording']}
+        data = bytearray(PDF_BYTES)
+
+        with patch.dict(pdf_backends.BACKENDS, {'recording': backend}, clear=True), \
+                patch.object(pdf_text_extractor, 'probe_pdf', return_value=PDFProbe()) as probe:
+            result = processor.process_pdf(data, source_name="slack_upload.pdf")
+
+        assert result['processing_success']
+        assert result['pdf_path'] == "slack_upload.pdf"
+        assert result['validation']['is_valid']
+        assert result['text_extraction']['text'] == "Objectives: grow"
+        assert result['content_hash'] == content_digest(PDF_BYTES)
+        assert probe.call_args.args[0] is data
+        assert backend.sources == [data]
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_buffer_not_sent_to_worker_processes(self):
+        """Test document en mémoire : extraction pdfplumber dans ce processus"""
+        extractor = pdf_text_extractor.PDFTextExtractor(parallel_page_threshold=1)
+        pages = [Mock(extract_text=Mock(return_value=f"page {i}")) for i in range(3)]
+
+        @contextmanager
+        def open_pages(pdf_path):
+            yield pages
+
+        with patch.object(pdf_backends.BACKENDS['pdfplumber'], 'open_pages', open_pages), \
+                patch.object(extractor, '_extract_pages_parallel') as parallel:
+            result = extractor._extract_with_pdfplumber(PDF_BYTES)
+
+        parallel.assert_not_called()
+        assert result['pages'] == ["page 0", "page 1", "page 2"]
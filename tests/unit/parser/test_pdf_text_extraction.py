@@ -14,6 +14,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'sr
 
 from src.bot.parser import pdf_parser
 from src.bot.parser.pdf_parser import PdfParser
+from src.bot.parser import pdf_backends, pdf_text_extractor
+from src.bot.parser.pdf_text_extractor import PDFTextExtractor
 
 
 class TestPDFParserTextExtraction:
@@ -61,3 +63,153 @@ class TestPDFParserTextExtraction:
             
             with pytest.raises(Exception):
                 pdf_parser.extract_text_from_pdf("corrupted.pdf")
+
+
+class FakePage:
+    """Page pdfplumber factice"""
+
+    def __init__(self, text):
+        self.text = text
+        self.parsed = False
+
+    def extract_text(self):
+        self.parsed = True
+        if self.text == "ERROR":
+            raise ValueError("unreadable page")
+        return self.text
+
+
+class FakePDF:
+    """Document pdfplumber factice : une page par ligne du fichier"""
+
+    opened = []
+
+    def __init__(self, path):
+        FakePDF.opened.append(self)
+        with open(path, encoding='utf-8') as f:
+            self.pages = [FakePage(line.rstrip('\n').replace('\\n', '\n')) for line in f]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class TestPDFParallelTextExtraction:
+    """Tests pour l'extraction pdfplumber répartie sur plusieurs processus"""
+
+    @pytest.fixture
+    def brief_path(self, tmp_path):
+        path = tmp_path / "brief.txt"
+        pages = [f"  Page {i}\\nContexte  " if i % 5 else ("" if i % 2 else "ERROR") for i in range(60)]
+        path.write_text('\n'.join(pages) + '\n', encoding='utf-8')
+        return str(path)
+
+    @pytest.fixture(autouse=True)
+    def fake_pdfplumber(self):
+        with patch.object(pdf_backends, 'pdfplumber', Mock(open=FakePDF), create=True):
+            yield
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_parallel_output_identical_to_serial(self, brief_path):
+        """Test sortie identique au chemin séquentiel, pages dans l'ordre"""
+        serial = PDFTextExtractor(parallel_page_threshold=None)._extract_with_pdfplumber(brief_path)
+
+        extractor = PDFTextExtractor(max_workers=3, parallel_page_threshold=10)
+        parallel = extractor._extract_with_pdfplumber(brief_path)
+
+        assert parallel == serial
+        assert parallel['total_pages'] == 60
+        assert extractor.get_extraction_stats()['parallel_extractions'] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_small_documents_stay_serial(self, brief_path):
+        """Test sous le seuil, aucun pool de processus"""
+        extractor = PDFTextExtractor(max_workers=4, parallel_page_threshold=100)
+
+        with patch.object(pdf_text_extractor, 'ProcessPoolExecutor') as pool:
+            extractor._extract_with_pdfplumber(brief_path)
+
+        pool.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_pool_failure_falls_back_to_serial(self, brief_path):
+        """Test échec du pool : repli séquentiel"""
+        serial = PDFTextExtractor(parallel_page_threshold=None)._extract_with_pdfplumber(brief_path)
+        extractor = PDFTextExtractor(max_workers=2, parallel_page_threshold=10)
+
+        with patch.object(pdf_text_extractor, 'ProcessPoolExecutor', side_effect=OSError("no fork")):
+            assert extractor._extract_with_pdfplumber(brief_path) == serial
+
+    @pytest.mark.unit
+    def test_split_page_ranges(self):
+        """Test plages contiguës couvrant toutes les pages"""
+        assert pdf_text_extractor._split_page_ranges(10, 4) == [(0, 3), (3, 6), (6, 8), (8, 10)]
+        assert pdf_text_extractor._split_page_ranges(2, 8) == [(0, 1), (1, 2)]
+
+
+class TestPDFLazyPageExtraction:
+    """Tests pour iter_pages et extract_page_range (pages analysées à la demande)"""
+
+    @pytest.fixture
+    def extractor(self, tmp_path):
+        path = tmp_path / "deck.txt"
+        path.write_text('\n'.join(f"Slide {i}" for i in range(300)) + '\n', encoding='utf-8')
+        extractor = PDFTextExtractor()
+        extractor.path = str(path)
+        FakePDF.opened.clear()
+
+        valid = {'is_valid': True, 'errors': []}
+        with patch.object(pdf_backends, 'pdfplumber', Mock(open=FakePDF), create=True), \
+                patch.multiple(pdf_backends, PDFPLUMBER_AVAILABLE=True, PYPDF_AVAILABLE=False,
+                               PYPDFIUM2_AVAILABLE=False), \
+                patch.object(extractor.validator, 'validate_file', return_value=valid):
+            yield extractor
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_page_range_parses_only_requested_pages(self, extractor):
+        """Test seules les pages demandées sont analysées"""
+        result = extractor.extract_page_range(extractor.path, 1, 4)
+
+        assert result['pages'] == ["Slide 1", "Slide 2", "Slide 3"]
+        assert result['page_range'] == "1-3"
+        assert result['document_pages'] == 300
+        parsed = [page for page in FakePDF.opened[0].pages if page.parsed]
+        assert len(parsed) == 3
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_page_range_matches_full_extraction(self, extractor):
+        """Test résultat identique au découpage de l'extraction complète"""
+        full = extractor.extract_text(extractor.path)
+
+        for start, end in [(0, None), (290, None), (-3, None), (5, 2)]:
+            result = extractor.extract_page_range(extractor.path, start, end)
+            assert result['pages'] == full['pages'][start:end]
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_iter_pages_stops_early(self, extractor):
+        """Test arrêt anticipé : les pages suivantes ne sont jamais analysées"""
+        pages = extractor.iter_pages(extractor.path)
+        for text in pages:
+            if text == "Slide 2":
+                break
+        pages.close()
+
+        assert sum(page.parsed for page in FakePDF.opened[0].pages) == 3
+
+    @pytest.mark.unit
+    @pytest.mark.pdf
+    def test_invalid_file_reported(self, extractor):
+        """Test fichier invalide : erreur sans exception pour extract_page_range"""
+        extractor.validator.validate_file.return_value = {'is_valid': False, 'errors': ['File does not exist']}
+
+        assert extractor.extract_page_range("missing.pdf")['extraction_success'] is False
+        with pytest.raises(ValueError):
+            next(extractor.iter_pages("missing.pdf"))